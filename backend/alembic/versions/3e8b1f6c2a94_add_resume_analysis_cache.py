@@ -0,0 +1,41 @@
+"""Add resume analysis cache
+
+Revision ID: 3e8b1f6c2a94
+Revises: 7c1e5a9d3f26
+Create Date: 2026-10-18 18:41:15.306728
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3e8b1f6c2a94'
+down_revision: Union[str, None] = '7c1e5a9d3f26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('resume_analysis_cache',
+    sa.Column('key', sa.String(length=64), nullable=False),
+    sa.Column('prompt_version', sa.String(length=100), nullable=False),
+    sa.Column('result', sa.JSON(), nullable=False),
+    sa.Column('generation_ms', sa.Float(), nullable=False),
+    sa.Column('hits', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('last_used_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('key')
+    )
+    op.create_index(op.f('ix_resume_analysis_cache_created_at'), 'resume_analysis_cache', ['created_at'], unique=False)
+    op.create_index(op.f('ix_resume_analysis_cache_last_used_at'), 'resume_analysis_cache', ['last_used_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_resume_analysis_cache_last_used_at'), table_name='resume_analysis_cache')
+    op.drop_index(op.f('ix_resume_analysis_cache_created_at'), table_name='resume_analysis_cache')
+    op.drop_table('resume_analysis_cache')
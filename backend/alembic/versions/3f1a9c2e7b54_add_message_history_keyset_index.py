@@ -0,0 +1,28 @@
+"""Add message history keyset index
+
+Revision ID: 3f1a9c2e7b54
+Revises: 66bce964aa16
+Create Date: 2026-10-18 11:02:17.934120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1a9c2e7b54'
+down_revision: Union[str, None] = '66bce964aa16'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_messages_channel_created_id', 'messages', ['channel_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_messages_channel_created_id', table_name='messages')
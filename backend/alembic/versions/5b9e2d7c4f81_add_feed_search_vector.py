@@ -0,0 +1,56 @@
+"""Add feed search vector
+
+Revision ID: 5b9e2d7c4f81
+Revises: e7b3d94c0a15
+Create Date: 2026-10-18 16:03:29.415870
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b9e2d7c4f81'
+down_revision: Union[str, None] = 'e7b3d94c0a15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('campus_feeds', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+    op.execute("""
+        CREATE OR REPLACE FUNCTION campus_feeds_search_vector_update() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            NEW.search_vector :=
+                setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A') ||
+                setweight(to_tsvector('english', coalesce(NEW.content, '')), 'B');
+            RETURN NEW;
+        END
+        $$
+    """)
+    # Only title/content updates fire it, so counter updates skip the re-parse
+    op.execute("""
+        CREATE TRIGGER campus_feeds_search_vector
+        BEFORE INSERT OR UPDATE OF title, content ON campus_feeds
+        FOR EACH ROW EXECUTE FUNCTION campus_feeds_search_vector_update()
+    """)
+
+    # Backfill existing posts; the trigger recomputes the vector
+    op.execute('UPDATE campus_feeds SET title = title')
+
+    op.create_index('ix_campus_feeds_search_vector', 'campus_feeds', ['search_vector'], unique=False, postgresql_using='gin')
+    op.create_index('ix_campus_feeds_tags', 'campus_feeds', ['tags'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_campus_feeds_tags', table_name='campus_feeds')
+    op.drop_index('ix_campus_feeds_search_vector', table_name='campus_feeds')
+    op.execute('DROP TRIGGER IF EXISTS campus_feeds_search_vector ON campus_feeds')
+    op.execute('DROP FUNCTION IF EXISTS campus_feeds_search_vector_update()')
+    op.drop_column('campus_feeds', 'search_vector')
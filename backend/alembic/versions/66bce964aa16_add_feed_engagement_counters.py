@@ -0,0 +1,47 @@
+"""Add feed engagement counters
+
+Revision ID: 66bce964aa16
+Revises: d75f11537a84
+Create Date: 2026-10-18 10:12:41.508213
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '66bce964aa16'
+down_revision: Union[str, None] = 'd75f11537a84'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('campus_feeds', sa.Column('likes_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('campus_feeds', sa.Column('comments_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('campus_feeds', sa.Column('shares_count', sa.Integer(), server_default='0', nullable=False))
+
+    # Backfill counters from the existing engagement rows
+    op.execute("""
+        UPDATE campus_feeds SET
+            likes_count = (SELECT COUNT(*) FROM feed_likes WHERE feed_likes.feed_id = campus_feeds.id),
+            comments_count = (SELECT COUNT(*) FROM feed_comments WHERE feed_comments.feed_id = campus_feeds.id),
+            shares_count = (SELECT COUNT(*) FROM feed_shares WHERE feed_shares.feed_id = campus_feeds.id)
+    """)
+
+    op.create_index(op.f('ix_campus_feeds_likes_count'), 'campus_feeds', ['likes_count'], unique=False)
+    op.create_index(op.f('ix_campus_feeds_comments_count'), 'campus_feeds', ['comments_count'], unique=False)
+    op.create_index(op.f('ix_campus_feeds_shares_count'), 'campus_feeds', ['shares_count'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_campus_feeds_shares_count'), table_name='campus_feeds')
+    op.drop_index(op.f('ix_campus_feeds_comments_count'), table_name='campus_feeds')
+    op.drop_index(op.f('ix_campus_feeds_likes_count'), table_name='campus_feeds')
+    op.drop_column('campus_feeds', 'shares_count')
+    op.drop_column('campus_feeds', 'comments_count')
+    op.drop_column('campus_feeds', 'likes_count')
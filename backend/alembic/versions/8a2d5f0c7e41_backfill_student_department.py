@@ -0,0 +1,38 @@
+"""Backfill student department from USN
+
+Revision ID: 8a2d5f0c7e41
+Revises: 3e8b1f6c2a94
+Create Date: 2026-10-18 21:07:42.518903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a2d5f0c7e41'
+down_revision: Union[str, None] = '3e8b1f6c2a94'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same format as USN_PATTERN in app/repository/user_repository.py; the group is the branch code
+USN_REGEX = '^[0-9][A-Z]{2}[0-9]{2}([A-Z]{2})[0-9]{3}$'
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Signup stores the branch code from the USN; existing students get it here.
+    # Professors have nothing to derive it from and set it on their profile.
+    op.execute(sa.text("""
+        UPDATE students
+        SET department = substring(upper(btrim(usn)) from :pattern)
+        WHERE department IS NULL AND upper(btrim(usn)) ~ :pattern
+    """).bindparams(pattern=USN_REGEX))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Backfilled values can't be told apart from ones users entered, so they stay
+    pass
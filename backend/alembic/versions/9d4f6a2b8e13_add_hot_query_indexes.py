@@ -0,0 +1,67 @@
+"""Add hot query indexes
+
+Revision ID: 9d4f6a2b8e13
+Revises: 5b9e2d7c4f81
+Create Date: 2026-10-18 17:21:06.582914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4f6a2b8e13'
+down_revision: Union[str, None] = '5b9e2d7c4f81'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Already covered, left alone:
+#   channel_members (channel_id, member_id)      -> _channel_member_uc
+#   messages (channel_id, created_at)            -> ix_messages_channel_created_id
+#   message_reactions (message_id)               -> _message_reaction_uc
+#   pinned_messages (channel_id)                 -> _pinned_message_uc
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_channel_members_member_channel', 'channel_members', ['member_id', 'channel_id'], unique=False)
+    op.create_index('ix_channel_invites_invited_user_status', 'channel_invites', ['invited_user_id', 'status'], unique=False)
+    op.create_index('ix_channel_invites_channel_status', 'channel_invites', ['channel_id', 'status'], unique=False)
+
+    # Concurrent like toggles could insert the same like twice; keep the
+    # oldest row and recount before the unique indexes go on
+    for column in ('student_id', 'professor_id'):
+        op.execute(f"""
+            DELETE FROM feed_likes AS newer
+            USING feed_likes AS older
+            WHERE newer.feed_id = older.feed_id
+              AND newer.{column} = older.{column}
+              AND (newer.created_at, newer.id::text) > (older.created_at, older.id::text)
+        """)
+    op.execute("""
+        UPDATE campus_feeds
+        SET likes_count = (SELECT count(*) FROM feed_likes WHERE feed_likes.feed_id = campus_feeds.id)
+        WHERE likes_count <> (SELECT count(*) FROM feed_likes WHERE feed_likes.feed_id = campus_feeds.id)
+    """)
+    op.create_index('ux_feed_likes_feed_student', 'feed_likes', ['feed_id', 'student_id'], unique=True)
+    op.create_index('ux_feed_likes_feed_professor', 'feed_likes', ['feed_id', 'professor_id'], unique=True)
+
+    op.create_index('ix_feed_comments_feed_created', 'feed_comments', ['feed_id', 'created_at'], unique=False)
+    op.create_index('ix_feed_shares_feed_student', 'feed_shares', ['feed_id', 'student_id'], unique=False)
+    op.create_index('ix_feed_shares_feed_professor', 'feed_shares', ['feed_id', 'professor_id'], unique=False)
+    op.create_index(op.f('ix_professor_ratings_professor_id'), 'professor_ratings', ['professor_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_professor_ratings_professor_id'), table_name='professor_ratings')
+    op.drop_index('ix_feed_shares_feed_professor', table_name='feed_shares')
+    op.drop_index('ix_feed_shares_feed_student', table_name='feed_shares')
+    op.drop_index('ix_feed_comments_feed_created', table_name='feed_comments')
+    op.drop_index('ux_feed_likes_feed_professor', table_name='feed_likes')
+    op.drop_index('ux_feed_likes_feed_student', table_name='feed_likes')
+    op.drop_index('ix_channel_invites_channel_status', table_name='channel_invites')
+    op.drop_index('ix_channel_invites_invited_user_status', table_name='channel_invites')
+    op.drop_index('ix_channel_members_member_channel', table_name='channel_members')
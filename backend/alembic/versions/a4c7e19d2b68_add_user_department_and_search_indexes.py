@@ -0,0 +1,54 @@
+"""Add user department and search indexes
+
+Revision ID: a4c7e19d2b68
+Revises: 3f1a9c2e7b54
+Create Date: 2026-10-18 13:24:51.207336
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c7e19d2b68'
+down_revision: Union[str, None] = '3f1a9c2e7b54'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_INDEXES = [
+    ('students', 'name'),
+    ('students', 'usn'),
+    ('students', 'email'),
+    ('professors', 'name'),
+    ('professors', 'email'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('students', sa.Column('department', sa.String(), nullable=True))
+    op.create_index(op.f('ix_students_department'), 'students', ['department'], unique=False)
+    op.add_column('professors', sa.Column('department', sa.String(), nullable=True))
+    op.create_index(op.f('ix_professors_department'), 'professors', ['department'], unique=False)
+
+    # lower(column) COLLATE "C" serves both LIKE 'prefix%' and the (name, id) keyset order
+    for table, column in SEARCH_INDEXES:
+        op.create_index(
+            f'ix_{table}_{column}_search',
+            table,
+            [sa.text(f'(lower({column}) COLLATE "C")'), 'id'],
+            unique=False
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in SEARCH_INDEXES:
+        op.drop_index(f'ix_{table}_{column}_search', table_name=table)
+
+    op.drop_index(op.f('ix_professors_department'), table_name='professors')
+    op.drop_column('professors', 'department')
+    op.drop_index(op.f('ix_students_department'), table_name='students')
+    op.drop_column('students', 'department')
@@ -0,0 +1,45 @@
+"""Add student search indexes
+
+Revision ID: c2e8f5a1d937
+Revises: a4c7e19d2b68
+Create Date: 2026-10-18 14:05:38.661902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2e8f5a1d937'
+down_revision: Union[str, None] = 'a4c7e19d2b68'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    # Immutable so it can back an expression index on the lowercased skills
+    op.execute("""
+        CREATE OR REPLACE FUNCTION lower_text_array(text[]) RETURNS text[]
+        LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE
+        AS $$ SELECT array_agg(lower(value)) FROM unnest($1) AS value $$
+    """)
+
+    op.create_index('ix_students_name_trgm', 'students', ['name'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.create_index('ix_students_email_trgm', 'students', ['email'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'})
+    op.create_index('ix_student_profiles_skills_lower', 'student_profiles',
+                    [sa.text('lower_text_array(skills)')], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_student_profiles_skills_lower', table_name='student_profiles')
+    op.drop_index('ix_students_email_trgm', table_name='students')
+    op.drop_index('ix_students_name_trgm', table_name='students')
+    op.execute('DROP FUNCTION IF EXISTS lower_text_array(text[])')
+    # pg_trgm is left installed; other objects may depend on it
@@ -0,0 +1,45 @@
+"""Add channel search indexes
+
+Revision ID: e7b3d94c0a15
+Revises: c2e8f5a1d937
+Create Date: 2026-10-18 15:12:44.308517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b3d94c0a15'
+down_revision: Union[str, None] = 'c2e8f5a1d937'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('channels', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(
+            "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+            persisted=True
+        ),
+        nullable=True
+    ))
+    op.create_index('ix_channels_search_vector', 'channels', ['search_vector'], unique=False, postgresql_using='gin')
+    # lower_text_array() was created with the student search indexes
+    op.create_index('ix_channels_tags_lower', 'channels', [sa.text('lower_text_array(tags)')], unique=False, postgresql_using='gin')
+    op.create_index('ix_channels_created_id', 'channels', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_channels_created_id', table_name='channels')
+    op.drop_index('ix_channels_tags_lower', table_name='channels')
+    op.drop_index('ix_channels_search_vector', table_name='channels')
+    op.drop_column('channels', 'search_vector')
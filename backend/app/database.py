@@ -1,20 +1,207 @@
 """Database configuration and session management for campus connect."""
 
 import os
+import time
+import uuid
+from collections import deque
+from datetime import datetime, timezone
+from threading import Lock
+from typing import Any, Dict, List, Optional
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./campus_connect.db")
 
+def to_async_url(url: str) -> str:
+  """Map a synchronous database URL onto its asyncio driver (asyncpg / aiosqlite)."""
+  scheme, sep, rest = url.partition("://")
+  driver = scheme.split("+")[0]
+  if driver in ("postgresql", "postgres"):
+    return f"postgresql+asyncpg{sep}{rest}"
+  if driver == "sqlite":
+    return f"sqlite+aiosqlite{sep}{rest}"
+  return url
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", to_async_url(DATABASE_URL))
+
+def _env_flag(name: str, default: str) -> bool:
+  return os.getenv(name, default).lower() in ("1", "true", "yes")
+
+# Connection pool settings (ignored for SQLite, which keeps SQLAlchemy's defaults)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = _env_flag("DB_POOL_PRE_PING", "true")
+
+# Set when connecting through PgBouncer in transaction pooling mode, where a
+# server-side prepared statement may land on a different backend connection
+DB_PGBOUNCER = _env_flag("DB_PGBOUNCER", "false")
+
+class PoolStats:
+  """Checkout wait time, in-use and overflow counters for one connection pool"""
+
+  def __init__(self, name: str, samples: int = 1024):
+    self.name = name
+    self.pool = None
+    self.checkouts = 0
+    self.timeouts = 0
+    self.overflow_events = 0
+    self.total_wait = 0.0
+    self.max_wait = 0.0
+    self._recent_waits = deque(maxlen=samples)
+    self._lock = Lock()
+
+  def record_checkout(self, wait: float, timed_out: bool = False) -> None:
+    with self._lock:
+      if timed_out:
+        self.timeouts += 1
+      else:
+        self.checkouts += 1
+      self.total_wait += wait
+      self.max_wait = max(self.max_wait, wait)
+      self._recent_waits.append(wait)
+
+  def record_connect(self, dbapi_connection=None, connection_record=None) -> None:
+    # A connection opened while the pool is over pool_size is an overflow connection
+    if self.pool is not None and self.pool.overflow() > 0:
+      with self._lock:
+        self.overflow_events += 1
+
+  def stats(self) -> Dict[str, Any]:
+    with self._lock:
+      waits = sorted(self._recent_waits)
+      attempts = self.checkouts + self.timeouts
+
+      def percentile(p: float) -> float:
+        if not waits:
+          return 0.0
+        return waits[min(len(waits) - 1, int(p * len(waits)))]
+
+      return {
+        "name": self.name,
+        "size": self.pool.size() if self.pool else 0,
+        "in_use": self.pool.checkedout() if self.pool else 0,
+        "idle": self.pool.checkedin() if self.pool else 0,
+        "overflow": max(self.pool.overflow(), 0) if self.pool else 0,
+        "overflow_events": self.overflow_events,
+        "checkouts": self.checkouts,
+        "timeouts": self.timeouts,
+        "wait_ms": {
+          "avg": round(self.total_wait / attempts * 1000, 3) if attempts else 0.0,
+          "p50": round(percentile(0.50) * 1000, 3),
+          "p95": round(percentile(0.95) * 1000, 3),
+          "p99": round(percentile(0.99) * 1000, 3),
+          "max": round(self.max_wait * 1000, 3)
+        }
+      }
+
+_pool_stats: Dict[str, PoolStats] = {}
+
+class TimedCheckoutMixin:
+  """Pool mixin timing how long each checkout waits for a connection"""
+
+  metrics = None
+
+  def connect(self):
+    if self.metrics is None:
+      return super().connect()
+    start = time.perf_counter()
+    try:
+      connection = super().connect()
+    except PoolTimeoutError:
+      self.metrics.record_checkout(time.perf_counter() - start, timed_out=True)
+      raise
+    self.metrics.record_checkout(time.perf_counter() - start)
+    return connection
+
+  def recreate(self):
+    # engine.dispose() swaps in a fresh pool; keep reporting under the same name
+    pool = super().recreate()
+    if self.metrics is not None:
+      # The new pool already carries a copy of this pool's "connect"
+      # listener, so only the pool references move over
+      self.metrics.pool = pool
+      pool.metrics = self.metrics
+    return pool
+
+class TimedQueuePool(TimedCheckoutMixin, QueuePool):
+  pass
+
+class TimedAsyncAdaptedQueuePool(TimedCheckoutMixin, AsyncAdaptedQueuePool):
+  pass
+
+def instrument_pool(name: str, pool, metrics: Optional[PoolStats] = None) -> PoolStats:
+  """Attach stats collection to an engine's pool and register it under name"""
+  metrics = metrics or PoolStats(name)
+  metrics.pool = pool
+  pool.metrics = metrics
+  event.listen(pool, "connect", metrics.record_connect)
+  _pool_stats[name] = metrics
+  return metrics
+
+def all_pool_stats() -> List[Dict[str, Any]]:
+  """Stats for every instrumented connection pool"""
+  return [metrics.stats() for metrics in _pool_stats.values()]
+
+def pool_options(url: str, poolclass) -> Dict[str, Any]:
+  """Engine keyword arguments for the configured connection pool"""
+  if url.startswith("sqlite"):
+    return {}
+  return {
+    "poolclass": poolclass,
+    "pool_size": DB_POOL_SIZE,
+    "max_overflow": DB_MAX_OVERFLOW,
+    "pool_timeout": DB_POOL_TIMEOUT,
+    "pool_recycle": DB_POOL_RECYCLE,
+    "pool_pre_ping": DB_POOL_PRE_PING
+  }
+
 connect_args = {"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
-engine = create_engine(DATABASE_URL, connect_args=connect_args)
+# psycopg2 never prepares statements server-side, so PgBouncer mode only affects asyncpg
+engine = create_engine(DATABASE_URL, connect_args=connect_args, **pool_options(DATABASE_URL, TimedQueuePool))
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_connect_args = {}
+if DB_PGBOUNCER and "asyncpg" in ASYNC_DATABASE_URL:
+  # Disable asyncpg's statement caches and give each prepared statement a unique name
+  async_connect_args = {
+    "statement_cache_size": 0,
+    "prepared_statement_cache_size": 0,
+    "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__"
+  }
+
+# Async engine for handlers that must not block the event loop
+async_engine = create_async_engine(
+  ASYNC_DATABASE_URL,
+  connect_args=async_connect_args,
+  **pool_options(ASYNC_DATABASE_URL, TimedAsyncAdaptedQueuePool)
+)
+
+for _name, _pool in (("sync", engine.pool), ("async", async_engine.pool)):
+  if isinstance(_pool, TimedCheckoutMixin):
+    instrument_pool(_name, _pool)
+
+# Objects stay usable after commit since there is no implicit IO to refresh them
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+def utc_now() -> datetime:
+  """Current UTC time as a naive datetime.
+
+  Timestamp columns are TIMESTAMP WITHOUT TIME ZONE holding UTC. psycopg2
+  drops the offset of an aware value silently, but asyncpg rejects it, so
+  every timestamp the app writes comes from here.
+  """
+  return datetime.now(timezone.utc).replace(tzinfo=None)
+
 class Base(DeclarativeBase):
   """Base class for all database models"""
   pass
@@ -25,4 +212,9 @@ def get_db():
   try:
     yield db
   finally:
-    db.close()
\ No newline at end of file
+    db.close()
+
+async def get_async_db():
+  """Dependency to get an async database session."""
+  async with AsyncSessionLocal() as db:
+    yield db
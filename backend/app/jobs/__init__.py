@@ -0,0 +1 @@
+"""Maintenance jobs runnable with `python -m app.jobs.<name>`"""
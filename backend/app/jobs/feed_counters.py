@@ -0,0 +1,66 @@
+"""Backfill and reconcile the denormalized engagement counters on campus feeds.
+
+Usage:
+  python -m app.jobs.feed_counters backfill
+  python -m app.jobs.feed_counters reconcile [--dry-run] [--limit N]
+"""
+
+import argparse
+import logging
+
+from app.database import SessionLocal
+from app.repository import FeedRepository
+
+logger = logging.getLogger(__name__)
+
+def backfill() -> int:
+  """Recompute the counters of every feed from the engagement tables."""
+  db = SessionLocal()
+  try:
+    updated = FeedRepository(db).recalculate_counters()
+    logger.info(f"Backfilled engagement counters for {updated} feeds")
+    return updated
+  finally:
+    db.close()
+
+def reconcile(dry_run: bool = False, limit: int | None = None) -> list:
+  """Find feeds whose counters drifted and repair them."""
+  db = SessionLocal()
+  try:
+    feed_repo = FeedRepository(db)
+    drifted = feed_repo.find_counter_drift(limit)
+
+    if drifted:
+      logger.warning(f"Found {len(drifted)} feeds with engagement counter drift")
+    else:
+      logger.info("No engagement counter drift found")
+
+    if drifted and not dry_run:
+      feed_repo.recalculate_counters(drifted)
+      logger.info(f"Repaired engagement counters for {len(drifted)} feeds")
+
+    return drifted
+  finally:
+    db.close()
+
+def main():
+  parser = argparse.ArgumentParser(description="Maintain campus feed engagement counters")
+  subparsers = parser.add_subparsers(dest="command", required=True)
+
+  subparsers.add_parser("backfill", help="Recompute counters for all feeds")
+
+  reconcile_parser = subparsers.add_parser("reconcile", help="Find and repair counter drift")
+  reconcile_parser.add_argument("--dry-run", action="store_true", help="Only report drifted feeds")
+  reconcile_parser.add_argument("--limit", type=int, default=None, help="Maximum number of feeds to repair")
+
+  args = parser.parse_args()
+  logging.basicConfig(level=logging.INFO)
+
+  if args.command == "backfill":
+    backfill()
+  else:
+    for feed_id in reconcile(dry_run=args.dry_run, limit=args.limit):
+      print(feed_id)
+
+if __name__ == "__main__":
+  main()
@@ -1,11 +1,17 @@
 """Main FastApi application"""
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from app.database import engine, Base
-from app.routers import student, professor, auth, channel, common, feedback, feed, profile, channel_router, users
-from app.utils import limiter, rate_limit_exceeded_handler
+from app.routers import student, professor, auth, channel, common, feedback, feed, profile, channel_router, users, metrics
+from app.utils import limiter, rate_limit_exceeded_handler, FastJSONResponse
+from app.websocket.channel_websocket import manager
+from app.websocket.message_writer import message_writer
+from app.services.password_hasher import password_hasher
+from app.services.resume_jobs import resume_jobs
+from app.services.resume_extraction import resume_extractor
 from slowapi.errors import RateLimitExceeded
 
 # Import all models to ensure they are registered with SQLAlchemy
@@ -16,10 +22,23 @@ from app.models.channel import Channel, ChannelMember, Message, MessageReaction,
 # Create all tables
 Base.metadata.create_all(bind = engine)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+  """Subscribe the WebSocket manager to the cross-worker backplane and drain writers on shutdown"""
+  await manager.start()
+  yield
+  await manager.stop()
+  await message_writer.stop()
+  await resume_jobs.stop()
+  resume_extractor.shutdown()
+  password_hasher.shutdown()
+
 app = FastAPI(
   title="Campus Connect Backend",
   description="Backend API for campus connect application",
-  version="1.0.0"
+  version="1.0.0",
+  default_response_class=FastJSONResponse,
+  lifespan=lifespan
 )
 
 app.add_middleware(
@@ -64,6 +83,9 @@ app.include_router(channel_router.router)
 # User management service
 app.include_router(users.router)
 
+# Runtime metrics
+app.include_router(metrics.router)
+
 # Mount the directory to serve files
 # FastAPI by default does not serve static files like PDFs, images, or CSS/JS files. It only serves API endpoints that you explicitly define (like /api/users, /auth/login, etc.)
 # Imagine you placed a file inside a drawer (uploads/resources/myfile.pdf) but never told anyone which drawer to open.
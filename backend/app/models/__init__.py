@@ -4,6 +4,7 @@ from .user import Students, Professors, ProfessorRatings, StudentProfile, Websit
 from .channel import Channel, ChannelMember, Message, CreatorRoleEnum, MessageTypeEnum
 from .resources import Subjects, Resources
 from .feed import CampusFeed, FeedLike, FeedComment, FeedShare
+from .resume import ResumeAnalysisJob, ResumeAnalysisCacheEntry
 
 __all__ = [
   "Students",
@@ -21,5 +22,7 @@ __all__ = [
   "CampusFeed",
   "FeedLike",
   "FeedComment",
-  "FeedShare"
+  "FeedShare",
+  "ResumeAnalysisJob",
+  "ResumeAnalysisCacheEntry"
 ]
\ No newline at end of file
@@ -1,10 +1,11 @@
 """Channel models for channel-related database operations."""
 
-from app.database import Base
-from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, Boolean, ForeignKey, Enum, UniqueConstraint, Text, Integer, DateTime
-from sqlalchemy.dialects.postgresql import UUID, ARRAY
-from datetime import datetime, timezone
+from app.database import Base, utc_now
+from app.models.user import LOWER_TEXT_ARRAY_DDL
+from sqlalchemy.orm import Mapped, mapped_column, relationship, deferred
+from sqlalchemy import String, Boolean, ForeignKey, Enum, UniqueConstraint, Text, Integer, DateTime, Index, Computed, DDL, event, func
+from sqlalchemy.dialects.postgresql import UUID, ARRAY, TSVECTOR
+from datetime import datetime
 import uuid
 import enum
 from typing import List, Optional
@@ -40,8 +41,22 @@ class Channel(Base):
     
     created_by_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
     created_by_role: Mapped[CreatorRoleEnum] = mapped_column(Enum(CreatorRoleEnum), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now, onupdate=utc_now)
+
+    # Full-text document for discovery search, maintained by PostgreSQL; name outranks description
+    search_vector: Mapped[str] = deferred(mapped_column(TSVECTOR, Computed(
+        "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+        persisted=True
+    )))
+
+    __table_args__ = (
+        Index("ix_channels_search_vector", "search_vector", postgresql_using="gin"),
+        # Case-insensitive tag containment, same helper as the student skills index
+        Index("ix_channels_tags_lower", func.lower_text_array(tags), postgresql_using="gin"),
+        Index("ix_channels_created_id", "created_at", "id"),
+    )
 
     # Relationships
     members: Mapped[List["ChannelMember"]] = relationship("ChannelMember", back_populates="channel", cascade="all, delete-orphan")
@@ -50,6 +65,9 @@ class Channel(Base):
     invites: Mapped[List["ChannelInvite"]] = relationship("ChannelInvite", back_populates="channel", cascade="all, delete-orphan")
 
 
+event.listen(Channel.__table__, "before_create", DDL(LOWER_TEXT_ARRAY_DDL).execute_if(dialect="postgresql"))
+
+
 class ChannelRoleEnum(str, enum.Enum):
     MEMBER = "member"
     MODERATOR = "moderator"
@@ -67,11 +85,15 @@ class ChannelMember(Base):
     channel_role: Mapped[ChannelRoleEnum] = mapped_column(Enum(ChannelRoleEnum), default=ChannelRoleEnum.MEMBER)
     is_muted: Mapped[bool] = mapped_column(Boolean, default=False)
     is_banned: Mapped[bool] = mapped_column(Boolean, default=False)
-    joined_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
+    joined_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now)
     last_read_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
-    # Constraints
-    __table_args__ = (UniqueConstraint("channel_id", "member_id", name="_channel_member_uc"),)
+    # Constraints; the unique index answers per-channel lookups, the second
+    # one answers "which channels is this user in"
+    __table_args__ = (
+        UniqueConstraint("channel_id", "member_id", name="_channel_member_uc"),
+        Index("ix_channel_members_member_channel", "member_id", "channel_id"),
+    )
 
     # Relationships
     channel: Mapped["Channel"] = relationship("Channel", back_populates="members")
@@ -105,8 +127,11 @@ class Message(Base):
     sender_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
     sender_role: Mapped[CreatorRoleEnum] = mapped_column(Enum(CreatorRoleEnum), nullable=False)
     
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now, onupdate=utc_now)
+
+    # Keyset index for scrolling channel history
+    __table_args__ = (Index("ix_messages_channel_created_id", "channel_id", "created_at", "id"),)
 
     # Relationships
     channel: Mapped["Channel"] = relationship("Channel", back_populates="messages")
@@ -123,7 +148,7 @@ class MessageReaction(Base):
     user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
     user_role: Mapped[CreatorRoleEnum] = mapped_column(Enum(CreatorRoleEnum), nullable=False)
     emoji: Mapped[str] = mapped_column(String(10), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now)
 
     # Constraints
     __table_args__ = (UniqueConstraint("message_id", "user_id", "emoji", name="_message_reaction_uc"),)
@@ -140,7 +165,7 @@ class PinnedMessage(Base):
     message_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("messages.id", ondelete="CASCADE"), nullable=False)
     pinned_by_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
     pinned_by_role: Mapped[CreatorRoleEnum] = mapped_column(Enum(CreatorRoleEnum), nullable=False)
-    pinned_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
+    pinned_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now)
 
     # Constraints
     __table_args__ = (UniqueConstraint("channel_id", "message_id", name="_pinned_message_uc"),)
@@ -161,7 +186,13 @@ class ChannelInvite(Base):
     invite_type: Mapped[str] = mapped_column(String(20), default="invitation")  # invitation, join_request
     message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now, onupdate=utc_now)
+
+    # Invite inboxes are read per user and per channel, filtered by status
+    __table_args__ = (
+        Index("ix_channel_invites_invited_user_status", "invited_user_id", "status"),
+        Index("ix_channel_invites_channel_status", "channel_id", "status"),
+    )
 
     channel: Mapped["Channel"] = relationship("Channel", back_populates="invites")
\ No newline at end of file
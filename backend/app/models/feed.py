@@ -1,7 +1,7 @@
-from sqlalchemy import String, ForeignKey, DateTime, Integer, Text, Boolean
-from sqlalchemy.dialects.postgresql import UUID, ARRAY
-from sqlalchemy.orm import Mapped, mapped_column, relationship
-from app.database import Base
+from sqlalchemy import String, ForeignKey, DateTime, Integer, Text, Boolean, Index, DDL, event
+from sqlalchemy.dialects.postgresql import UUID, ARRAY, TSVECTOR
+from sqlalchemy.orm import Mapped, mapped_column, relationship, deferred
+from app.database import Base, utc_now
 import uuid
 import datetime
 from typing import List, Optional
@@ -19,12 +19,25 @@ class CampusFeed(Base):
     is_public: Mapped[bool] = mapped_column(Boolean, default=True)
     tags: Mapped[List[str]] = mapped_column(ARRAY(String), default=list)
     attachments: Mapped[List[str]] = mapped_column(ARRAY(String), default=list)  # file URLs
-    created_at: Mapped[datetime.datetime] = mapped_column(DateTime, default=datetime.datetime.now(datetime.timezone.utc))
-    updated_at: Mapped[datetime.datetime] = mapped_column(DateTime, default=datetime.datetime.now(datetime.timezone.utc), onupdate=datetime.datetime.now(datetime.timezone.utc))
+    # Denormalized engagement counters, maintained by FeedRepository
+    likes_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False, index=True)
+    comments_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False, index=True)
+    shares_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False, index=True)
+    created_at: Mapped[datetime.datetime] = mapped_column(DateTime, default=utc_now)
+    updated_at: Mapped[datetime.datetime] = mapped_column(DateTime, default=utc_now, onupdate=utc_now)
     
     # Foreign keys
     author_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("students.id"), nullable=True)
     professor_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("professors.id"), nullable=True)
+
+    # Full-text document (title weighted over content), maintained by the
+    # campus_feeds_search_vector trigger only when title or content change
+    search_vector: Mapped[Optional[str]] = deferred(mapped_column(TSVECTOR, nullable=True))
+
+    __table_args__ = (
+        Index("ix_campus_feeds_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_campus_feeds_tags", "tags", postgresql_using="gin"),
+    )
     
     # Relationships
     author_student: Mapped[Optional["Students"]] = relationship("Students", foreign_keys=[author_id])
@@ -33,17 +46,45 @@ class CampusFeed(Base):
     comments: Mapped[List["FeedComment"]] = relationship("FeedComment", back_populates="feed", cascade="all, delete")
     shares: Mapped[List["FeedShare"]] = relationship("FeedShare", back_populates="feed", cascade="all, delete")
 
+FEED_SEARCH_VECTOR_FUNCTION_DDL = """
+CREATE OR REPLACE FUNCTION campus_feeds_search_vector_update() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(NEW.content, '')), 'B');
+    RETURN NEW;
+END
+$$
+"""
+
+FEED_SEARCH_VECTOR_TRIGGER_DDL = """
+CREATE TRIGGER campus_feeds_search_vector
+BEFORE INSERT OR UPDATE OF title, content ON campus_feeds
+FOR EACH ROW EXECUTE FUNCTION campus_feeds_search_vector_update()
+"""
+
+event.listen(CampusFeed.__table__, "after_create", DDL(FEED_SEARCH_VECTOR_FUNCTION_DDL).execute_if(dialect="postgresql"))
+event.listen(CampusFeed.__table__, "after_create", DDL(FEED_SEARCH_VECTOR_TRIGGER_DDL).execute_if(dialect="postgresql"))
+
 class FeedLike(Base):
     """Feed likes model"""
     __tablename__ = "feed_likes"
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    created_at: Mapped[datetime.datetime] = mapped_column(DateTime, default=datetime.datetime.now(datetime.timezone.utc))
+    created_at: Mapped[datetime.datetime] = mapped_column(DateTime, default=utc_now)
     
     # Foreign keys
     feed_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("campus_feeds.id"), nullable=False)
     student_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("students.id"), nullable=True)
     professor_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("professors.id"), nullable=True)
+
+    # One like per user and post; NULLs are distinct, so each index only
+    # constrains the author kind it names
+    __table_args__ = (
+        Index("ux_feed_likes_feed_student", "feed_id", "student_id", unique=True),
+        Index("ux_feed_likes_feed_professor", "feed_id", "professor_id", unique=True),
+    )
     
     # Relationships
     feed: Mapped["CampusFeed"] = relationship("CampusFeed", back_populates="likes")
@@ -56,13 +97,16 @@ class FeedComment(Base):
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     content: Mapped[str] = mapped_column(Text, nullable=False)
-    created_at: Mapped[datetime.datetime] = mapped_column(DateTime, default=datetime.datetime.now(datetime.timezone.utc))
-    updated_at: Mapped[datetime.datetime] = mapped_column(DateTime, default=datetime.datetime.now(datetime.timezone.utc), onupdate=datetime.datetime.now(datetime.timezone.utc))
+    created_at: Mapped[datetime.datetime] = mapped_column(DateTime, default=utc_now)
+    updated_at: Mapped[datetime.datetime] = mapped_column(DateTime, default=utc_now, onupdate=utc_now)
     
     # Foreign keys
     feed_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("campus_feeds.id"), nullable=False)
     student_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("students.id"), nullable=True)
     professor_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("professors.id"), nullable=True)
+
+    # Comment threads are read newest first per post
+    __table_args__ = (Index("ix_feed_comments_feed_created", "feed_id", "created_at"),)
     
     # Relationships
     feed: Mapped["CampusFeed"] = relationship("CampusFeed", back_populates="comments")
@@ -74,12 +118,18 @@ class FeedShare(Base):
     __tablename__ = "feed_shares"
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    created_at: Mapped[datetime.datetime] = mapped_column(DateTime, default=datetime.datetime.now(datetime.timezone.utc))
+    created_at: Mapped[datetime.datetime] = mapped_column(DateTime, default=utc_now)
     
     # Foreign keys
     feed_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("campus_feeds.id"), nullable=False)
     student_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("students.id"), nullable=True)
     professor_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("professors.id"), nullable=True)
+
+    # A post can be shared repeatedly, so these stay non-unique
+    __table_args__ = (
+        Index("ix_feed_shares_feed_student", "feed_id", "student_id"),
+        Index("ix_feed_shares_feed_professor", "feed_id", "professor_id"),
+    )
     
     # Relationships
     feed: Mapped["CampusFeed"] = relationship("CampusFeed", back_populates="shares")
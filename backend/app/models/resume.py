@@ -0,0 +1,38 @@
+"""Resume analysis job and result cache models"""
+
+from sqlalchemy import JSON, String, ForeignKey, DateTime, Text, Float, Integer
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from app.database import Base, utc_now
+from datetime import datetime
+from typing import Optional
+import uuid
+
+class ResumeAnalysisJob(Base):
+  """One resume analysis request; status moves queued -> running -> completed | failed"""
+  __tablename__ = "resume_analysis_jobs"
+
+  id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+  student_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("students.id", ondelete="CASCADE"), nullable=False, index=True)
+  filename: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+  status: Mapped[str] = mapped_column(String(20), default="queued", nullable=False)
+  # {"strengths": ..., "gaps": ..., "suggestions": ...} once completed
+  result: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+  error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+  created_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now)
+  started_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+  finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+class ResumeAnalysisCacheEntry(Base):
+  """An analysis keyed by sha256 of the normalized resume text and the prompt version"""
+  __tablename__ = "resume_analysis_cache"
+
+  key: Mapped[str] = mapped_column(String(64), primary_key=True)
+  prompt_version: Mapped[str] = mapped_column(String(100), nullable=False)
+  result: Mapped[dict] = mapped_column(JSON, nullable=False)
+  # How long the analysis took to produce, i.e. what each hit saves
+  generation_ms: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+  hits: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+  created_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now, index=True)
+  # Least recently used entries are evicted first when the cache is over its size bound
+  last_used_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now, index=True)
@@ -1,10 +1,10 @@
-from sqlalchemy import String, ForeignKey, DateTime, Integer
+from sqlalchemy import DDL, JSON, String, ForeignKey, DateTime, Integer, Index, event, func
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from app.database import Base
+from app.database import Base, utc_now
 import uuid
 import datetime
-from typing import List
+from typing import List, Optional
 
 # Student related database model
 class Students(Base):
@@ -15,6 +15,7 @@ class Students(Base):
     email: Mapped[str] = mapped_column(String, unique=True)
     password: Mapped[str] = mapped_column(String)
     name: Mapped[str] = mapped_column(String)
+    department: Mapped[Optional[str]] = mapped_column(String, nullable=True, index=True)
 
     ratings = relationship("ProfessorRatings", back_populates="student", cascade="all, delete")
     
@@ -26,7 +27,7 @@ class StudentProfile(Base):
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     bio: Mapped[str] = mapped_column(String)
     location: Mapped[str] = mapped_column(String)
-    skills: Mapped[List[str]] = mapped_column(ARRAY(String), default=list)
+    skills: Mapped[List[str]] = mapped_column(ARRAY(String).with_variant(JSON, "sqlite"), default=list)
     
     student_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("students.id"), unique=True)
 
@@ -53,17 +54,52 @@ class Professors(Base):
     name: Mapped[str] = mapped_column(String)
     email: Mapped[str] = mapped_column(String, unique=True)
     password: Mapped[str] = mapped_column(String)
+    department: Mapped[Optional[str]] = mapped_column(String, nullable=True, index=True)
 
     ratings = relationship("ProfessorRatings", back_populates="professor", cascade="all, delete")
 
+# Case-insensitive prefix search and (name, id) keyset paging for the user pickers.
+# COLLATE "C" lets LIKE 'prefix%' use the btree and matches Python's string order.
+def _search_index(model, column: str) -> Index:
+    return Index(
+        f"ix_{model.__tablename__}_{column}_search",
+        func.lower(getattr(model, column)).collate("C"),
+        model.id
+    ).ddl_if(dialect="postgresql")
+
+_search_index(Students, "name")
+_search_index(Students, "usn")
+_search_index(Students, "email")
+_search_index(Professors, "name")
+_search_index(Professors, "email")
+
+# Ranked student search (app/repository/student_search.py): trigram indexes for
+# name/email substring matches and an index on the lowercased skills for exact skills
+LOWER_TEXT_ARRAY_DDL = """
+CREATE OR REPLACE FUNCTION lower_text_array(text[]) RETURNS text[]
+LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE
+AS $$ SELECT array_agg(lower(value)) FROM unnest($1) AS value $$
+"""
+
+event.listen(Students.__table__, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"))
+event.listen(StudentProfile.__table__, "before_create", DDL(LOWER_TEXT_ARRAY_DDL).execute_if(dialect="postgresql"))
+
+Index("ix_students_name_trgm", Students.name, postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}).ddl_if(dialect="postgresql")
+Index("ix_students_email_trgm", Students.email, postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"}).ddl_if(dialect="postgresql")
+Index(
+    "ix_student_profiles_skills_lower",
+    func.lower_text_array(StudentProfile.skills),
+    postgresql_using="gin"
+).ddl_if(dialect="postgresql")
+
 class ProfessorRatings(Base):
     __tablename__ = "professor_ratings"
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     rating: Mapped[int] = mapped_column(Integer)
-    created_at: Mapped[datetime.datetime] = mapped_column(DateTime, default=datetime.datetime.now(datetime.timezone.utc))
+    created_at: Mapped[datetime.datetime] = mapped_column(DateTime, default=utc_now)
 
-    professor_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("professors.id"), nullable=False)
+    professor_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("professors.id"), nullable=False, index=True)
     student_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("students.id"), nullable=False)
 
     professor = relationship("Professors", back_populates="ratings")
@@ -1,19 +1,26 @@
-from .user_repository import StudentRepository, ProfessorRepository
+from .user_repository import StudentRepository, ProfessorRepository, UserSearchRepository
 from .channel_repository import ChannelRepository
 from .resource_repository import Subject, Resource
 from .feedback_repository import Feedback
 from .feed_repository import FeedRepository
 from .profile_repository import ProfileRepository
 from .channel_repository import ChannelRepository
+from .async_repository import AsyncChannelRepository
+from .resume_job_repository import ResumeJobRepository
+from .resume_cache_repository import ResumeCacheRepository
 
 __all__ = [
   "StudentRepository",
   "ProfessorRepository",
+  "UserSearchRepository",
   "ChannelRepository",
   "Subject",
   "Resource",
   "Feedback",
   "FeedRepository",
   "ProfileRepository",
-  "ChannelRepository"
+  "ChannelRepository",
+  "AsyncChannelRepository",
+  "ResumeJobRepository",
+  "ResumeCacheRepository"
 ]
\ No newline at end of file
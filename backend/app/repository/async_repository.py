@@ -0,0 +1,78 @@
+"""Async repository code for use with an AsyncSession.
+
+The membership lookups the WebSocket handler makes are written natively with
+select(). Anything else wraps the synchronous class with run_sync_method,
+which runs the same ORM code through AsyncSession.run_sync over the async
+driver without blocking the event loop (see app/services/async_services.py).
+"""
+
+from sqlalchemy import select, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional, Set
+from uuid import UUID
+
+from app.models.channel import ChannelMember, ChannelRoleEnum
+from .channel_repository import ChannelRepository
+
+def run_sync_method(name: str):
+    """Build an async method that runs the synchronous method of the same name via run_sync"""
+    async def method(self, *args, **kwargs):
+        def call(session):
+            return getattr(self.sync_class(session), name)(*args, **kwargs)
+        return await self.db.run_sync(call)
+
+    method.__name__ = name
+    method.__doc__ = f"Async version of {name}"
+    return method
+
+class AsyncWrapper:
+    """Base class pairing an AsyncSession with the synchronous class it wraps"""
+    sync_class = None
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+class AsyncChannelRepository(AsyncWrapper):
+    sync_class = ChannelRepository
+
+    async def get_channel_member(self, channel_id: UUID, user_id: UUID) -> Optional[ChannelMember]:
+        """Get specific channel member"""
+        result = await self.db.execute(
+            select(ChannelMember).where(
+                and_(
+                    ChannelMember.channel_id == channel_id,
+                    ChannelMember.member_id == user_id
+                )
+            )
+        )
+        return result.scalars().first()
+
+    async def is_member(self, channel_id: UUID, user_id: UUID) -> bool:
+        """Check if user is member of channel"""
+        result = await self.db.execute(
+            select(ChannelMember.id).where(
+                and_(
+                    ChannelMember.channel_id == channel_id,
+                    ChannelMember.member_id == user_id,
+                    ChannelMember.is_banned == False
+                )
+            ).limit(1)
+        )
+        return result.first() is not None
+
+    async def get_member_channel_ids(self, user_id: UUID) -> Set[UUID]:
+        """Get IDs of the channels the user belongs to and is not banned from"""
+        result = await self.db.execute(
+            select(ChannelMember.channel_id).where(
+                and_(
+                    ChannelMember.member_id == user_id,
+                    ChannelMember.is_banned == False
+                )
+            )
+        )
+        return set(result.scalars().all())
+
+    async def get_member_role(self, channel_id: UUID, user_id: UUID) -> Optional[ChannelRoleEnum]:
+        """Get user's role in channel"""
+        member = await self.get_channel_member(channel_id, user_id)
+        return member.channel_role if member else None
@@ -1,11 +1,15 @@
 from sqlalchemy.orm import Session, joinedload, selectinload
-from sqlalchemy import and_, or_, func, desc, asc, text
-from typing import List, Optional, Tuple, Dict, Any
+from sqlalchemy import and_, or_, func, desc, asc, text, tuple_, case, cast, Float, Text
+from sqlalchemy.dialects.postgresql import ARRAY, array
+from typing import Callable, List, Optional, Tuple, Dict, Any
 from uuid import UUID
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
+import logging
+import re
 import secrets
 import string
 
+from app.database import utc_now
 from app.models.channel import (
     Channel, ChannelMember, Message, MessageReaction, PinnedMessage, ChannelInvite,
     ChannelTypeEnum, ChannelRoleEnum, MessageTypeEnum, CreatorRoleEnum
@@ -16,6 +20,20 @@ from app.schemas import (
     ChannelSearchParams, MessageQueryParams
 )
 
+logger = logging.getLogger(__name__)
+
+# Called with (channel_id, member_id, is_member) once a membership change is
+# committed; member_id is None when the change applies to every member
+membership_listeners: List[Callable[[UUID, Optional[UUID], bool], None]] = []
+
+def notify_membership_change(channel_id: UUID, member_id: Optional[UUID], is_member: bool):
+    """Tell listeners (the WebSocket manager) that a membership changed"""
+    for listener in membership_listeners:
+        try:
+            listener(channel_id, member_id, is_member)
+        except Exception as e:
+            logger.error(f"Error in membership listener: {e}")
+
 class ChannelRepository:
     def __init__(self, db: Session):
         self.db = db
@@ -77,22 +95,40 @@ class ChannelRepository:
 
         self.db.delete(db_channel)
         self.db.commit()
+        notify_membership_change(channel_id, None, False)
         return True
 
-    def search_channels(self, params: ChannelSearchParams, user_id: UUID) -> Tuple[List[Channel], int]:
-        """Search channels with filters"""
+    def search_channels(
+        self,
+        params: ChannelSearchParams,
+        user_id: UUID,
+        cursor: Optional[Tuple[Any, UUID]] = None,
+        offset: int = 0,
+        include_total: bool = True
+    ) -> Tuple[List[Tuple[Channel, Any]], Optional[int], bool]:
+        """Search channels visible to the user
+
+        With a query, channels are ranked by full-text relevance of name and
+        description (an exact tag match counts as a strong hit); without one
+        they come newest first. Returns (channel, sort key) pairs so the
+        caller can build a keyset cursor, the total if requested, and whether
+        more rows follow the (sort key, id) cursor or offset.
+        """
         query = self.db.query(Channel)
-        
-        # Apply filters
+        sort_key = Channel.created_at
+
         if params.query:
-            query = query.filter(
-                or_(
-                    Channel.name.ilike(f"%{params.query}%"),
-                    Channel.description.ilike(f"%{params.query}%"),
-                    func.array_to_string(Channel.tags, ',').ilike(f"%{params.query}%")
-                )
-            )
-        
+            # Served by the GIN indexes on search_vector and lower_text_array(tags)
+            tag_match = self._lower_tags().contains(array([cast(params.query.lower(), Text)]))
+            text_query = self._prefix_tsquery(params.query)
+            rank = case((tag_match, 1.0), else_=0.0)
+            if text_query is not None:
+                query = query.filter(or_(Channel.search_vector.op("@@")(text_query), tag_match))
+                rank = func.ts_rank_cd(Channel.search_vector, text_query) + rank
+            else:
+                query = query.filter(tag_match)
+            sort_key = cast(rank, Float)
+
         if params.channel_type:
             query = query.filter(Channel.channel_type == params.channel_type)
         
@@ -100,8 +136,8 @@ class ChannelRepository:
             query = query.filter(Channel.is_private == params.is_private)
         
         if params.tags:
-            for tag in params.tags:
-                query = query.filter(func.array_to_string(Channel.tags, ',').ilike(f"%{tag}%"))
+            # Every requested tag, case-insensitively, as one containment check on the GIN index
+            query = query.filter(self._lower_tags().contains(array([cast(tag.lower(), Text) for tag in params.tags])))
         
         # Only show public channels or channels user is member of
         query = query.filter(
@@ -115,17 +151,48 @@ class ChannelRepository:
             )
         )
         
-        # Order by creation date
-        query = query.order_by(desc(Channel.created_at))
+        total = query.count() if include_total else None
         
-        # Get total count
-        total = query.count()
+        # Seek past the last row of the previous page
+        if cursor:
+            query = query.filter(tuple_(sort_key, Channel.id) < tuple_(*cursor))
         
-        # Apply pagination
-        offset = (params.page - 1) * params.per_page
-        channels = query.offset(offset).limit(params.per_page).all()
+        rows = query.add_columns(sort_key).order_by(desc(sort_key), desc(Channel.id))\
+            .offset(offset).limit(params.per_page + 1).all()
+        has_next = len(rows) > params.per_page
         
-        return channels, total
+        return [tuple(row) for row in rows[:params.per_page]], total, has_next
+
+    def _lower_tags(self):
+        return func.lower_text_array(Channel.tags, type_=ARRAY(Text))
+
+    def _prefix_tsquery(self, query: str):
+        """Match every word of query as a prefix, so results update while the user types"""
+        words = re.findall(r"[^\W_]+", query.lower())
+        if not words:
+            return None
+        return func.to_tsquery("english", " & ".join(f"{word}:*" for word in words))
+
+    def get_member_counts(self, channel_ids: List[UUID]) -> Dict[UUID, int]:
+        """Member count of many channels in one query"""
+        if not channel_ids:
+            return {}
+        rows = self.db.query(ChannelMember.channel_id, func.count(ChannelMember.id))\
+            .filter(ChannelMember.channel_id.in_(channel_ids))\
+            .group_by(ChannelMember.channel_id)
+        return {channel_id: count for channel_id, count in rows}
+
+    def get_user_memberships(self, channel_ids: List[UUID], user_id: UUID) -> Dict[UUID, ChannelMember]:
+        """The user's membership rows for many channels in one query, keyed by channel"""
+        if not channel_ids:
+            return {}
+        members = self.db.query(ChannelMember).filter(
+            and_(
+                ChannelMember.channel_id.in_(channel_ids),
+                ChannelMember.member_id == user_id
+            )
+        )
+        return {member.channel_id: member for member in members}
 
     def get_user_channels(self, user_id: UUID, page: int = 1, per_page: int = 20) -> Tuple[List[Channel], int]:
         """Get channels user is member of"""
@@ -188,6 +255,7 @@ class ChannelRepository:
         self.db.add(db_member)
         self.db.commit()
         self.db.refresh(db_member)
+        notify_membership_change(channel_id, member_id, not db_member.is_banned)
         return db_member
 
     def remove_member(self, channel_id: UUID, member_id: UUID) -> bool:
@@ -204,6 +272,7 @@ class ChannelRepository:
         
         self.db.delete(db_member)
         self.db.commit()
+        notify_membership_change(channel_id, member_id, False)
         return True
 
     def update_member(self, channel_id: UUID, member_id: UUID, member_data: ChannelMemberUpdate) -> Optional[ChannelMember]:
@@ -224,6 +293,8 @@ class ChannelRepository:
         
         self.db.commit()
         self.db.refresh(db_member)
+        if "is_banned" in update_data:
+            notify_membership_change(channel_id, member_id, not db_member.is_banned)
         return db_member
 
     def get_channel_members(self, channel_id: UUID) -> List[ChannelMember]:
@@ -282,8 +353,55 @@ class ChannelRepository:
         self.db.refresh(db_message)
         return db_message
 
-    def get_messages(self, channel_id: UUID, params: MessageQueryParams) -> Tuple[List[Message], int]:
-        """Get messages for channel with pagination"""
+    def get_members_by_pairs(self, pairs: List[Tuple[UUID, UUID]]) -> Dict[Tuple[UUID, UUID], ChannelMember]:
+        """Get channel members for several (channel_id, member_id) pairs in one query"""
+        if not pairs:
+            return {}
+        members = self.db.query(ChannelMember).filter(
+            tuple_(ChannelMember.channel_id, ChannelMember.member_id).in_(set(pairs))
+        ).all()
+        return {(member.channel_id, member.member_id): member for member in members}
+
+    def create_messages(self, messages: List[Message]) -> List[Message]:
+        """Insert several messages in one transaction"""
+        self.db.add_all(messages)
+        self.db.commit()
+        return messages
+
+    def get_messages(self, channel_id: UUID, params: MessageQueryParams, include_total: bool = True) -> Tuple[List[Message], Optional[int], bool]:
+        """Get messages for channel with OFFSET pagination"""
+        query = self._message_history_query(channel_id, params)
+        
+        # Get total count
+        total = query.count() if include_total else None
+        
+        # Apply pagination, fetching one extra row to know if another page exists
+        offset = (params.page - 1) * params.per_page
+        messages = query.offset(offset).limit(params.per_page + 1).all()
+        has_next = len(messages) > params.per_page
+        
+        return messages[:params.per_page], total, has_next
+
+    def get_messages_before_cursor(
+        self,
+        channel_id: UUID,
+        params: MessageQueryParams,
+        cursor: Optional[Tuple[datetime, UUID]] = None
+    ) -> Tuple[List[Message], bool]:
+        """Get messages for channel older than the (created_at, id) cursor"""
+        query = self._message_history_query(channel_id, params)
+        
+        # Seek past the last row of the previous page using the composite index
+        if cursor:
+            query = query.filter(tuple_(Message.created_at, Message.id) < tuple_(*cursor))
+        
+        messages = query.limit(params.per_page + 1).all()
+        has_next = len(messages) > params.per_page
+        
+        return messages[:params.per_page], has_next
+
+    def _message_history_query(self, channel_id: UUID, params: MessageQueryParams):
+        """Base query for channel history, newest first"""
         query = self.db.query(Message).filter(Message.channel_id == channel_id)
         
         # Apply time filters
@@ -292,17 +410,8 @@ class ChannelRepository:
         if params.after:
             query = query.filter(Message.created_at > params.after)
         
-        # Order by creation date (newest first)
-        query = query.order_by(desc(Message.created_at))
-        
-        # Get total count
-        total = query.count()
-        
-        # Apply pagination
-        offset = (params.page - 1) * params.per_page
-        messages = query.offset(offset).limit(params.per_page).all()
-        
-        return messages, total
+        # Order by creation date (newest first), id breaks ties
+        return query.order_by(desc(Message.created_at), desc(Message.id))
 
     def get_message(self, message_id: UUID) -> Optional[Message]:
         """Get message by ID"""
@@ -311,6 +420,26 @@ class ChannelRepository:
             selectinload(Message.reply_to)
         ).filter(Message.id == message_id).first()
 
+    def get_messages_by_ids(self, message_ids: List[UUID]) -> List[Message]:
+        """Get many messages by ID in one query"""
+        if not message_ids:
+            return []
+        return self.db.query(Message).filter(Message.id.in_(message_ids)).all()
+
+    def get_reactions_for_messages(self, message_ids: List[UUID]) -> Dict[UUID, List[MessageReaction]]:
+        """Get reactions for many messages in one query, grouped by message ID"""
+        reactions_by_message: Dict[UUID, List[MessageReaction]] = {}
+        if not message_ids:
+            return reactions_by_message
+        
+        reactions = self.db.query(MessageReaction).filter(
+            MessageReaction.message_id.in_(message_ids)
+        ).order_by(asc(MessageReaction.created_at)).all()
+        
+        for reaction in reactions:
+            reactions_by_message.setdefault(reaction.message_id, []).append(reaction)
+        return reactions_by_message
+
     def update_message(self, message_id: UUID, message_data: MessageUpdate, user_id: UUID) -> Optional[Message]:
         """Update message"""
         db_message = self.get_message(message_id)
@@ -322,7 +451,7 @@ class ChannelRepository:
             setattr(db_message, field, value)
         
         db_message.is_edited = True
-        db_message.edited_at = datetime.now(datetime.timezone.utc)
+        db_message.edited_at = utc_now()
         
         self.db.commit()
         self.db.refresh(db_message)
@@ -431,7 +560,7 @@ class ChannelRepository:
     def get_pinned_messages(self, channel_id: UUID) -> List[PinnedMessage]:
         """Get all pinned messages for a channel"""
         return self.db.query(PinnedMessage).options(
-            selectinload(PinnedMessage.message).selectinload(Message.reactions)
+            selectinload(PinnedMessage.message)
         ).filter(PinnedMessage.channel_id == channel_id).order_by(desc(PinnedMessage.pinned_at)).all()
 
     # Channel Invites
@@ -466,7 +595,7 @@ class ChannelRepository:
         invite = self.db.query(ChannelInvite).filter(ChannelInvite.id == invite_id).first()
         if invite:
             invite.status = status
-            invite.updated_at = datetime.now(timezone.utc)
+            invite.updated_at = utc_now()
             self.db.commit()
             return True
         return False
@@ -489,7 +618,7 @@ class ChannelRepository:
         total_members = self.db.query(ChannelMember).filter(ChannelMember.channel_id == channel_id).count()
         
         # Messages today
-        today = datetime.now(datetime.timezone.utc).date()
+        today = utc_now().date()
         messages_today = self.db.query(Message).filter(
             and_(
                 Message.channel_id == channel_id,
@@ -498,7 +627,7 @@ class ChannelRepository:
         ).count()
         
         # Messages this week
-        week_ago = datetime.now(datetime.timezone.utc) - timedelta(days=7)
+        week_ago = utc_now() - timedelta(days=7)
         messages_this_week = self.db.query(Message).filter(
             and_(
                 Message.channel_id == channel_id,
@@ -525,6 +654,6 @@ class ChannelRepository:
         if not db_member:
             return False
         
-        db_member.last_read_at = datetime.now(timezone.utc)
+        db_member.last_read_at = utc_now()
         self.db.commit()
         return True
\ No newline at end of file
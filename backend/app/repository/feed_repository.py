@@ -1,8 +1,9 @@
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_, desc, asc, func
-from typing import List, Optional, Tuple
+from sqlalchemy import and_, or_, desc, asc, func, case, select
+from sqlalchemy.exc import IntegrityError
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
-from datetime import datetime
+from app.database import utc_now
 from app.models import CampusFeed, FeedLike, FeedComment, FeedShare, Students, Professors
 from app.schemas import FeedCreate, FeedUpdate, FeedFilter, FeedQueryParams
 
@@ -28,15 +29,8 @@ class FeedRepository:
         return feed
 
     def get_feed_by_id(self, feed_id: UUID) -> Optional[CampusFeed]:
-        """Get a single feed by ID with all relationships"""
+        """Get a single feed by ID"""
         return self.db.query(CampusFeed)\
-            .options(
-                joinedload(CampusFeed.author_student),
-                joinedload(CampusFeed.author_professor),
-                joinedload(CampusFeed.likes),
-                joinedload(CampusFeed.comments),
-                joinedload(CampusFeed.shares)
-            )\
             .filter(CampusFeed.id == feed_id)\
             .first()
 
@@ -48,15 +42,9 @@ class FeedRepository:
     ) -> Tuple[List[CampusFeed], int]:
         """Get paginated feeds with filtering and sorting"""
         
-        # Base query
-        query = self.db.query(CampusFeed)\
-            .options(
-                joinedload(CampusFeed.author_student),
-                joinedload(CampusFeed.author_professor),
-                joinedload(CampusFeed.likes),
-                joinedload(CampusFeed.comments),
-                joinedload(CampusFeed.shares)
-            )
+        # Base query (engagement counts live on the feed row itself and
+        # authors come from the user directory, so no relationships are loaded)
+        query = self.db.query(CampusFeed)
 
         # Apply filters
         if query_params.filter:
@@ -80,13 +68,8 @@ class FeedRepository:
                 filters.append(CampusFeed.tags.contains(query_params.filter.tags))
             
             if query_params.filter.search:
-                search_term = f"%{query_params.filter.search}%"
-                filters.append(
-                    or_(
-                        CampusFeed.title.ilike(search_term),
-                        CampusFeed.content.ilike(search_term)
-                    )
-                )
+                # Served by the GIN index on search_vector
+                filters.append(CampusFeed.search_vector.op("@@")(self._search_query(query_params.filter.search)))
             
             if query_params.filter.is_pinned is not None:
                 filters.append(CampusFeed.is_pinned == query_params.filter.is_pinned)
@@ -103,8 +86,15 @@ class FeedRepository:
             if filters:
                 query = query.filter(and_(*filters))
 
-        # Apply sorting
-        sort_column = getattr(CampusFeed, query_params.sort_by)
+        # Apply sorting; relevance only means something for a text search
+        search = query_params.filter.search if query_params.filter else None
+        if query_params.sort_by == "relevance":
+            if search:
+                sort_column = func.ts_rank_cd(CampusFeed.search_vector, self._search_query(search))
+            else:
+                sort_column = CampusFeed.created_at
+        else:
+            sort_column = getattr(CampusFeed, query_params.sort_by)
         if query_params.sort_order == "desc":
             query = query.order_by(desc(sort_column))
         else:
@@ -122,6 +112,10 @@ class FeedRepository:
 
         return feeds, total
 
+    def _search_query(self, search: str):
+        """Parse search like a web search box: words, "quoted phrases", or, -excluded"""
+        return func.websearch_to_tsquery("english", search)
+
     def update_feed(self, feed_id: UUID, feed_data: FeedUpdate) -> Optional[CampusFeed]:
         """Update an existing feed"""
         feed = self.db.query(CampusFeed).filter(CampusFeed.id == feed_id).first()
@@ -132,7 +126,7 @@ class FeedRepository:
         for field, value in update_data.items():
             setattr(feed, field, value)
         
-        feed.updated_at = datetime.now(datetime.timezone.utc)
+        feed.updated_at = utc_now()
         self.db.commit()
         self.db.refresh(feed)
         return feed
@@ -163,6 +157,7 @@ class FeedRepository:
         if existing_like:
             # Unlike
             self.db.delete(existing_like)
+            self._adjust_counter(feed_id, CampusFeed.likes_count, -1)
             self.db.commit()
             return False
         else:
@@ -177,6 +172,13 @@ class FeedRepository:
             
             like = FeedLike(**like_data)
             self.db.add(like)
+            try:
+                self.db.flush()
+            except IntegrityError:
+                # A concurrent request liked it first; the unique index kept one row
+                self.db.rollback()
+                return True
+            self._adjust_counter(feed_id, CampusFeed.likes_count, 1)
             self.db.commit()
             return True
 
@@ -196,6 +198,7 @@ class FeedRepository:
         
         comment = FeedComment(**comment_data)
         self.db.add(comment)
+        self._adjust_counter(feed_id, CampusFeed.comments_count, 1)
         self.db.commit()
         self.db.refresh(comment)
         return comment
@@ -213,22 +216,63 @@ class FeedRepository:
         
         share = FeedShare(**share_data)
         self.db.add(share)
+        self._adjust_counter(feed_id, CampusFeed.shares_count, 1)
         self.db.commit()
         self.db.refresh(share)
         return share
 
-    def get_feed_stats(self, feed_id: UUID) -> dict:
-        """Get feed statistics"""
-        likes_count = self.db.query(FeedLike).filter(FeedLike.feed_id == feed_id).count()
-        comments_count = self.db.query(FeedComment).filter(FeedComment.feed_id == feed_id).count()
-        shares_count = self.db.query(FeedShare).filter(FeedShare.feed_id == feed_id).count()
-        
+    def _adjust_counter(self, feed_id: UUID, column, delta: int) -> None:
+        """Increment an engagement counter in the same transaction as the row change"""
+        new_value = column + delta
+        self.db.query(CampusFeed)\
+            .filter(CampusFeed.id == feed_id)\
+            .update(
+                {
+                    column: case((new_value < 0, 0), else_=new_value),
+                    # Engagement is not an edit, keep updated_at untouched
+                    CampusFeed.updated_at: CampusFeed.updated_at
+                },
+                synchronize_session=False
+            )
+
+    def _counter_subqueries(self) -> dict:
+        """Correlated COUNT subqueries matching each engagement counter column"""
         return {
-            "likes_count": likes_count,
-            "comments_count": comments_count,
-            "shares_count": shares_count
+            CampusFeed.likes_count: select(func.count(FeedLike.id))
+                .where(FeedLike.feed_id == CampusFeed.id)
+                .scalar_subquery(),
+            CampusFeed.comments_count: select(func.count(FeedComment.id))
+                .where(FeedComment.feed_id == CampusFeed.id)
+                .scalar_subquery(),
+            CampusFeed.shares_count: select(func.count(FeedShare.id))
+                .where(FeedShare.feed_id == CampusFeed.id)
+                .scalar_subquery()
         }
 
+    def find_counter_drift(self, limit: Optional[int] = None) -> List[UUID]:
+        """Get IDs of feeds whose stored counters disagree with the engagement tables"""
+        drift_filters = [
+            column != actual for column, actual in self._counter_subqueries().items()
+        ]
+        query = self.db.query(CampusFeed.id).filter(or_(*drift_filters))
+        if limit:
+            query = query.limit(limit)
+        return [feed_id for (feed_id,) in query.all()]
+
+    def recalculate_counters(self, feed_ids: Optional[List[UUID]] = None) -> int:
+        """Recompute engagement counters from the engagement tables"""
+        query = self.db.query(CampusFeed)
+        if feed_ids is not None:
+            if not feed_ids:
+                return 0
+            query = query.filter(CampusFeed.id.in_(feed_ids))
+
+        values = self._counter_subqueries()
+        values[CampusFeed.updated_at] = CampusFeed.updated_at
+        updated = query.update(values, synchronize_session=False)
+        self.db.commit()
+        return updated
+
     def get_user_feed_interactions(self, feed_id: UUID, user_id: UUID, user_type: str) -> dict:
         """Get user's interactions with a specific feed"""
         is_liked = self.db.query(FeedLike).filter(
@@ -255,3 +299,28 @@ class FeedRepository:
             "is_liked": is_liked,
             "is_shared": is_shared
         }
+
+    def get_user_feed_interactions_bulk(self, feed_ids: List[UUID], user_id: UUID, user_type: str) -> Dict[UUID, dict]:
+        """Get user's interactions with many feeds with one query per interaction type"""
+        interactions = {
+            feed_id: {"is_liked": False, "is_shared": False}
+            for feed_id in feed_ids
+        }
+        if not feed_ids or user_type not in ("student", "professor"):
+            return interactions
+
+        for model, key in ((FeedLike, "is_liked"), (FeedShare, "is_shared")):
+            user_column = model.student_id if user_type == "student" else model.professor_id
+            rows = self.db.query(model.feed_id)\
+                .filter(
+                    and_(
+                        model.feed_id.in_(feed_ids),
+                        user_column == user_id
+                    )
+                )\
+                .distinct()\
+                .all()
+            for (feed_id,) in rows:
+                interactions[feed_id][key] = True
+
+        return interactions
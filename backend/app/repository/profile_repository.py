@@ -4,6 +4,10 @@ from typing import List, Optional, Tuple
 from uuid import UUID
 from app.models.user import Students, Professors, StudentProfile, Website
 from app.schemas import StudentProfileCreate, StudentProfileUpdate, WebsiteCreate, WebsiteUpdate
+from app.utils.user_directory import invalidate_user
+from app.utils.auth import invalidate_principal
+from app.repository.student_search import StudentSearch
+from app.repository.user_repository import normalize_department
 
 class ProfileRepository:
     def __init__(self, db: Session):
@@ -117,12 +121,21 @@ class ProfileRepository:
         if not db_student:
             return None
 
+        # Students authenticate by usn, so the old subject must be dropped too
+        previous_usn = db_student.usn
+
+        if "department" in update_data:
+            update_data["department"] = normalize_department(update_data["department"])
+
         for field, value in update_data.items():
             if hasattr(db_student, field):
                 setattr(db_student, field, value)
 
         self.db.commit()
         self.db.refresh(db_student)
+        invalidate_user("student", student_id)
+        invalidate_principal("student", previous_usn)
+        invalidate_principal("student", db_student.usn)
         return db_student
 
     # Professor Operations
@@ -136,12 +149,21 @@ class ProfileRepository:
         if not db_professor:
             return None
 
+        # Professors authenticate by email, so the old subject must be dropped too
+        previous_email = db_professor.email
+
+        if "department" in update_data:
+            update_data["department"] = normalize_department(update_data["department"])
+
         for field, value in update_data.items():
             if hasattr(db_professor, field):
                 setattr(db_professor, field, value)
 
         self.db.commit()
         self.db.refresh(db_professor)
+        invalidate_user("professor", professor_id)
+        invalidate_principal("professor", previous_email)
+        invalidate_principal("professor", db_professor.email)
         return db_professor
 
     # Profile Statistics
@@ -202,24 +224,9 @@ class ProfileRepository:
 
     # Search and Filter
     def search_students(self, query: str, limit: int = 20) -> List[Students]:
-        """Search students by name, email, or skills"""
-        search_filter = or_(
-            Students.name.ilike(f"%{query}%"),
-            Students.email.ilike(f"%{query}%"),
-            func.array_to_string(StudentProfile.skills, ',').ilike(f"%{query}%")
-        )
-
-        return self.db.query(Students).join(StudentProfile, isouter=True).filter(
-            search_filter
-        ).options(
-            joinedload(Students.profile).joinedload(StudentProfile.websites)
-        ).limit(limit).all()
+        """Search students by name, email, or skills, best match first"""
+        return StudentSearch(self.db).search(query, limit)
 
     def get_students_by_skill(self, skill: str, limit: int = 20) -> List[Students]:
         """Get students by specific skill"""
-        return self.db.query(Students).join(StudentProfile).filter(
-            func.array_to_string(StudentProfile.skills, ',').ilike(f"%{skill}%")
-        ).options(
-            joinedload(Students.profile).joinedload(StudentProfile.websites)
-        ).limit(limit).all()
-
+        return StudentSearch(self.db).by_skill(skill, limit)
@@ -0,0 +1,66 @@
+"""Repository for cached resume analyses."""
+
+from sqlalchemy.orm import Session
+from sqlalchemy import delete, func, select
+from datetime import timedelta
+from typing import Optional
+
+from app.database import utc_now
+from app.models.resume import ResumeAnalysisCacheEntry
+
+class ResumeCacheRepository:
+    """Stores resume analyses by content key with a TTL and an LRU size bound"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_fresh(self, key: str, ttl_seconds: float) -> Optional[ResumeAnalysisCacheEntry]:
+        """The entry for key if it is younger than the TTL, marking it used"""
+        entry = self.db.get(ResumeAnalysisCacheEntry, key)
+        if entry is None:
+            return None
+
+        now = utc_now()
+        if entry.created_at < now - timedelta(seconds=ttl_seconds):
+            self.db.delete(entry)
+            self.db.commit()
+            return None
+
+        entry.hits += 1
+        entry.last_used_at = now
+        self.db.commit()
+        return entry
+
+    def put(self, key: str, prompt_version: str, result: dict, generation_ms: float) -> None:
+        """Insert or refresh the entry for key"""
+        now = utc_now()
+        entry = self.db.get(ResumeAnalysisCacheEntry, key)
+        if entry is None:
+            entry = ResumeAnalysisCacheEntry(key=key, hits=0)
+            self.db.add(entry)
+        entry.prompt_version = prompt_version
+        entry.result = result
+        entry.generation_ms = generation_ms
+        entry.created_at = now
+        entry.last_used_at = now
+        self.db.commit()
+
+    def evict(self, ttl_seconds: float, max_entries: int) -> int:
+        """Drop expired entries, then the least recently used beyond max_entries"""
+        cutoff = utc_now() - timedelta(seconds=ttl_seconds)
+        removed = self.db.execute(
+            delete(ResumeAnalysisCacheEntry).where(ResumeAnalysisCacheEntry.created_at < cutoff)
+        ).rowcount
+
+        excess = self.db.scalar(select(func.count()).select_from(ResumeAnalysisCacheEntry)) - max_entries
+        if excess > 0:
+            oldest = select(ResumeAnalysisCacheEntry.key)\
+                .order_by(ResumeAnalysisCacheEntry.last_used_at)\
+                .limit(excess)\
+                .scalar_subquery()
+            removed += self.db.execute(
+                delete(ResumeAnalysisCacheEntry).where(ResumeAnalysisCacheEntry.key.in_(oldest))
+            ).rowcount
+
+        self.db.commit()
+        return removed
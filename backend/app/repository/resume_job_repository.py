@@ -0,0 +1,43 @@
+"""Repository for resume analysis jobs."""
+
+from sqlalchemy.orm import Session
+from typing import Optional
+from uuid import UUID
+
+from app.database import utc_now
+from app.models.resume import ResumeAnalysisJob
+
+class ResumeJobRepository:
+    """Persists resume analysis jobs so any worker process can answer a poll"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def create_job(self, student_id: UUID, filename: Optional[str]) -> ResumeAnalysisJob:
+        job = ResumeAnalysisJob(student_id=student_id, filename=filename, status="queued")
+        self.db.add(job)
+        self.db.commit()
+        self.db.refresh(job)
+        return job
+
+    def get_job(self, job_id: UUID, student_id: UUID) -> Optional[ResumeAnalysisJob]:
+        """A student's job; other students' jobs are reported as missing"""
+        return self.db.query(ResumeAnalysisJob).filter(
+            ResumeAnalysisJob.id == job_id,
+            ResumeAnalysisJob.student_id == student_id
+        ).first()
+
+    def mark_running(self, job_id: UUID) -> None:
+        self._update(job_id, status="running", started_at=utc_now())
+
+    def mark_completed(self, job_id: UUID, result: dict) -> None:
+        self._update(job_id, status="completed", result=result, finished_at=utc_now())
+
+    def mark_failed(self, job_id: UUID, error: str) -> None:
+        self._update(job_id, status="failed", error=error, finished_at=utc_now())
+
+    def _update(self, job_id: UUID, **values) -> None:
+        self.db.query(ResumeAnalysisJob)\
+            .filter(ResumeAnalysisJob.id == job_id)\
+            .update(values, synchronize_session=False)
+        self.db.commit()
@@ -0,0 +1,139 @@
+"""Ranked student search by name, email and skills.
+
+On PostgreSQL matching runs on indexes: pg_trgm GIN indexes answer the
+name/email ILIKE '%q%' filters and a GIN index on lower_text_array(skills)
+answers exact, case-insensitive skill matches, so latency depends on the
+number of matches rather than the number of students. Results are ranked
+by trigram similarity of name/email to the query, with exact skill matches
+first.
+
+Skills match only as whole values: "python" finds "Python" but "pyth" does
+not, unlike the substring match used before these indexes.
+
+Other databases (SQLite test runs) use a pure-Python implementation with the
+same matching rules and a port of pg_trgm's similarity() for ranking.
+"""
+
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import Text, case, cast, func, or_, select, union
+from sqlalchemy.dialects.postgresql import ARRAY, array
+from typing import Dict, FrozenSet, List
+from uuid import UUID
+import re
+
+from app.models.user import Students, StudentProfile
+
+_WORD = re.compile(r"[^\W_]+")
+
+def trigrams(value: str) -> FrozenSet[str]:
+    """Trigrams of value as pg_trgm extracts them: per lowercased word, padded "  word " """
+    grams = set()
+    for word in _WORD.findall(value.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+def similarity(a: str, b: str) -> float:
+    """pg_trgm similarity(): shared trigrams over all distinct trigrams of both strings"""
+    first, second = trigrams(a), trigrams(b)
+    if not first or not second:
+        return 0.0
+    shared = len(first & second)
+    return shared / (len(first) + len(second) - shared)
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+class StudentSearch:
+    """Ranked student lookups, indexed on PostgreSQL and in-process elsewhere"""
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.indexed = db.get_bind().dialect.name == "postgresql"
+
+    def search(self, query: str, limit: int = 20) -> List[Students]:
+        """Students whose name or email contains query, or who list it as a skill, best match first"""
+        query = query.strip()
+        if not query:
+            return []
+        if self.indexed:
+            return self._search_indexed(query, limit)
+        return self._search_python(query, limit)
+
+    def by_skill(self, skill: str, limit: int = 20) -> List[Students]:
+        """Students listing skill (case-insensitive exact match), by name"""
+        skill = skill.strip()
+        if not skill:
+            return []
+        if self.indexed:
+            student_ids = select(StudentProfile.student_id).where(self._has_skill(skill))
+            return self._load(
+                self.db.query(Students).filter(Students.id.in_(student_ids))
+                .order_by(Students.name, Students.id).limit(limit)
+            )
+
+        wanted = skill.lower()
+        rows = self.db.query(Students.id, Students.name, StudentProfile.skills).join(StudentProfile).all()
+        matches = sorted(
+            (row for row in rows if wanted in {value.lower() for value in row.skills or []}),
+            key=lambda row: (row.name, str(row.id))
+        )
+        return self._load_ordered([row.id for row in matches[:limit]])
+
+    def _has_skill(self, skill: str):
+        # Same expression as the ix_student_profiles_skills_lower GIN index
+        lowered = func.lower_text_array(StudentProfile.skills, type_=ARRAY(Text))
+        return lowered.contains(array([cast(skill.lower(), Text)]))
+
+    def _search_indexed(self, query: str, limit: int) -> List[Students]:
+        pattern = f"%{_escape_like(query)}%"
+        # Separate branches so each side of the OR can use its own index
+        matched = union(
+            select(Students.id).where(or_(
+                Students.name.ilike(pattern, escape="\\"),
+                Students.email.ilike(pattern, escape="\\")
+            )),
+            select(StudentProfile.student_id).where(self._has_skill(query))
+        ).subquery()
+
+        rank = func.greatest(
+            func.similarity(Students.name, query),
+            func.similarity(Students.email, query)
+        ) + case((self._has_skill(query), 1.0), else_=0.0)
+
+        return self._load(
+            self.db.query(Students)
+            .outerjoin(StudentProfile)
+            .filter(Students.id.in_(select(matched.c.id)))
+            .order_by(rank.desc(), Students.name, Students.id)
+            .limit(limit)
+        )
+
+    def _search_python(self, query: str, limit: int) -> List[Students]:
+        needle = query.lower()
+        rows = self.db.query(Students.id, Students.name, Students.email, StudentProfile.skills)\
+            .outerjoin(StudentProfile).all()
+
+        scored = []
+        for row in rows:
+            skill_match = needle in {value.lower() for value in row.skills or []}
+            if not (skill_match or needle in row.name.lower() or needle in row.email.lower()):
+                continue
+            rank = max(similarity(row.name, query), similarity(row.email, query)) + (1.0 if skill_match else 0.0)
+            scored.append((-rank, row.name, str(row.id), row.id))
+
+        scored.sort()
+        return self._load_ordered([student_id for *_, student_id in scored[:limit]])
+
+    def _load(self, query) -> List[Students]:
+        return query.options(joinedload(Students.profile).joinedload(StudentProfile.websites)).all()
+
+    def _load_ordered(self, student_ids: List[UUID]) -> List[Students]:
+        """Load students with their profiles, keeping the given order"""
+        if not student_ids:
+            return []
+        students: Dict[UUID, Students] = {
+            student.id: student
+            for student in self._load(self.db.query(Students).filter(Students.id.in_(student_ids)))
+        }
+        return [students[student_id] for student_id in student_ids if student_id in students]
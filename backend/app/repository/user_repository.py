@@ -1,12 +1,26 @@
 """Repository for user database operations."""
 
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import select, func, or_, literal, tuple_
 from app.schemas import CreateStudent, CreateProfessor, CreateStudentProfile
 from app.models import Students, Professors, StudentProfile, Website
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from uuid import UUID
-from app.utils import hash_password
+from app.utils.user_directory import invalidate_user
+import re
+
+# VTU-style USN: region, college code, admission year, branch code, roll number (1DB22IS001)
+USN_PATTERN = re.compile(r"^\d[A-Z]{2}\d{2}([A-Z]{2})\d{3}$")
+
+def normalize_department(department: Optional[str]) -> Optional[str]:
+  """Departments are stored as upper-case branch codes (IS, CS, ...) so filters match exactly"""
+  department = (department or "").strip().upper()
+  return department or None
+
+def department_from_usn(usn: str) -> Optional[str]:
+  """Branch code embedded in a USN, or None if the USN is not in the VTU format"""
+  match = USN_PATTERN.match(usn.strip().upper())
+  return match.group(1) if match else None
 
 class StudentRepository:
   """Handles student-related database operations."""
@@ -14,16 +28,19 @@ class StudentRepository:
   def __init__(self, db: Session):
     self.db = db
     
-  def createStudent(self, data: CreateStudent) -> Students:
+  def createStudent(self, data: CreateStudent, password_hash: str) -> Students:
+    """Insert a student; the password is hashed by the caller, off the event loop"""
     student = Students(
       usn = data.usn,
       name = data.name,
       email = data.email,
-      password = hash_password(data.password)
+      password = password_hash,
+      department = normalize_department(data.department) or department_from_usn(data.usn)
     )
     self.db.add(student)
     self.db.commit()
     self.db.refresh(student)
+    invalidate_user("student", student.id)
     return student
       
   def get_student_by_email(self, email: str) -> Optional[Students]:
@@ -41,6 +58,14 @@ class StudentRepository:
   def student_exists_by_email(self, email: str) -> bool:
     """Check if student exists by email"""
     return self.get_student_by_email(email) is not None
+
+  def update_password_hash(self, student_id: UUID, old_hash: str, new_hash: str) -> bool:
+    """Swap in an upgraded hash, unless the password changed since old_hash was read"""
+    updated = self.db.query(Students)\
+      .filter(Students.id == student_id, Students.password == old_hash)\
+      .update({Students.password: new_hash}, synchronize_session=False)
+    self.db.commit()
+    return updated > 0
   
   def create_student_profile(self, data: CreateStudentProfile):
     
@@ -75,15 +100,18 @@ class ProfessorRepository:
   def __init__(self, db: Session):
     self.db = db
     
-  def createProfessor(self, data: CreateProfessor) -> Professors:
+  def createProfessor(self, data: CreateProfessor, password_hash: str) -> Professors:
+    """Insert a professor; the password is hashed by the caller, off the event loop"""
     professor = Professors(
       name = data.name,
       email = data.email,
-      password = hash_password(data.password)
+      password = password_hash,
+      department = normalize_department(data.department)
     )
     self.db.add(professor)
     self.db.commit()
     self.db.refresh(professor)
+    invalidate_user("professor", professor.id)
     return professor
   
   def get_by_email(self, email: str) -> Optional[Professors]:
@@ -94,9 +122,90 @@ class ProfessorRepository:
     query = select(Professors).where(Professors.id == professorId)
     return self.db.execute(query).scalar_one_or_none()
   
+  def update_password_hash(self, professor_id: UUID, old_hash: str, new_hash: str) -> bool:
+    """Swap in an upgraded hash, unless the password changed since old_hash was read"""
+    updated = self.db.query(Professors)\
+      .filter(Professors.id == professor_id, Professors.password == old_hash)\
+      .update({Professors.password: new_hash}, synchronize_session=False)
+    self.db.commit()
+    return updated > 0
+  
   def exists_by_email(self, email: str) -> bool:
     return self.get_by_email(email) is not None
   
   def fetchAllProfessor(self) -> List[Professors]:
     query = select(Professors)
-    return self.db.execute(query).scalars().all()
\ No newline at end of file
+    return self.db.execute(query).scalars().all()
+
+def _escape_like(value: str) -> str:
+  return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+class UserSearchRepository:
+  """Column-projected, keyset-paginated lookup of students and professors for the user pickers."""
+
+  SEARCH_COLUMNS = {
+    "student": ("name", "usn", "email"),
+    "professor": ("name", "email")
+  }
+
+  def __init__(self, db: Session):
+    self.db = db
+
+  def search_users(
+    self,
+    query: Optional[str] = None,
+    role: Optional[str] = None,
+    department: Optional[str] = None,
+    after: Optional[Tuple[str, UUID]] = None,
+    limit: int = 50
+  ) -> Tuple[list, bool]:
+    """Users ordered by (lower(name), id), starting after the given sort key.
+
+    query is a case-insensitive prefix of name, usn or email. Returns the
+    rows (id, name, email, usn, department, role, name_key) and whether more
+    rows follow.
+    """
+    roles = [role] if role else ["student", "professor"]
+    rows = []
+    for user_role in roles:
+      rows.extend(self._search(user_role, query, department, after, limit + 1))
+
+    # Each role's rows are already in order; merging needs at most limit + 1 of them
+    rows.sort(key=lambda row: (row.name_key, row.id))
+    return rows[:limit], len(rows) > limit
+
+  def _search(self, role: str, query: Optional[str], department: Optional[str], after, limit: int) -> list:
+    model = Students if role == "student" else Professors
+    name_key = self._sort_key(model.name)
+    columns = [
+      model.id,
+      model.name,
+      model.email,
+      model.usn if role == "student" else literal(None).label("usn"),
+      model.department,
+      literal(role).label("role"),
+      name_key.label("name_key")
+    ]
+    stmt = select(*columns)
+
+    if query:
+      pattern = _escape_like(query.lower()) + "%"
+      stmt = stmt.where(or_(*(
+        self._sort_key(getattr(model, column)).like(pattern, escape="\\")
+        for column in self.SEARCH_COLUMNS[role]
+      )))
+    department = normalize_department(department)
+    if department:
+      stmt = stmt.where(model.department == department)
+    if after:
+      stmt = stmt.where(tuple_(name_key, model.id) > tuple_(literal(after[0]), literal(after[1], model.id.type)))
+
+    stmt = stmt.order_by(name_key, model.id).limit(limit)
+    return self.db.execute(stmt).all()
+
+  def _sort_key(self, column):
+    """lower(column), in byte order on PostgreSQL so it matches the search indexes and Python sorting"""
+    key = func.lower(column)
+    if self.db.get_bind().dialect.name == "postgresql":
+      key = key.collate("C")
+    return key
@@ -1,11 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, BackgroundTasks, WebSocket
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
 
-from app.database import get_db
+from app.database import get_db, get_async_db
 from app.services.channel_service import ChannelService
+from app.services.async_services import AsyncChannelService
 from app.websocket.channel_websocket import websocket_endpoint
 from app.schemas import (
     ChannelCreate, ChannelUpdate, ChannelResponse, ChannelListResponse,
@@ -17,7 +19,8 @@ from app.schemas import (
     MessageQueryParams, ChannelStats, ChannelNotification,
     ChannelTypeEnum, ChannelRoleEnum, MessageTypeEnum, CreatorRoleEnum
 )
-from app.utils.auth import get_current_user
+from app.utils.auth import get_current_user, get_current_user_async
+from app.utils.responses import FastJSONResponse
 
 router = APIRouter(
     prefix="/channels",
@@ -52,7 +55,7 @@ async def get_user_channels(
     channel_service = ChannelService(db)
     user_id = current_user["user"].id
     
-    return channel_service.get_all_public_channels(user_id, page, per_page)
+    return FastJSONResponse(channel_service.get_all_public_channels(user_id, page, per_page))
 
 @router.get("/search", response_model=ChannelListResponse)
 async def search_channels(
@@ -62,10 +65,17 @@ async def search_channels(
     tags: Optional[List[str]] = Query(None),
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, max_length=200),
+    include_total: Optional[bool] = None,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
-    """Search channels"""
+    """Search channels
+
+    Results are ranked by relevance when `query` is given, newest first
+    otherwise. Pass `cursor` (empty for the first page, then each response's
+    `next_cursor`) to page by keyset instead of offset.
+    """
     channel_service = ChannelService(db)
     user_id = current_user["user"].id
     
@@ -75,10 +85,15 @@ async def search_channels(
         is_private=is_private,
         tags=tags,
         page=page,
-        per_page=per_page
+        per_page=per_page,
+        cursor=cursor,
+        include_total=include_total
     )
     
-    return channel_service.search_channels(params, user_id)
+    try:
+        return FastJSONResponse(channel_service.search_channels(params, user_id))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.get("/{channel_id}", response_model=ChannelResponse)
 async def get_channel(
@@ -269,24 +284,34 @@ async def get_messages(
     per_page: int = Query(50, ge=1, le=100),
     before: Optional[datetime] = None,
     after: Optional[datetime] = None,
-    db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    cursor: Optional[str] = Query(None, max_length=200),
+    include_total: Optional[bool] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user_async)
 ):
-    """Get channel messages"""
-    channel_service = ChannelService(db)
+    """Get channel messages
+
+    Pass `cursor` (empty for the newest page, then each response's
+    `next_cursor`) to page through history by keyset instead of offset.
+    """
+    channel_service = AsyncChannelService(db)
     user_id = current_user["user"].id
     
     params = MessageQueryParams(
         page=page,
         per_page=per_page,
         before=before,
-        after=after
+        after=after,
+        cursor=cursor,
+        include_total=include_total
     )
     
     try:
-        return channel_service.get_messages(channel_id, params, user_id)
+        return FastJSONResponse(await channel_service.get_messages(channel_id, params, user_id))
     except PermissionError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.put("/{channel_id}/messages/{message_id}", response_model=MessageResponse)
 async def update_message(
@@ -416,15 +441,15 @@ async def unpin_message(
 @router.get("/{channel_id}/pinned", response_model=List[PinnedMessageResponse])
 async def get_pinned_messages(
     channel_id: UUID,
-    db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user_async)
 ):
     """Get pinned messages"""
-    channel_service = ChannelService(db)
+    channel_service = AsyncChannelService(db)
     user_id = current_user["user"].id
     
     try:
-        return channel_service.get_pinned_messages(channel_id, user_id)
+        return await channel_service.get_pinned_messages(channel_id, user_id)
     except PermissionError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
 
@@ -520,6 +545,6 @@ async def get_channel_stats(
 
 # WebSocket endpoint for real-time messaging
 @router.websocket("/ws")
-async def websocket_route(websocket: WebSocket, token: str, db: Session = Depends(get_db)):
+async def websocket_route(websocket: WebSocket, token: str):
     """WebSocket endpoint for real-time messaging"""
-    await websocket_endpoint(websocket, token, db)
+    await websocket_endpoint(websocket, token)
@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends
-from app.repository import Subject, Resource, ProfessorRepository
+from fastapi import APIRouter, Depends, Query, Request
+from app.repository import Subject, Resource, ProfessorRepository, UserSearchRepository
 from app.database import get_db
 from sqlalchemy.orm import Session
-from app.schemas import FetchProfessor
-from app.models import Students
-from typing import List
+from app.schemas import FetchProfessor, StudentSummary, StudentListResponse
+from typing import List, Optional
+from app.utils.pagination import encode_cursor
+from app.utils.responses import etag_response
+from app.utils.user_directory import UserDirectory, entry_from_user
+from app.routers.users import parse_user_cursor
+from app.utils.auth import get_current_user
 
 router = APIRouter(
   prefix="",
@@ -26,16 +30,30 @@ def fetchProfessors(db: Session = Depends(get_db)):
   professor = ProfessorRepository(db)
   return professor.fetchAllProfessor()
 
-@router.get("/students")
-def fetchStudents(db: Session = Depends(get_db)):
-  """Fetch all students"""
-  students = db.query(Students).all()
-  return [
-    {
-      "id": student.id,
-      "usn": student.usn,
-      "name": student.name,
-      "email": student.email
-    }
-    for student in students
-  ]
\ No newline at end of file
+@router.get("/students", response_model=StudentListResponse)
+def fetchStudents(
+  request: Request,
+  q: Optional[str] = Query(None, min_length=1, max_length=100, description="Prefix of name, USN or email"),
+  department: Optional[str] = Query(None, max_length=100, description="Department (branch) code, e.g. IS"),
+  cursor: Optional[str] = Query(None, max_length=300),
+  per_page: int = Query(50, ge=1, le=100),
+  db: Session = Depends(get_db),
+  current_user: dict = Depends(get_current_user)
+):
+  """Search students by name, paginated with `cursor` / `next_cursor`; signed-in users only"""
+  after = parse_user_cursor(cursor)
+  rows, has_next = UserSearchRepository(db).search_users(q, "student", department, after, per_page)
+
+  user_directory = UserDirectory(db)
+  for row in rows:
+    user_directory.prime(entry_from_user(row, "student"))
+
+  page = StudentListResponse(
+    students=[
+      StudentSummary(id=row.id, usn=row.usn, name=row.name, email=row.email, department=row.department)
+      for row in rows
+    ],
+    next_cursor=encode_cursor(rows[-1].name_key, rows[-1].id) if has_next else None,
+    has_next=has_next
+  )
+  return etag_response(request, page)
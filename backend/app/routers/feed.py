@@ -1,14 +1,17 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional, List
 from uuid import UUID
-from app.database import get_db
+from app.database import get_db, get_async_db
 from app.services.feed_service import FeedService
+from app.services.async_services import AsyncFeedService
 from app.schemas import (
     FeedCreate, FeedUpdate, FeedResponse, FeedListResponse, 
     CommentCreate, CommentResponse, FeedQueryParams, FeedFilter
 )
-from app.utils.auth import get_current_user
+from app.utils.auth import get_current_user, get_current_user_async
+from app.utils.responses import FastJSONResponse
 
 router = APIRouter(
     prefix="/feeds",
@@ -33,7 +36,7 @@ async def create_feed(
 async def get_feeds(
     page: int = Query(default=1, ge=1),
     per_page: int = Query(default=10, ge=1, le=50),
-    sort_by: str = Query(default="created_at", pattern="^(created_at|updated_at|title|priority)$"),
+    sort_by: str = Query(default="created_at", pattern="^(created_at|updated_at|title|priority|likes_count|comments_count|shares_count|relevance)$"),
     sort_order: str = Query(default="desc", pattern="^(asc|desc)$"),
     feed_type: Optional[str] = Query(default=None, pattern="^(announcement|event|general|academic)$"),
     priority: Optional[str] = Query(default=None, pattern="^(low|normal|high|urgent)$"),
@@ -42,11 +45,11 @@ async def get_feeds(
     search: Optional[str] = Query(default=None),
     is_pinned: Optional[bool] = Query(default=None),
     is_public: Optional[bool] = Query(default=None),
-    db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user_async)
 ):
     """Get paginated campus feeds with filtering and sorting"""
-    feed_service = FeedService(db)
+    feed_service = AsyncFeedService(db)
     
     # Build filter
     feed_filter = FeedFilter(
@@ -70,21 +73,22 @@ async def get_feeds(
     user_id = current_user["user"].id
     user_type = current_user["role"]
     
-    return feed_service.get_feeds_paginated(query_params, user_id, user_type)
+    # Already validated by the service; serialize the model directly
+    return FastJSONResponse(await feed_service.get_feeds_paginated(query_params, user_id, user_type))
 
 @router.get("/{feed_id}", response_model=FeedResponse)
 async def get_feed(
     feed_id: UUID,
-    db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user_async)
 ):
     """Get a single feed by ID"""
-    feed_service = FeedService(db)
+    feed_service = AsyncFeedService(db)
     
     user_id = current_user["user"].id
     user_type = current_user["role"]
     
-    feed = feed_service.get_feed_by_id(feed_id, user_id, user_type)
+    feed = await feed_service.get_feed_by_id(feed_id, user_id, user_type)
     if not feed:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -209,21 +213,21 @@ async def comment_feed(
 @router.get("/{feed_id}/comments", response_model=List[CommentResponse])
 async def get_feed_comments(
     feed_id: UUID,
-    db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user_async)
 ):
     """Get all comments for a feed"""
-    feed_service = FeedService(db)
+    feed_service = AsyncFeedService(db)
     
     # Verify feed exists
-    feed = feed_service.get_feed_by_id(feed_id)
+    feed = await feed_service.get_feed_by_id(feed_id)
     if not feed:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Feed not found"
         )
     
-    return feed_service.get_feed_comments(feed_id)
+    return await feed_service.get_feed_comments(feed_id)
 
 @router.post("/{feed_id}/share")
 async def share_feed(
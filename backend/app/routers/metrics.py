@@ -0,0 +1,75 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+import hmac
+import os
+
+from app.database import all_pool_stats
+from app.services.password_hasher import password_hasher
+from app.services.resume_cache import resume_analysis_cache
+from app.services.resume_extraction import resume_extractor
+from app.services.resume_jobs import resume_jobs
+from app.utils.cache import all_cache_stats
+from app.websocket.channel_websocket import manager
+from app.websocket.message_writer import message_writer
+from app.websocket.outbound import fanout_stats
+
+# Bearer token for /metrics/*; while unset the endpoints are disabled
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+def require_metrics_token(request: Request):
+    """Only let scrapers holding METRICS_TOKEN read the internal counters"""
+    if not METRICS_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(token.encode(), METRICS_TOKEN.encode()):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics token",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+
+router = APIRouter(
+    prefix="/metrics",
+    tags=["Metrics"],
+    dependencies=[Depends(require_metrics_token)]
+)
+
+@router.get("/caches")
+async def get_cache_metrics():
+    """Size and hit/miss counters for the in-process caches and the resume analysis cache"""
+    return {
+        "caches": all_cache_stats(),
+        "resume_analysis": resume_analysis_cache.stats()
+    }
+
+@router.get("/database")
+async def get_database_metrics():
+    """Connection pool usage, overflow and checkout wait times"""
+    return {
+        "pools": all_pool_stats()
+    }
+
+@router.get("/websocket")
+async def get_websocket_metrics():
+    """Broadcast fan-out latency, slow consumer, typing, message write and backplane counters"""
+    return {
+        **fanout_stats.stats(),
+        "backplane": manager.backplane.stats(),
+        "typing": manager.typing.stats(),
+        "message_writer": message_writer.stats()
+    }
+
+@router.get("/auth")
+async def get_auth_metrics():
+    """Password hashing pool queue depth, shed calls and hash latency"""
+    return {
+        "password_hasher": password_hasher.stats()
+    }
+
+@router.get("/jobs")
+async def get_job_metrics():
+    """Resume analysis queue depth, running workers and outcomes, and text extraction caps and latency"""
+    return {
+        "resume_analysis": resume_jobs.stats(),
+        "resume_extraction": resume_extractor.stats()
+    }
@@ -13,12 +13,12 @@ router = APIRouter(
 @router.post("/signup", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def signup(professor_data: CreateProfessor, db: Session = Depends(get_db)):
     auth_service = ProfessorAuthService(db)
-    return auth_service.register_Professor(professor_data)
+    return await auth_service.register_Professor(professor_data)
 
 @router.post("/signin", response_model=Token, status_code=status.HTTP_200_OK)
 async def signin(response: Response, professor_data: ProfessorLogin, db: Session = Depends(get_db)):
     auth_service = ProfessorAuthService(db)
-    token = auth_service.login_Professor(professor_data)
+    token = await auth_service.login_Professor(professor_data)
 
     response.set_cookie(
         key="access_token",
@@ -335,18 +335,26 @@ async def search_students(
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
-    """Search students by name, email, or skills"""
+    """Search students by name, email, or skills
+
+    Name and email match any substring of q. Skills match only when q is a
+    whole skill, ignoring case: "python" finds "Python" but "pyth" does not.
+    """
     profile_service = ProfileService(db)
     return profile_service.search_students(q, limit)
 
 @router.get("/students/by-skill", response_model=List[StudentResponse])
 async def get_students_by_skill(
-    skill: str = Query(..., min_length=1, description="Skill to search for"),
+    skill: str = Query(..., min_length=1, description="Skill to search for, matched whole and case-insensitively"),
     limit: int = Query(20, ge=1, le=100, description="Number of results to return"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
-    """Get students by specific skill"""
+    """Get students by specific skill
+
+    The skill must match one of the student's skills exactly, ignoring case;
+    partial names such as "pyth" do not match "Python".
+    """
     profile_service = ProfileService(db)
     return profile_service.get_students_by_skill(skill, limit)
 
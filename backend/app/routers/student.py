@@ -1,12 +1,15 @@
 from fastapi import APIRouter, Depends, status, Response, UploadFile, File, HTTPException, Request
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
+from uuid import UUID
 from app.database import get_db
+from app.models.resume import ResumeAnalysisJob
 from app.repository import StudentRepository
-from app.schemas import CreateStudent, UserResponse, StudentLogin, Token, CreateStudentProfile
+from app.schemas import CreateStudent, UserResponse, StudentLogin, Token, CreateStudentProfile, ResumeJobResponse
 from app.services.auth_service import StudentAuthService
-from app.services.resume_analyzer import extract_text_from_docx, extract_text_from_pdf, analyze_resume_with_gemini
-from app.utils import limiter  
+from app.services.resume_extraction import spool_upload
+from app.services.resume_jobs import resume_jobs, ResumeQueueFull, RESUME_MAX_UPLOAD_BYTES
+from app.utils import limiter, get_current_user
 
 router = APIRouter(
     prefix="/student",
@@ -16,12 +19,12 @@ router = APIRouter(
 @router.post("/signup", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def signup(student_data: CreateStudent, db: Session = Depends(get_db)):
     auth_service = StudentAuthService(db)
-    return auth_service.register_Student(student_data)
+    return await auth_service.register_Student(student_data)
 
 @router.post("/signin", response_model=Token, status_code=status.HTTP_200_OK)
 async def signin(response: Response, student_data: StudentLogin, db: Session = Depends(get_db)):
     auth_service = StudentAuthService(db)
-    token = auth_service.student_login(data=student_data)
+    token = await auth_service.student_login(data=student_data)
 
     response.set_cookie(
         key="access_token",
@@ -33,9 +36,27 @@ async def signin(response: Response, student_data: StudentLogin, db: Session = D
     )
     return token
 
-@router.post("/analyze-resume")
+def _job_response(job: ResumeAnalysisJob) -> ResumeJobResponse:
+    return ResumeJobResponse(
+        job_id=job.id,
+        status=job.status,
+        filename=job.filename,
+        analysis=job.result,
+        error=job.error,
+        created_at=job.created_at,
+        finished_at=job.finished_at
+    )
+
+def _require_student(current_user: dict):
+    if current_user["role"] != "student":
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only students can analyze resumes")
+    return current_user["user"]
+
+@router.post("/analyze-resume", response_model=ResumeJobResponse, status_code=status.HTTP_202_ACCEPTED)
 # @limiter.limit("1/15minute")  # rate limiter
-async def analyze_resume(request: Request, file: UploadFile = File(...)):
+async def analyze_resume(request: Request, file: UploadFile = File(...), current_user: dict = Depends(get_current_user)):
+    """Queue a resume for analysis; poll GET /student/analyze-resume/{job_id} for the result"""
+    student = _require_student(current_user)
     if file.content_type not in [
         "application/pdf",
         "application/msword",
@@ -43,17 +64,25 @@ async def analyze_resume(request: Request, file: UploadFile = File(...)):
     ]:
         raise HTTPException(status_code=400, detail="Unsupported file type. Please upload a PDF or Word document.")
 
-    if file.content_type == "application/pdf":
-        resume_text = extract_text_from_pdf(file)
-    else:
-        resume_text = extract_text_from_docx(file)
-
-    analysis = await analyze_resume_with_gemini(resume_text)
+    path = await spool_upload(file, RESUME_MAX_UPLOAD_BYTES)
+    try:
+        job = await resume_jobs.submit(student.id, file.filename, file.content_type, path)
+    except ResumeQueueFull:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Resume analysis is busy right now, please try again in a minute.",
+            headers={"Retry-After": "30"}
+        )
+    return _job_response(job)
 
-    return JSONResponse(content={
-        "filename": file.filename,
-        "analysis": analysis
-    })
+@router.get("/analyze-resume/{job_id}", response_model=ResumeJobResponse)
+async def get_resume_analysis(job_id: UUID, current_user: dict = Depends(get_current_user)):
+    """Status of a resume analysis job, with the analysis once it has completed"""
+    student = _require_student(current_user)
+    job = await resume_jobs.get(job_id, student.id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resume analysis job not found")
+    return _job_response(job)
 
 @router.get("/test-gemini")
 async def test_gemini():
@@ -1,9 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from uuid import UUID
 from app.database import get_db
-from app.models import Students, Professors
+from app.repository import UserSearchRepository
 from app.utils.auth import get_current_user
+from app.utils.pagination import encode_cursor, decode_cursor
+from app.utils.responses import etag_response
+from app.utils.user_directory import UserDirectory, entry_from_user
 from pydantic import BaseModel
 
 router = APIRouter(
@@ -14,56 +18,66 @@ router = APIRouter(
 class UserResponse(BaseModel):
     id: str
     name: str
-    email: str = None
-    usn: str = None
+    email: Optional[str] = None
+    usn: Optional[str] = None
     role: str
-    department: str = None
-    year: int = None
-    avatar_url: str = None
+    department: Optional[str] = None
+    year: Optional[int] = None
+    avatar_url: Optional[str] = None
 
     class Config:
         from_attributes = True
 
-@router.get("/all")
+class UserListResponse(BaseModel):
+    users: List[UserResponse]
+    next_cursor: Optional[str] = None
+    has_next: bool
+
+def parse_user_cursor(cursor: Optional[str]):
+    """Decode a (name_key, id) cursor from a previous page, 400 if it is malformed"""
+    if not cursor:
+        return None
+    try:
+        name_key, user_id = decode_cursor(cursor, 2)
+        return name_key, UUID(user_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+@router.get("/all", response_model=UserListResponse)
 async def get_all_users(
+    request: Request,
+    q: Optional[str] = Query(None, min_length=1, max_length=100, description="Prefix of name, USN or email"),
+    role: Optional[str] = Query(None, pattern="^(student|professor)$"),
+    department: Optional[str] = Query(None, max_length=100, description="Department (branch) code, e.g. IS"),
+    cursor: Optional[str] = Query(None, max_length=300),
+    per_page: int = Query(50, ge=1, le=100),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
-    """Get all users (students and professors) for channel invitations"""
-    try:
-        # Get all students
-        students = db.query(Students).all()
-        student_users = [
-            UserResponse(
-                id=str(student.id),
-                name=student.name,
-                usn=student.usn,
-                role="student",
-                department=student.department,
-                year=student.year,
-                avatar_url=getattr(student, 'avatar_url', None)
-            )
-            for student in students
-        ]
-
-        # Get all professors
-        professors = db.query(Professors).all()
-        professor_users = [
-            UserResponse(
-                id=str(professor.id),
-                name=professor.name,
-                email=professor.email,
-                role="professor",
-                department=professor.department,
-                avatar_url=getattr(professor, 'avatar_url', None)
-            )
-            for professor in professors
-        ]
-
-        # Combine and return all users
-        all_users = student_users + professor_users
-        
-        return all_users
+    """Search users (students and professors) for channel invitations
 
+    Sorted by name; pass each response's `next_cursor` as `cursor` for the
+    next page. Responses carry an ETag and honour If-None-Match.
+    """
+    after = parse_user_cursor(cursor)
+    try:
+        rows, has_next = UserSearchRepository(db).search_users(q, role, department, after, per_page)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching users: {str(e)}")
+
+    user_directory = UserDirectory(db)
+    users = []
+    for row in rows:
+        entry = user_directory.prime(entry_from_user(row, row.role))
+        users.append(UserResponse(
+            id=str(entry.id),
+            name=entry.name,
+            email=entry.email,
+            usn=entry.usn,
+            role=row.role,
+            department=entry.department,
+            avatar_url=entry.avatar_url
+        ))
+
+    next_cursor = encode_cursor(rows[-1].name_key, rows[-1].id) if has_next else None
+    return etag_response(request, UserListResponse(users=users, next_cursor=next_cursor, has_next=has_next))
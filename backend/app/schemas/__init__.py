@@ -1,6 +1,7 @@
-from .user_schema import CreateStudent, CreateProfessor, UserResponse, Token, StudentLogin, ProfessorLogin, FetchProfessor, CreateStudentProfile, WebsiteCreate
+from .user_schema import CreateStudent, CreateProfessor, UserResponse, Token, StudentLogin, ProfessorLogin, FetchProfessor, CreateStudentProfile, WebsiteCreate, StudentSummary, StudentListResponse
 from .resource_schema import AddSubject, UploadResource, getSubjectSchema, getResourceSchema
 from .feedbackSchema import ProfessorRatingSchema
+from .resume_schema import ResumeAnalysis, ResumeJobResponse
 from .feed_schema import FeedCreate, FeedUpdate, FeedResponse, FeedListResponse, CommentCreate, CommentResponse, LikeResponse, ShareResponse, FeedFilter, FeedQueryParams, AuthorInfo
 from .profile_schema import (
     StudentProfileCreate, StudentProfileUpdate, StudentProfileResponse,
@@ -17,7 +18,7 @@ from .channel_schema import (
     PinnedMessageResponse, ChannelInviteCreate, ChannelInviteResponse,
     ChannelInviteJoin, FileUploadResponse, ChannelSearchParams,
     MessageQueryParams, WebSocketEvent, MessageEvent, TypingEvent,
-    UserPresenceEvent, ChannelStats, ChannelNotification,
+    TypingUser, TypingUsersEvent, UserPresenceEvent, ChannelStats, ChannelNotification,
     ChannelTypeEnum, ChannelRoleEnum, MessageTypeEnum, CreatorRoleEnum
 )
 
@@ -36,6 +37,8 @@ __all__ = [
   "ProfessorRatingSchema",
   "CreateStudentProfile",
   "WebsiteCreate",
+  "StudentSummary",
+  "StudentListResponse",
   "FeedCreate",
   "FeedUpdate",
   "FeedResponse",
@@ -83,11 +86,15 @@ __all__ = [
   "WebSocketEvent",
   "MessageEvent",
   "TypingEvent",
+  "TypingUser",
+  "TypingUsersEvent",
   "UserPresenceEvent",
   "ChannelStats",
   "ChannelNotification",
   "ChannelTypeEnum",
   "ChannelRoleEnum",
   "MessageTypeEnum",
-  "CreatorRoleEnum"
+  "CreatorRoleEnum",
+  "ResumeAnalysis",
+  "ResumeJobResponse"
 ]
\ No newline at end of file
@@ -195,11 +195,12 @@ class FileUploadResponse(BaseModel):
 # Channel List and Search Schemas
 class ChannelListResponse(BaseModel):
     channels: List[ChannelResponse]
-    total: int
+    total: Optional[int]  # None when the count was skipped
     page: int
     per_page: int
     has_next: bool
     has_prev: bool
+    next_cursor: Optional[str] = None
 
 class ChannelSearchParams(BaseModel):
     query: Optional[str] = Field(None, min_length=1, max_length=100)
@@ -208,21 +209,26 @@ class ChannelSearchParams(BaseModel):
     tags: Optional[List[str]] = Field(None, max_items=5)
     page: int = Field(1, ge=1)
     per_page: int = Field(20, ge=1, le=100)
+    cursor: Optional[str] = None  # opaque keyset cursor, takes precedence over page
+    include_total: Optional[bool] = None  # defaults to True for page mode, False for cursor mode
 
 # Message List Schemas
 class MessageListResponse(BaseModel):
     messages: List[MessageResponse]
-    total: int
+    total: Optional[int]  # None when the count was skipped
     page: int
     per_page: int
     has_next: bool
     has_prev: bool
+    next_cursor: Optional[str] = None
 
 class MessageQueryParams(BaseModel):
     page: int = Field(1, ge=1)
     per_page: int = Field(50, ge=1, le=100)
     before: Optional[datetime] = None
     after: Optional[datetime] = None
+    cursor: Optional[str] = None  # opaque keyset cursor, takes precedence over page
+    include_total: Optional[bool] = None  # defaults to True for page mode, False for cursor mode
 
 # WebSocket Event Schemas
 class WebSocketEvent(BaseModel):
@@ -242,6 +248,15 @@ class TypingEvent(BaseModel):
     channel_id: UUID
     is_typing: bool
 
+class TypingUser(BaseModel):
+    user_id: UUID
+    user_name: str
+
+class TypingUsersEvent(BaseModel):
+    type: str = "typing_users"
+    channel_id: UUID
+    users: List[TypingUser]
+
 class UserPresenceEvent(BaseModel):
     type: str = "presence"
     user_id: UUID
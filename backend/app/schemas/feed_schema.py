@@ -105,6 +105,6 @@ class FeedFilter(BaseModel):
 class FeedQueryParams(BaseModel):
     page: int = Field(default=1, ge=1)
     per_page: int = Field(default=10, ge=1, le=50)
-    sort_by: str = Field(default="created_at", pattern="^(created_at|updated_at|title|priority)$")
+    sort_by: str = Field(default="created_at", pattern="^(created_at|updated_at|title|priority|likes_count|comments_count|shares_count|relevance)$")  # relevance needs filter.search
     sort_order: str = Field(default="desc", pattern="^(asc|desc)$")
     filter: Optional[FeedFilter] = None
@@ -53,6 +53,7 @@ class StudentBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=100)
     email: EmailStr
     usn: str = Field(..., min_length=1, max_length=20)
+    department: Optional[str] = Field(None, max_length=100)
 
 class StudentCreate(StudentBase):
     password: str = Field(..., min_length=6, max_length=100)
@@ -61,6 +62,7 @@ class StudentUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=100)
     email: Optional[EmailStr] = None
     password: Optional[str] = Field(None, min_length=6, max_length=100)
+    department: Optional[str] = Field(None, max_length=100)
 
 class StudentResponse(StudentBase):
     id: UUID
@@ -74,6 +76,7 @@ class StudentResponse(StudentBase):
 class ProfessorBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=100)
     email: EmailStr
+    department: Optional[str] = Field(None, max_length=100)
 
 class ProfessorCreate(ProfessorBase):
     password: str = Field(..., min_length=6, max_length=100)
@@ -82,6 +85,7 @@ class ProfessorUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=100)
     email: Optional[EmailStr] = None
     password: Optional[str] = Field(None, min_length=6, max_length=100)
+    department: Optional[str] = Field(None, max_length=100)
 
 class ProfessorResponse(ProfessorBase):
     id: UUID
@@ -0,0 +1,24 @@
+"""Resume analysis schemas"""
+
+from pydantic import BaseModel
+from datetime import datetime
+from uuid import UUID
+from typing import Optional
+
+class ResumeAnalysis(BaseModel):
+  """Structured review returned by the analyzer."""
+
+  strengths: str
+  gaps: str
+  suggestions: str
+
+class ResumeJobResponse(BaseModel):
+  """State of a resume analysis job; analysis is set once status is completed."""
+
+  job_id: UUID
+  status: str
+  filename: Optional[str] = None
+  analysis: Optional[ResumeAnalysis] = None
+  error: Optional[str] = None
+  created_at: datetime
+  finished_at: Optional[datetime] = None
@@ -11,6 +11,8 @@ class CreateStudent(BaseModel):
   email: EmailStr
   name: str
   password: str
+  # Branch code; taken from the USN when omitted
+  department: Optional[str] = None
   
 class CreateProfessor(BaseModel):
   """Schema for Professor registration."""
@@ -18,6 +20,7 @@ class CreateProfessor(BaseModel):
   name: str
   email: EmailStr
   password: str
+  department: Optional[str] = None
   
 class StudentLogin(BaseModel):
   """Schema for student login."""
@@ -65,4 +68,20 @@ class CreateStudentProfile(BaseModel):
   bio: str
   location: str
   skills: List[str]
-  website: Optional[List[WebsiteCreate]] = None
\ No newline at end of file
+  website: Optional[List[WebsiteCreate]] = None
+  
+class StudentSummary(BaseModel):
+  """Projected student row for pickers and search."""
+  
+  id: UUID
+  usn: str
+  name: str
+  email: str
+  department: Optional[str] = None
+  
+class StudentListResponse(BaseModel):
+  """Cursor-paginated page of students."""
+  
+  students: List[StudentSummary]
+  next_cursor: Optional[str] = None
+  has_next: bool
\ No newline at end of file
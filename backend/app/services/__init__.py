@@ -1,9 +1,12 @@
 from .feed_service import FeedService
 from .profile_service import ProfileService
 from .channel_service import ChannelService
+from .async_services import AsyncFeedService, AsyncChannelService
 
 __all__ = [
     "FeedService",
     "ProfileService",
-    "ChannelService"
+    "ChannelService",
+    "AsyncFeedService",
+    "AsyncChannelService"
 ]
@@ -0,0 +1,26 @@
+"""Async entry points for the services, for routers running on an AsyncSession.
+
+Service methods format responses through lazy relationships and the user
+directory, so each call runs whole inside AsyncSession.run_sync rather than
+mixing awaited queries with synchronous attribute loads.
+"""
+
+from app.repository.async_repository import AsyncWrapper, run_sync_method
+from .feed_service import FeedService
+from .channel_service import ChannelService
+
+class AsyncFeedService(AsyncWrapper):
+    sync_class = FeedService
+
+    get_feeds_paginated = run_sync_method("get_feeds_paginated")
+    get_feed_by_id = run_sync_method("get_feed_by_id")
+    get_feed_comments = run_sync_method("get_feed_comments")
+
+class AsyncChannelService(AsyncWrapper):
+    sync_class = ChannelService
+
+    get_messages = run_sync_method("get_messages")
+    get_pinned_messages = run_sync_method("get_pinned_messages")
+    create_message = run_sync_method("create_message")
+    add_reaction = run_sync_method("add_reaction")
+    remove_reaction = run_sync_method("remove_reaction")
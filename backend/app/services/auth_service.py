@@ -1,15 +1,31 @@
+from functools import partial
 from sqlalchemy.orm import Session
+from app.database import AsyncSessionLocal
 from app.repository import StudentRepository, ProfessorRepository
 from app.schemas import CreateStudent, UserResponse, StudentLogin, Token, ProfessorLogin, CreateProfessor
 from fastapi import HTTPException, status
-from app.utils import verify_password, create_token
+from app.utils import create_token
+from app.services.password_hasher import password_hasher, PasswordHasherBusy
+
+def _busy() -> HTTPException:
+  """Shed login/signup while the hashing pool is saturated"""
+  return HTTPException(
+    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+    detail="Too many sign-in attempts right now, please retry shortly.",
+    headers={"Retry-After": "1"}
+  )
+
+async def _store_upgraded_hash(repository_class, user_id, old_hash: str, new_hash: str):
+  """Write back a rehashed password on its own session; the request's is gone by then"""
+  async with AsyncSessionLocal() as db:
+    await db.run_sync(lambda session: repository_class(session).update_password_hash(user_id, old_hash, new_hash))
 
 class StudentAuthService:
   
   def __init__(self, db: Session):
     self.student_repo = StudentRepository(db)
     
-  def register_Student(self, data: CreateStudent) -> UserResponse:
+  async def register_Student(self, data: CreateStudent) -> UserResponse:
      """Register a new student"""
      
      if self.student_repo.student_exists_by_email(data.email):
@@ -17,8 +33,13 @@ class StudentAuthService:
          status_code=status.HTTP_400_BAD_REQUEST,
          detail="Email already registered"
        )
+     
+     try:
+       password_hash = await password_hasher.hash(data.password)
+     except PasswordHasherBusy:
+       raise _busy()
        
-     student = self.student_repo.createStudent(data)
+     student = self.student_repo.createStudent(data, password_hash)
      
      return UserResponse(
        id = student.id,
@@ -28,17 +49,28 @@ class StudentAuthService:
        role = "student"
      )
    
-  def student_login(self, data: StudentLogin) -> Token:
+  async def student_login(self, data: StudentLogin) -> Token:
     """Authenticate Student and return JWT token."""
     
     student = self.student_repo.get_student_by_usn(data.usn)
     
-    if not student or not verify_password(data.password, student.password):
+    try:
+      valid = student is not None and await password_hasher.verify(data.password, student.password)
+    except PasswordHasherBusy:
+      raise _busy()
+    
+    if not valid:
       raise HTTPException(
         status_code=status.HTTP_400_BAD_REQUEST,
         detail="Invalid Usn or password."
       )
     
+    if password_hasher.needs_rehash(student.password):
+      password_hasher.rehash_in_background(
+        data.password,
+        partial(_store_upgraded_hash, StudentRepository, student.id, student.password)
+      )
+    
     access_token = create_token(data={
       "sub": data.usn,
       "role": "student"
@@ -51,7 +83,7 @@ class ProfessorAuthService:
   def __init__(self, db: Session):
     self.professor_repo = ProfessorRepository(db)
     
-  def register_Professor(self, data: CreateProfessor) -> UserResponse:
+  async def register_Professor(self, data: CreateProfessor) -> UserResponse:
     """Register a new Professor"""
     
     if self.professor_repo.exists_by_email(data.email):
@@ -59,8 +91,13 @@ class ProfessorAuthService:
         status_code=status.HTTP_400_BAD_REQUEST,
         detail="Email already registered."
       )
+    
+    try:
+      password_hash = await password_hasher.hash(data.password)
+    except PasswordHasherBusy:
+      raise _busy()
       
-    professor = self.professor_repo.createProfessor(data=data)
+    professor = self.professor_repo.createProfessor(data=data, password_hash=password_hash)
     
     return UserResponse(
       id = professor.id,
@@ -70,17 +107,28 @@ class ProfessorAuthService:
       name = professor.name
     )
   
-  def login_Professor(self, data: ProfessorLogin) -> Token:
+  async def login_Professor(self, data: ProfessorLogin) -> Token:
     """Authentication Professor and return JWT token."""
     
     professor = self.professor_repo.get_by_email(data.email)
     
-    if not professor or not verify_password(data.password, professor.password):
+    try:
+      valid = professor is not None and await password_hasher.verify(data.password, professor.password)
+    except PasswordHasherBusy:
+      raise _busy()
+    
+    if not valid:
       raise HTTPException(
         status_code=status.HTTP_400_BAD_REQUEST,
         detail="Invalid Email or password."
       )
     
+    if password_hasher.needs_rehash(professor.password):
+      password_hasher.rehash_in_background(
+        data.password,
+        partial(_store_upgraded_hash, ProfessorRepository, professor.id, professor.password)
+      )
+    
     access_token = create_token(data={
       "sub": data.email,
       "role": "professor"
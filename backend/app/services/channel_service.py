@@ -18,6 +18,8 @@ from app.schemas import (
     ChannelTypeEnum, ChannelRoleEnum, MessageTypeEnum, CreatorRoleEnum
 )
 from app.models.channel import Channel, ChannelMember, Message, MessageReaction, PinnedMessage, ChannelInvite
+from app.utils.pagination import encode_cursor, decode_cursor
+from app.utils.user_directory import UserDirectory, user_key
 
 class ChannelService:
     def __init__(self, db: Session):
@@ -71,19 +73,44 @@ class ChannelService:
 
     def search_channels(self, params: ChannelSearchParams, user_id: UUID) -> ChannelListResponse:
         """Search channels"""
-        channels, total = self.channel_repo.search_channels(params, user_id)
-        
-        formatted_channels = [self._format_channel_response(channel, user_id) for channel in channels]
+        if params.cursor is not None:
+            cursor = self._decode_search_cursor(params) if params.cursor else None
+            rows, total, has_next = self.channel_repo.search_channels(
+                params, user_id, cursor=cursor, include_total=bool(params.include_total)
+            )
+            page, has_prev = 1, bool(params.cursor)
+        else:
+            rows, total, has_next = self.channel_repo.search_channels(
+                params, user_id,
+                offset=(params.page - 1) * params.per_page,
+                include_total=params.include_total is not False
+            )
+            page, has_prev = params.page, params.page > 1
+        
+        next_cursor = None
+        if has_next and rows:
+            last_channel, last_key = rows[-1]
+            next_cursor = encode_cursor(last_key, last_channel.id)
         
         return ChannelListResponse(
-            channels=formatted_channels,
+            channels=self._format_channel_responses([channel for channel, _ in rows], user_id),
             total=total,
-            page=params.page,
+            page=page,
             per_page=params.per_page,
-            has_next=(params.page * params.per_page) < total,
-            has_prev=params.page > 1
+            has_next=has_next,
+            has_prev=has_prev,
+            next_cursor=next_cursor
         )
 
+    def _decode_search_cursor(self, params: ChannelSearchParams) -> Tuple[Any, UUID]:
+        """(rank, id) when searching by text, (created_at, id) otherwise"""
+        sort_key, channel_id = decode_cursor(params.cursor, 2)
+        try:
+            sort_key = float(sort_key) if params.query else datetime.fromisoformat(sort_key)
+            return sort_key, UUID(channel_id)
+        except ValueError as e:
+            raise ValueError("Invalid cursor") from e
+
     def get_user_channels(self, user_id: UUID, page: int = 1, per_page: int = 20) -> ChannelListResponse:
         """Get user's channels"""
         channels, total = self.channel_repo.get_user_channels(user_id, page, per_page)
@@ -236,28 +263,114 @@ class ChannelService:
         
         return self._format_message_response(message)
 
+    def create_messages(
+        self,
+        submissions: List[Tuple[MessageCreate, UUID, UUID, CreatorRoleEnum, datetime]]
+    ) -> List[Any]:
+        """Create a batch of (message, channel_id, sender_id, sender_role, created_at) in one commit
+
+        Returns, in submission order, the MessageResponse for each accepted
+        message or the exception explaining why it was rejected. If the batch
+        commit fails, messages are retried one by one so a single bad message
+        only fails itself.
+        """
+        members = self.channel_repo.get_members_by_pairs(
+            [(channel_id, sender_id) for _, channel_id, sender_id, _, _ in submissions]
+        )
+
+        results: List[Any] = []
+        accepted: List[Tuple[int, Message]] = []
+        for message_data, channel_id, sender_id, sender_role, created_at in submissions:
+            member = members.get((channel_id, sender_id))
+            if not member or member.is_muted or member.is_banned:
+                results.append(PermissionError("Cannot send messages to this channel"))
+                continue
+
+            accepted.append((len(results), Message(
+                content=message_data.content,
+                message_type=message_data.message_type,
+                reply_to_id=message_data.reply_to_id,
+                channel_id=channel_id,
+                sender_id=sender_id,
+                sender_role=sender_role,
+                created_at=created_at
+            )))
+            results.append(None)
+
+        try:
+            self.channel_repo.create_messages([message for _, message in accepted])
+            saved = accepted
+        except Exception as e:
+            self.db.rollback()
+            saved = []
+            if len(accepted) == 1:
+                # Nothing to isolate; the rest of results still holds the rejections
+                results[accepted[0][0]] = e
+                accepted = []
+            for index, message in accepted:
+                try:
+                    self.channel_repo.create_messages([message])
+                    saved.append((index, message))
+                except Exception as e:
+                    self.db.rollback()
+                    results[index] = e
+
+        responses = self._format_message_responses([message for _, message in saved])
+        for (index, _), response in zip(saved, responses):
+            results[index] = response
+        return results
+
     def get_messages(self, channel_id: UUID, params: MessageQueryParams, user_id: UUID) -> MessageListResponse:
         """Get channel messages"""
         # Check if user is member
         if not self.channel_repo.is_member(channel_id, user_id):
             raise PermissionError("You are not a member of this channel")
         
-        messages, total = self.channel_repo.get_messages(channel_id, params)
+        if params.cursor is not None:
+            messages, total, has_next = self._get_messages_by_cursor(channel_id, params)
+            page, has_prev = 1, bool(params.cursor)
+        else:
+            include_total = params.include_total is not False
+            messages, total, has_next = self.channel_repo.get_messages(channel_id, params, include_total)
+            page, has_prev = params.page, params.page > 1
         
-        formatted_messages = [self._format_message_response(message) for message in messages]
+        formatted_messages = self._format_message_responses(messages)
         
         # Update last read timestamp
         self.channel_repo.update_last_read(channel_id, user_id)
         
+        next_cursor = None
+        if has_next and messages:
+            next_cursor = encode_cursor(messages[-1].created_at.isoformat(), messages[-1].id)
+        
         return MessageListResponse(
             messages=formatted_messages,
             total=total,
-            page=params.page,
+            page=page,
             per_page=params.per_page,
-            has_next=(params.page * params.per_page) < total,
-            has_prev=params.page > 1
+            has_next=has_next,
+            has_prev=has_prev,
+            next_cursor=next_cursor
         )
 
+    def _get_messages_by_cursor(self, channel_id: UUID, params: MessageQueryParams) -> Tuple[List[Message], Optional[int], bool]:
+        """Get a keyset page of messages, an empty cursor starts from the newest message"""
+        cursor = None
+        if params.cursor:
+            created_at, message_id = decode_cursor(params.cursor, 2)
+            try:
+                cursor = (datetime.fromisoformat(created_at), UUID(message_id))
+            except ValueError as e:
+                raise ValueError("Invalid cursor") from e
+        
+        messages, has_next = self.channel_repo.get_messages_before_cursor(channel_id, params, cursor)
+        
+        total = None
+        if params.include_total:
+            total = self.db.query(Message).filter(Message.channel_id == channel_id).count()
+        
+        return messages, total, has_next
+
     def update_message(self, message_id: UUID, message_data: MessageUpdate, user_id: UUID) -> Optional[MessageResponse]:
         """Update message"""
         message = self.channel_repo.update_message(message_id, message_data, user_id)
@@ -318,7 +431,11 @@ class ChannelService:
             raise PermissionError("You are not a member of this channel")
         
         pinned_messages = self.channel_repo.get_pinned_messages(channel_id)
-        return [self._format_pinned_message_response(pinned) for pinned in pinned_messages]
+        messages = self._format_message_responses([pinned.message for pinned in pinned_messages])
+        return [
+            self._format_pinned_message_response(pinned, message)
+            for pinned, message in zip(pinned_messages, messages)
+        ]
 
     # Channel Invites
     def create_invite(self, channel_id: UUID, invited_user_id: UUID, invited_by_id: UUID, invite_type: str = "invitation", message: str = None) -> ChannelInviteResponse:
@@ -461,6 +578,36 @@ class ChannelService:
         return ChannelStats(**stats)
 
     # Helper Methods
+    def _format_channel_responses(self, channels: List[Channel], user_id: UUID) -> List[ChannelResponse]:
+        """Format many channels with one member-count query and one membership query"""
+        channel_ids = [channel.id for channel in channels]
+        member_counts = self.channel_repo.get_member_counts(channel_ids)
+        memberships = self.channel_repo.get_user_memberships(channel_ids, user_id)
+        
+        responses = []
+        for channel in channels:
+            member = memberships.get(channel.id)
+            is_member = member is not None and not member.is_banned
+            responses.append(ChannelResponse(
+                id=channel.id,
+                name=channel.name,
+                description=channel.description,
+                channel_type=channel.channel_type,
+                is_private=channel.is_private,
+                max_members=channel.max_members,
+                tags=channel.tags,
+                avatar_url=channel.avatar_url,
+                is_archived=channel.is_archived,
+                created_by_id=channel.created_by_id,
+                created_by_role=channel.created_by_role,
+                created_at=channel.created_at,
+                updated_at=channel.updated_at,
+                member_count=member_counts.get(channel.id, 0),
+                is_member=is_member,
+                user_role=member.channel_role if is_member else None
+            ))
+        return responses
+
     def _format_channel_response(self, channel: Channel, user_id: UUID) -> ChannelResponse:
         """Format channel for response"""
         member_count = len(channel.members) if channel.members else 0
@@ -502,9 +649,43 @@ class ChannelService:
 
     def _format_message_response(self, message: Message) -> MessageResponse:
         """Format message for response"""
+        return self._format_message_responses([message])[0]
+
+    def _format_message_responses(self, messages: List[Message]) -> List[MessageResponse]:
+        """Format messages for response, hydrating reply targets, reactions and sender names in bulk"""
+        if not messages:
+            return []
+        
+        messages_by_id = {message.id: message for message in messages}
+        
+        # Load reply targets one reply level at a time
+        pending_ids = {message.reply_to_id for message in messages if message.reply_to_id} - messages_by_id.keys()
+        while pending_ids:
+            reply_targets = self.channel_repo.get_messages_by_ids(list(pending_ids))
+            messages_by_id.update((message.id, message) for message in reply_targets)
+            pending_ids = {message.reply_to_id for message in reply_targets if message.reply_to_id} - messages_by_id.keys()
+        
+        reactions_by_message = self.channel_repo.get_reactions_for_messages(list(messages_by_id))
+        sender_names = UserDirectory(self.db).get_names(
+            (message.sender_role, message.sender_id) for message in messages_by_id.values()
+        )
+        
+        return [
+            self._build_message_response(message, messages_by_id, reactions_by_message, sender_names)
+            for message in messages
+        ]
+
+    def _build_message_response(
+        self,
+        message: Message,
+        messages_by_id: Dict[UUID, Message],
+        reactions_by_message: Dict[UUID, List[MessageReaction]],
+        sender_names: Dict[Tuple[str, UUID], str]
+    ) -> MessageResponse:
+        """Build a message response from preloaded reply targets, reactions and sender names"""
         # Get reactions grouped by emoji
         reactions = {}
-        for reaction in message.reactions:
+        for reaction in reactions_by_message.get(message.id, []):
             if reaction.emoji not in reactions:
                 reactions[reaction.emoji] = []
             reactions[reaction.emoji].append({
@@ -522,8 +703,7 @@ class ChannelService:
                 "count": len(users)
             })
         
-        # Get sender name
-        sender_name = self._get_user_name(message.sender_id, message.sender_role)
+        reply_to = messages_by_id.get(message.reply_to_id) if message.reply_to_id else None
         
         return MessageResponse(
             id=message.id,
@@ -537,12 +717,14 @@ class ChannelService:
             reply_to_id=message.reply_to_id,
             channel_id=message.channel_id,
             sender_id=message.sender_id,
-            sender_name=sender_name,
+            sender_name=sender_names.get(user_key(message.sender_role, message.sender_id)),
             sender_role=message.sender_role,
             created_at=message.created_at,
             updated_at=message.updated_at,
             reactions=reactions_list,
-            reply_to=self._format_message_response(message.reply_to) if message.reply_to else None
+            reply_to=self._build_message_response(
+                reply_to, messages_by_id, reactions_by_message, sender_names
+            ) if reply_to else None
         )
 
     def _format_reaction_response(self, reaction: MessageReaction) -> MessageReactionResponse:
@@ -556,21 +738,7 @@ class ChannelService:
             created_at=reaction.created_at
         )
 
-    def _get_user_name(self, user_id: UUID, user_role: str) -> Optional[str]:
-        """Get user name by ID and role"""
-        try:
-            if user_role == "student":
-                from app.models import Students
-                user = self.db.query(Students).filter(Students.id == user_id).first()
-                return user.name if user else None
-            else:
-                from app.models import Professors
-                user = self.db.query(Professors).filter(Professors.id == user_id).first()
-                return user.name if user else None
-        except Exception:
-            return None
-
-    def _format_pinned_message_response(self, pinned: PinnedMessage) -> PinnedMessageResponse:
+    def _format_pinned_message_response(self, pinned: PinnedMessage, message: Optional[MessageResponse] = None) -> PinnedMessageResponse:
         """Format pinned message for response"""
         return PinnedMessageResponse(
             id=pinned.id,
@@ -579,7 +747,7 @@ class ChannelService:
             pinned_by_id=pinned.pinned_by_id,
             pinned_by_role=pinned.pinned_by_role,
             pinned_at=pinned.pinned_at,
-            message=self._format_message_response(pinned.message)
+            message=message if message is not None else self._format_message_response(pinned.message)
         )
 
     def _format_invite_response(self, invite: ChannelInvite) -> ChannelInviteResponse:
@@ -1,5 +1,5 @@
-from sqlalchemy.orm import Session, joinedload
-from typing import List, Optional, Tuple
+from sqlalchemy.orm import Session
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 from app.repository import FeedRepository
 from app.schemas import (
@@ -7,11 +7,13 @@ from app.schemas import (
     CommentCreate, CommentResponse, FeedQueryParams, AuthorInfo
 )
 from app.models import CampusFeed, FeedComment, Students, Professors
+from app.utils.user_directory import UserDirectory, UserEntry, UserKey
 
 class FeedService:
     def __init__(self, db: Session):
         self.db = db
         self.feed_repo = FeedRepository(db)
+        self.user_directory = UserDirectory(db)
 
     def create_feed(self, feed_data: FeedCreate, author_id: UUID, author_type: str) -> FeedResponse:
         """Create a new feed and return formatted response"""
@@ -29,10 +31,19 @@ class FeedService:
             query_params, current_user_id, current_user_type
         )
         
-        formatted_feeds = []
-        for feed in feeds:
-            formatted_feed = self._format_feed_response(feed, current_user_id, current_user_type)
-            formatted_feeds.append(formatted_feed)
+        # Fetch viewer interactions for the whole page at once
+        interactions_by_feed = {}
+        if current_user_id and current_user_type:
+            interactions_by_feed = self.feed_repo.get_user_feed_interactions_bulk(
+                [feed.id for feed in feeds], current_user_id, current_user_type
+            )
+
+        authors = self.user_directory.get_users(self._author_key(feed) for feed in feeds)
+
+        formatted_feeds = [
+            self._build_feed_response(feed, interactions_by_feed.get(feed.id, {}), authors)
+            for feed in feeds
+        ]
 
         # Calculate pagination info
         has_next = query_params.page * query_params.per_page < total
@@ -91,15 +102,12 @@ class FeedService:
     def get_feed_comments(self, feed_id: UUID) -> List[CommentResponse]:
         """Get all comments for a feed"""
         comments = self.db.query(FeedComment)\
-            .options(
-                joinedload(FeedComment.student),
-                joinedload(FeedComment.professor)
-            )\
             .filter(FeedComment.feed_id == feed_id)\
             .order_by(FeedComment.created_at.desc())\
             .all()
         
-        return [self._format_comment_response(comment) for comment in comments]
+        authors = self.user_directory.get_users(self._author_key(comment) for comment in comments)
+        return [self._format_comment_response(comment, authors) for comment in comments]
 
     def _format_feed_response(
         self, 
@@ -109,25 +117,6 @@ class FeedService:
     ) -> FeedResponse:
         """Format a feed model into a response schema"""
         
-        # Get author info
-        if feed.author_student:
-            author = AuthorInfo(
-                id=feed.author_student.id,
-                name=feed.author_student.name,
-                email=feed.author_student.email,
-                user_type="student"
-            )
-        else:
-            author = AuthorInfo(
-                id=feed.author_professor.id,
-                name=feed.author_professor.name,
-                email=feed.author_professor.email,
-                user_type="professor"
-            )
-
-        # Get stats
-        stats = self.feed_repo.get_feed_stats(feed.id)
-        
         # Get user interactions
         user_interactions = {}
         if current_user_id and current_user_type:
@@ -135,6 +124,19 @@ class FeedService:
                 feed.id, current_user_id, current_user_type
             )
 
+        authors = self.user_directory.get_users([self._author_key(feed)])
+        return self._build_feed_response(feed, user_interactions, authors)
+
+    def _build_feed_response(
+        self,
+        feed: CampusFeed,
+        user_interactions: dict,
+        authors: Dict[UserKey, UserEntry]
+    ) -> FeedResponse:
+        """Build a feed response from a feed, preloaded user interactions and author entries"""
+        
+        author = self._author_info(self._author_key(feed), authors)
+
         return FeedResponse(
             id=feed.id,
             title=feed.title,
@@ -148,31 +150,24 @@ class FeedService:
             created_at=feed.created_at,
             updated_at=feed.updated_at,
             author=author,
-            likes_count=stats["likes_count"],
-            comments_count=stats["comments_count"],
-            shares_count=stats["shares_count"],
+            likes_count=feed.likes_count or 0,
+            comments_count=feed.comments_count or 0,
+            shares_count=feed.shares_count or 0,
             is_liked=user_interactions.get("is_liked", False),
             is_shared=user_interactions.get("is_shared", False)
         )
 
-    def _format_comment_response(self, comment: FeedComment) -> CommentResponse:
+    def _format_comment_response(
+        self,
+        comment: FeedComment,
+        authors: Optional[Dict[UserKey, UserEntry]] = None
+    ) -> CommentResponse:
         """Format a comment model into a response schema"""
         
-        # Get author info
-        if comment.student:
-            author = AuthorInfo(
-                id=comment.student.id,
-                name=comment.student.name,
-                email=comment.student.email,
-                user_type="student"
-            )
-        else:
-            author = AuthorInfo(
-                id=comment.professor.id,
-                name=comment.professor.name,
-                email=comment.professor.email,
-                user_type="professor"
-            )
+        key = self._author_key(comment)
+        if authors is None:
+            authors = self.user_directory.get_users([key])
+        author = self._author_info(key, authors)
 
         return CommentResponse(
             id=comment.id,
@@ -182,3 +177,23 @@ class FeedService:
             author=author,
             feed_id=comment.feed_id
         )
+
+    @staticmethod
+    def _author_key(item) -> UserKey:
+        """Directory key of the author of a feed or comment"""
+        student_id = item.author_id if isinstance(item, CampusFeed) else item.student_id
+        if student_id:
+            return ("student", student_id)
+        return ("professor", item.professor_id)
+
+    @staticmethod
+    def _author_info(key: UserKey, authors: Dict[UserKey, UserEntry]) -> AuthorInfo:
+        """Build author info from a directory entry"""
+        user_type, user_id = key
+        entry = authors.get(key)
+        return AuthorInfo(
+            id=user_id,
+            name=entry.name if entry else "Unknown",
+            email=(entry.email or "") if entry else "",
+            user_type=user_type
+        )
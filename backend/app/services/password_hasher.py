@@ -0,0 +1,205 @@
+"""Password hashing and verification off the event loop.
+
+bcrypt and argon2id are slow on purpose (hundreds of milliseconds per call
+at the default cost), so running them inside an async handler stalls every
+request and WebSocket sharing the worker. PasswordHasher runs them on a
+bounded executor: a thread pool by default, since both extensions release
+the GIL, or a process pool with PASSWORD_HASH_EXECUTOR=process.
+
+Admission control keeps a login storm from building an unbounded backlog: at
+most PASSWORD_HASH_MAX_PENDING calls are admitted at once, and a call that
+has not reached a worker within PASSWORD_HASH_QUEUE_TIMEOUT seconds is
+withdrawn. Either way the caller gets PasswordHasherBusy straight away and
+can answer 503 instead of hanging.
+
+Hashes that verify but fall short of the current policy (old scheme or lower
+cost) are upgraded by rehash_in_background, using only spare pool capacity.
+"""
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+
+from passlib.context import CryptContext
+
+from app.utils.auth import pwd_context
+
+logger = logging.getLogger(__name__)
+
+PASSWORD_HASH_EXECUTOR = os.getenv("PASSWORD_HASH_EXECUTOR", "thread").lower()
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "64"))
+PASSWORD_HASH_QUEUE_TIMEOUT = float(os.getenv("PASSWORD_HASH_QUEUE_TIMEOUT", "5"))
+
+# Forking a worker from a process running the event loop, database pools and
+# threads copies all of that state; workers start from a clean interpreter
+WORKER_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+class PasswordHasherBusy(Exception):
+    """The hashing pool is saturated and the call was shed"""
+
+@lru_cache(maxsize=8)
+def _context(config: str) -> CryptContext:
+    # Contexts don't pickle, so workers rebuild them from their config string
+    return CryptContext.from_string(config)
+
+def _timed(config: str, method: str, *args):
+    """Run a context method in the worker, returning its result and how long it ran"""
+    start = time.perf_counter()
+    result = getattr(_context(config), method)(*args)
+    return result, time.perf_counter() - start
+
+class PasswordHasher:
+    """Bounded executor for password hashing with admission control and queue metrics"""
+
+    def __init__(
+        self,
+        context: CryptContext = pwd_context,
+        kind: str = PASSWORD_HASH_EXECUTOR,
+        workers: int = PASSWORD_HASH_WORKERS,
+        max_pending: int = PASSWORD_HASH_MAX_PENDING,
+        queue_timeout: float = PASSWORD_HASH_QUEUE_TIMEOUT
+    ):
+        self.context = context
+        self._config = context.to_string()
+        self.kind = kind
+        self.workers = max(workers, 1)
+        self.max_pending = max(max_pending, self.workers)
+        self.queue_timeout = queue_timeout
+        self._executor: Optional[Executor] = None
+        self._lock = Lock()
+        self.pending = 0
+        self.peak_pending = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.wait_seconds = 0.0
+        self.work_seconds = 0.0
+        self.rehashed = 0
+        self.rehash_skipped = 0
+        self.rehash_failed = 0
+        self._background: Set[asyncio.Task] = set()
+
+    async def hash(self, password: str) -> str:
+        return await self._run("hash", password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run("verify", password, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Cheap check, parses the hash without running the KDF"""
+        return self.context.needs_update(hashed_password)
+
+    def rehash_in_background(self, password: str, store: Callable[[str], Awaitable[Any]]) -> None:
+        """Hash password under the current policy and pass it to store, without holding up the caller
+
+        Skipped while the pool has no idle worker: upgrades are never worth
+        delaying a login, and the next login will try again.
+        """
+        with self._lock:
+            if self.pending >= self.workers:
+                self.rehash_skipped += 1
+                return
+        task = asyncio.ensure_future(self._rehash(password, store))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    def shutdown(self):
+        """Stop the workers, dropping calls that have not started"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            finished = self.completed + self.failed
+            return {
+                "executor": self.kind,
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "pending": self.pending,
+                # Calls admitted but not yet on a worker
+                "queue_depth": max(self.pending - self.workers, 0),
+                "peak_pending": self.peak_pending,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "timed_out": self.timed_out,
+                "avg_wait_ms": round(self.wait_seconds / finished * 1000, 3) if finished else 0.0,
+                "avg_hash_ms": round(self.work_seconds / finished * 1000, 3) if finished else 0.0,
+                "rehashed": self.rehashed,
+                "rehash_skipped": self.rehash_skipped,
+                "rehash_failed": self.rehash_failed
+            }
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context(WORKER_START_METHOD)
+                )
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+        return self._executor
+
+    async def _rehash(self, password: str, store: Callable[[str], Awaitable[Any]]):
+        try:
+            await store(await self.hash(password))
+        except PasswordHasherBusy:
+            with self._lock:
+                self.rehash_skipped += 1
+            return
+        except Exception as e:
+            with self._lock:
+                self.rehash_failed += 1
+            logger.error(f"Error upgrading password hash: {e}")
+            return
+        with self._lock:
+            self.rehashed += 1
+
+    async def _run(self, method: str, *args):
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise PasswordHasherBusy("Password hashing pool is saturated")
+            self.pending += 1
+            self.peak_pending = max(self.peak_pending, self.pending)
+
+        submitted = time.perf_counter()
+        try:
+            future = self._get_executor().submit(_timed, self._config, method, *args)
+            waiter = asyncio.wrap_future(future)
+            done, _ = await asyncio.wait({waiter}, timeout=self.queue_timeout)
+            # cancel() only succeeds while the call is still queued; a running
+            # hash is always awaited to completion
+            if not done and future.cancel():
+                with self._lock:
+                    self.timed_out += 1
+                logger.warning(f"Password hash waited over {self.queue_timeout}s for a worker, shedding it")
+                raise PasswordHasherBusy("Timed out waiting for a password hashing worker")
+
+            try:
+                result, work = await waiter
+            except Exception:
+                with self._lock:
+                    self.failed += 1
+                raise
+
+            with self._lock:
+                self.completed += 1
+                self.work_seconds += work
+                self.wait_seconds += max(time.perf_counter() - submitted - work, 0.0)
+            return result
+        finally:
+            with self._lock:
+                self.pending -= 1
+
+password_hasher = PasswordHasher()
@@ -147,6 +147,7 @@ class ProfileService:
             name=student.name,
             email=student.email,
             usn=student.usn,
+            department=student.department,
             created_at=student.created_at if hasattr(student, 'created_at') else None,
             profile=self._format_student_profile_response(student.profile) if student.profile else None
         )
@@ -157,6 +158,7 @@ class ProfileService:
             id=professor.id,
             name=professor.name,
             email=professor.email,
+            department=professor.department,
             created_at=professor.created_at if hasattr(professor, 'created_at') else None
         )
 
@@ -1,16 +1,60 @@
 from fastapi import FastAPI, File, UploadFile, HTTPException
 from fastapi.responses import JSONResponse
+from dataclasses import dataclass
 import PyPDF2
 from docx import Document
-import google.generativeai as genai
-from typing import Dict
-import os, re
+from typing import BinaryIO, Dict
+import asyncio, os, re, time
+
+from app.services.resume_cache import resume_analysis_cache
+from app.services.resume_extraction import RESUME_EXTRACT_MAX_CHARS, join_capped
+
+try:
+    import google.generativeai as genai
+except ImportError:  # only needed for the gemini backend
+    genai = None
 
 app = FastAPI()
 
+# "gemini" calls the Gemini API; "fake" answers canned analyses offline (tests, local dev)
+RESUME_ANALYZER_BACKEND = os.getenv("RESUME_ANALYZER_BACKEND", "gemini").lower()
+RESUME_FAKE_LATENCY_SECONDS = float(os.getenv("RESUME_FAKE_LATENCY_SECONDS", "0.5"))
+
+@dataclass
+class FakeResponse:
+    text: str
+
+class FakeResumeModel:
+    """Stands in for a Gemini GenerativeModel without network access or an API key
+
+    Answers in the same markdown layout the prompt asks Gemini for, so the
+    parsing path is exercised too, after a configurable delay.
+    """
+
+    model_name = "fake"
+
+    def __init__(self, latency: float = RESUME_FAKE_LATENCY_SECONDS):
+        self.latency = latency
+        self.calls = 0
+
+    def generate_content(self, prompt: str):
+        self.calls += 1
+        time.sleep(self.latency)
+        words = len(prompt.split())
+        text = (
+            "### Strengths\n1. **Clear structure**: The resume is organised into distinct sections.\n"
+            f"### Gaps\n1. **Quantified impact**: Few results are backed by numbers ({words} words reviewed).\n"
+            "### Suggestions\n1. **Add metrics**: State the outcome of each project in measurable terms.\n"
+        )
+        return FakeResponse(text)
+
 # Configure Gemini API
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-if not GEMINI_API_KEY:
+if RESUME_ANALYZER_BACKEND == "fake":
+    print("Using the fake resume analysis backend")
+elif genai is None:
+    print("Warning: google-generativeai is not installed, resume analysis is unavailable")
+elif not GEMINI_API_KEY:
     print("Warning: GEMINI_API_KEY environment variable is not set")
     print("Please set the GEMINI_API_KEY environment variable to use resume analysis")
 else:
@@ -74,7 +118,9 @@ def get_available_model():
     raise Exception("No available Gemini models found. Please check your API key and model availability.")
 
 # Initialize the model
-if GEMINI_API_KEY:
+if RESUME_ANALYZER_BACKEND == "fake":
+    model = FakeResumeModel()
+elif GEMINI_API_KEY and genai is not None:
     try:
         model = get_available_model()
     except Exception as e:
@@ -86,40 +132,31 @@ else:
 
 # Function to extract text from PDF
 def extract_text_from_pdf(file: UploadFile) -> str:
+    return _pdf_text(file.file)
+
+# Function to extract text from Word document
+def extract_text_from_docx(file: UploadFile) -> str:
+    return _docx_text(file.file)
+
+def _pdf_text(stream: BinaryIO) -> str:
     try:
-        pdf_reader = PyPDF2.PdfReader(file.file)
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
-        return text
+        pdf_reader = PyPDF2.PdfReader(stream)
+        return join_capped([page.extract_text() for page in pdf_reader.pages], RESUME_EXTRACT_MAX_CHARS)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error reading PDF: {str(e)}")
 
-# Function to extract text from Word document
-def extract_text_from_docx(file: UploadFile) -> str:
+def _docx_text(stream: BinaryIO) -> str:
     try:
-        doc = Document(file.file)
-        text = ""
-        for para in doc.paragraphs:
-            text += para.text + "\n"
-        return text
+        doc = Document(stream)
+        return join_capped([para.text for para in doc.paragraphs], RESUME_EXTRACT_MAX_CHARS)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error reading Word document: {str(e)}")
 
-# Function to analyze resume using Gemini
-async def analyze_resume_with_gemini(resume_text: str) -> Dict:
-    if model is None:
-        if not GEMINI_API_KEY:
-            raise HTTPException(
-                status_code=500, 
-                detail="Gemini API key is not configured. Please contact support to enable resume analysis."
-            )
-        else:
-            raise HTTPException(
-                status_code=500, 
-                detail="Gemini service is currently unavailable. Please try again later or contact support."
-            )
-    prompt = """
+# Bump when RESUME_PROMPT or the section parsing changes: cached analyses are
+# keyed on it, so old answers stop being served
+RESUME_PROMPT_VERSION = "1"
+
+RESUME_PROMPT = """
 You are a professional resume analyst and career advisor. Analyze the resume text below and provide a detailed, structured review in the following format:
 
 ### Strengths
@@ -145,8 +182,28 @@ Here is the resume text to analyze:
 {resume_text}
 \"\"\"
 """
+
+# Function to analyze resume using Gemini
+async def analyze_resume_with_gemini(resume_text: str) -> Dict:
+    """Strengths/gaps/suggestions for resume_text, from the cache when this text was analyzed before"""
+    cache_version = f"{RESUME_PROMPT_VERSION}:{getattr(model, 'model_name', RESUME_ANALYZER_BACKEND)}"
+    return await resume_analysis_cache.get_or_compute(resume_text, cache_version, _generate_analysis)
+
+async def _generate_analysis(resume_text: str) -> Dict:
+    if model is None:
+        if not GEMINI_API_KEY:
+            raise HTTPException(
+                status_code=500, 
+                detail="Gemini API key is not configured. Please contact support to enable resume analysis."
+            )
+        else:
+            raise HTTPException(
+                status_code=500, 
+                detail="Gemini service is currently unavailable. Please try again later or contact support."
+            )
     try:
-        response = model.generate_content(prompt.format(resume_text=resume_text))
+        # generate_content blocks for the whole request, keep it off the event loop
+        response = await asyncio.to_thread(model.generate_content, RESUME_PROMPT.format(resume_text=resume_text))
         text = response.text.strip()
 
         def extract_section(header: str, next_header: str = None) -> str:
@@ -0,0 +1,158 @@
+"""Content-addressed cache for resume analyses.
+
+The same resume tends to be uploaded again and again (retries, re-uploads
+after a tweak elsewhere, several students sharing a template), and every
+analysis is a multi-second LLM call. Results are stored in the
+resume_analysis_cache table keyed by sha256 of the normalized extracted text
+plus a version string naming the prompt and model, so any worker process can
+answer a repeat straight from the database, and changing the prompt or model
+stops old answers being served.
+
+Entries expire after RESUME_CACHE_TTL_SECONDS, and the table is trimmed to
+RESUME_CACHE_MAX_ENTRIES least recently used rows every
+RESUME_CACHE_EVICT_EVERY stores. The cache is best effort: if the table
+can't be read or written the analysis simply runs uncached.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Optional
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import time
+import unicodedata
+
+from app.database import AsyncSessionLocal
+from app.repository.resume_cache_repository import ResumeCacheRepository
+
+logger = logging.getLogger(__name__)
+
+RESUME_CACHE_ENABLED = os.getenv("RESUME_CACHE_ENABLED", "true").lower() == "true"
+RESUME_CACHE_TTL_SECONDS = float(os.getenv("RESUME_CACHE_TTL_SECONDS", str(30 * 24 * 3600)))
+RESUME_CACHE_MAX_ENTRIES = int(os.getenv("RESUME_CACHE_MAX_ENTRIES", "10000"))
+RESUME_CACHE_EVICT_EVERY = int(os.getenv("RESUME_CACHE_EVICT_EVERY", "100"))
+
+_WHITESPACE = re.compile(r"\s+")
+
+def normalize_resume_text(text: str) -> str:
+    """Fold the differences extraction introduces between uploads of the same resume"""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+def resume_cache_key(text: str, version: str) -> str:
+    digest = hashlib.sha256(version.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(normalize_resume_text(text).encode("utf-8"))
+    return digest.hexdigest()
+
+class ResumeAnalysisCache:
+    """Database-backed analysis cache with single-flight misses and hit/latency counters"""
+
+    def __init__(
+        self,
+        session_factory=AsyncSessionLocal,
+        ttl: float = RESUME_CACHE_TTL_SECONDS,
+        max_entries: int = RESUME_CACHE_MAX_ENTRIES,
+        evict_every: int = RESUME_CACHE_EVICT_EVERY,
+        enabled: bool = RESUME_CACHE_ENABLED
+    ):
+        self.session_factory = session_factory
+        self.ttl = ttl
+        self.max_entries = max(max_entries, 1)
+        self.evict_every = max(evict_every, 1)
+        self.enabled = enabled
+        # Analyses in progress per key, so concurrent uploads of one resume share a call
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.stores = 0
+        self.evicted = 0
+        self.errors = 0
+        self.saved_ms = 0.0
+        self.generation_ms = 0.0
+
+    async def get_or_compute(self, text: str, version: str, compute: Callable[[str], Awaitable[dict]]) -> dict:
+        """The cached analysis of text under version, or compute(text) stored for next time"""
+        if not self.enabled:
+            return await compute(text)
+
+        key = resume_cache_key(text, version)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._lookup_or_compute(key, text, version, compute))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finished(key, done))
+        else:
+            self.coalesced += 1
+        # A caller that times out stops waiting without cancelling the analysis
+        # for the others, and the result is still stored for its retry
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "ttl_seconds": self.ttl,
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "stores": self.stores,
+            "evicted": self.evicted,
+            "errors": self.errors,
+            # LLM time the hits would have spent, going by what each entry cost to produce
+            "saved_ms": round(self.saved_ms, 3),
+            "avg_generation_ms": round(self.generation_ms / self.misses, 3) if self.misses else 0.0
+        }
+
+    def _finished(self, key: str, task: asyncio.Task):
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            # Mark the failure retrieved even if every waiter has given up
+            task.exception()
+
+    async def _lookup_or_compute(self, key: str, text: str, version: str, compute) -> dict:
+        entry = await self._fetch(key)
+        if entry is not None:
+            result, generation_ms = entry
+            self.hits += 1
+            self.saved_ms += generation_ms
+            return result
+
+        self.misses += 1
+        start = time.perf_counter()
+        result = await compute(text)
+        generation_ms = (time.perf_counter() - start) * 1000
+        self.generation_ms += generation_ms
+        await self._store(key, version, result, generation_ms)
+        return result
+
+    async def _with_repository(self, operation):
+        async with self.session_factory() as db:
+            return await db.run_sync(lambda session: operation(ResumeCacheRepository(session)))
+
+    async def _fetch(self, key: str) -> Optional[tuple]:
+        def fetch(repo: ResumeCacheRepository):
+            entry = repo.get_fresh(key, self.ttl)
+            return None if entry is None else (entry.result, entry.generation_ms)
+
+        try:
+            return await self._with_repository(fetch)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Resume analysis cache lookup failed, analyzing uncached: {e}")
+            return None
+
+    async def _store(self, key: str, version: str, result: dict, generation_ms: float):
+        try:
+            await self._with_repository(lambda repo: repo.put(key, version, result, generation_ms))
+            self.stores += 1
+            if self.stores % self.evict_every == 0:
+                self.evicted += await self._with_repository(lambda repo: repo.evict(self.ttl, self.max_entries))
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Could not store resume analysis in the cache: {e}")
+
+resume_analysis_cache = ResumeAnalysisCache()
@@ -0,0 +1,268 @@
+"""Text extraction for uploaded resumes, off the event loop and across processes.
+
+Uploads are spooled to a temp file in RESUME_SPOOL_DIR in chunks, so a queued
+job holds a path rather than the whole document. Extraction then runs on a
+ResumeExtractor pool: a PDF is split into one range of pages per worker (at
+least RESUME_EXTRACT_PAGES_PER_TASK pages each), and each worker opens the
+file by path and reads only its own pages. PyPDF2 is pure Python and holds the GIL, so the
+pool is a process pool by default (RESUME_EXTRACT_EXECUTOR=thread to change
+that). python-docx parses the whole document in one go, so a Word document
+is a single task.
+
+Every document is capped. Pages past RESUME_EXTRACT_MAX_PAGES are skipped,
+text past RESUME_EXTRACT_MAX_CHARS is dropped, and a document still being
+read after RESUME_EXTRACT_TIMEOUT_SECONDS keeps only the leading pages that
+finished. All three count as truncated in the stats. Page text is collected
+in lists and joined once at the end.
+"""
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import multiprocessing
+import os
+import tempfile
+import time
+
+from docx import Document
+from fastapi import HTTPException, UploadFile
+import PyPDF2
+
+RESUME_SPOOL_DIR = os.getenv("RESUME_SPOOL_DIR") or None
+RESUME_EXTRACT_EXECUTOR = os.getenv("RESUME_EXTRACT_EXECUTOR", "process").lower()
+RESUME_EXTRACT_WORKERS = int(os.getenv("RESUME_EXTRACT_WORKERS", str(min(4, os.cpu_count() or 1))))
+RESUME_EXTRACT_PAGES_PER_TASK = int(os.getenv("RESUME_EXTRACT_PAGES_PER_TASK", "8"))
+RESUME_EXTRACT_MAX_PAGES = int(os.getenv("RESUME_EXTRACT_MAX_PAGES", "50"))
+RESUME_EXTRACT_MAX_CHARS = int(os.getenv("RESUME_EXTRACT_MAX_CHARS", "200000"))
+RESUME_EXTRACT_TIMEOUT_SECONDS = float(os.getenv("RESUME_EXTRACT_TIMEOUT_SECONDS", "20"))
+
+# Workers only need PyPDF2 and python-docx, so they start from a fresh
+# interpreter instead of a fork of the server and its threads and pools
+WORKER_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+SPOOL_CHUNK_BYTES = 1024 * 1024
+
+PDF_CONTENT_TYPE = "application/pdf"
+
+async def spool_upload(file: UploadFile, max_bytes: int) -> str:
+    """Copy an upload to a temp file in chunks and return its path; 413 past max_bytes"""
+    suffix = os.path.splitext(file.filename or "")[1]
+    spool = tempfile.NamedTemporaryFile(prefix="resume-", suffix=suffix, dir=RESUME_SPOOL_DIR, delete=False)
+    try:
+        with spool:
+            written = 0
+            while chunk := await file.read(SPOOL_CHUNK_BYTES):
+                written += len(chunk)
+                if written > max_bytes:
+                    raise HTTPException(status_code=413, detail="Resume is too large.")
+                await asyncio.to_thread(spool.write, chunk)
+        return spool.name
+    except BaseException:
+        discard_spool(spool.name)
+        raise
+
+def discard_spool(path: str):
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+def _pdf_page_count(path: str) -> int:
+    with open(path, "rb") as stream:
+        return len(PyPDF2.PdfReader(stream).pages)
+
+def _pdf_pages(path: str, start: int, stop: int, max_chars: int, deadline: float) -> Tuple[List[str], bool]:
+    """Text of pages [start, stop), stopping early at max_chars or the deadline
+
+    Runs in a worker. The file is read through an open handle, so PyPDF2
+    seeks to the objects it needs instead of loading the whole document.
+    """
+    texts = []
+    chars = 0
+    with open(path, "rb") as stream:
+        pages = PyPDF2.PdfReader(stream).pages
+        for number in range(start, stop):
+            if chars >= max_chars or time.time() >= deadline:
+                return texts, True
+            text = pages[number].extract_text()
+            texts.append(text)
+            chars += len(text) + 1
+    return texts, False
+
+def _docx_paragraphs(path: str, max_chars: int) -> Tuple[List[str], bool]:
+    texts = []
+    chars = 0
+    with open(path, "rb") as stream:
+        for paragraph in Document(stream).paragraphs:
+            if chars >= max_chars:
+                return texts, True
+            # .text walks the paragraph's runs on every access
+            text = paragraph.text
+            texts.append(text)
+            chars += len(text) + 1
+    return texts, False
+
+def join_capped(texts: List[str], max_chars: int) -> str:
+    """One line per page/paragraph, cut at max_chars"""
+    text = "\n".join(texts)
+    if texts:
+        text += "\n"
+    return text[:max_chars]
+
+@dataclass
+class Extraction:
+    text: str
+    # PDF pages read; 0 for Word documents
+    pages: int
+    truncated: bool
+
+class ResumeExtractor:
+    """Bounded worker pool that reads resume text from spooled uploads"""
+
+    def __init__(
+        self,
+        kind: str = RESUME_EXTRACT_EXECUTOR,
+        workers: int = RESUME_EXTRACT_WORKERS,
+        pages_per_task: int = RESUME_EXTRACT_PAGES_PER_TASK,
+        max_pages: int = RESUME_EXTRACT_MAX_PAGES,
+        max_chars: int = RESUME_EXTRACT_MAX_CHARS,
+        timeout: float = RESUME_EXTRACT_TIMEOUT_SECONDS
+    ):
+        self.kind = kind
+        self.workers = max(workers, 1)
+        self.pages_per_task = max(pages_per_task, 1)
+        self.max_pages = max(max_pages, 1)
+        self.max_chars = max_chars
+        self.timeout = timeout
+        self._executor: Optional[Executor] = None
+        self._lock = Lock()
+        self.documents = 0
+        self.failed = 0
+        self.truncated = 0
+        self.timed_out = 0
+        self.pages = 0
+        self.bytes = 0
+        self.seconds = 0.0
+
+    async def extract(self, path: str, content_type: str) -> str:
+        return (await self.extract_document(path, content_type)).text
+
+    async def extract_document(self, path: str, content_type: str) -> Extraction:
+        """Capped text of the PDF or Word document at path; 400 if it can't be read"""
+        start = time.perf_counter()
+        try:
+            if content_type == PDF_CONTENT_TYPE:
+                extraction = await self._pdf(path)
+            else:
+                extraction = await self._docx(path)
+        except HTTPException:
+            with self._lock:
+                self.failed += 1
+            raise
+        except Exception as e:
+            with self._lock:
+                self.failed += 1
+            kind = "PDF" if content_type == PDF_CONTENT_TYPE else "Word document"
+            raise HTTPException(status_code=400, detail=f"Error reading {kind}: {str(e)}")
+
+        with self._lock:
+            self.documents += 1
+            self.pages += extraction.pages
+            self.truncated += extraction.truncated
+            self.bytes += os.path.getsize(path)
+            self.seconds += time.perf_counter() - start
+        return extraction
+
+    def shutdown(self):
+        """Stop the workers, dropping ranges that have not started"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "executor": self.kind,
+                "workers": self.workers,
+                "max_pages": self.max_pages,
+                "max_chars": self.max_chars,
+                "timeout_seconds": self.timeout,
+                "documents": self.documents,
+                "failed": self.failed,
+                "truncated": self.truncated,
+                "timed_out": self.timed_out,
+                "pages": self.pages,
+                "bytes": self.bytes,
+                "avg_extract_ms": round(self.seconds / self.documents * 1000, 3) if self.documents else 0.0
+            }
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context(WORKER_START_METHOD)
+                )
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="resume-extract")
+        return self._executor
+
+    def _submit(self, fn, *args) -> asyncio.Future:
+        return asyncio.wrap_future(self._get_executor().submit(fn, *args))
+
+    async def _pdf(self, path: str) -> Extraction:
+        # Workers check the wall clock between pages; the loop waits a little
+        # longer for a page that was already being read at the deadline
+        deadline = time.time() + self.timeout
+        try:
+            page_count = await asyncio.wait_for(self._submit(_pdf_page_count, path), self.timeout)
+        except asyncio.TimeoutError:
+            self._timed_out()
+        pages = min(page_count, self.max_pages)
+        # Every range reopens the document and re-reads its page tree, so
+        # there is no point cutting more ranges than there are workers
+        per_task = max(self.pages_per_task, -(-pages // self.workers))
+        ranges = [
+            self._submit(_pdf_pages, path, first, min(first + per_task, pages), self.max_chars, deadline)
+            for first in range(0, pages, per_task)
+        ]
+        if ranges:
+            await asyncio.wait(ranges, timeout=max(deadline - time.time(), 0) + 1)
+        late = [future for future in ranges if not future.done()]
+        for future in late:
+            future.cancel()
+        if ranges and ranges[0] in late:
+            self._timed_out()
+
+        texts: List[str] = []
+        truncated = page_count > pages or bool(late)
+        for future in ranges:
+            # Keep the leading ranges that finished; a gap would splice unrelated pages
+            if future in late:
+                break
+            range_texts, cut = future.result()
+            texts.extend(range_texts)
+            if cut:
+                truncated = True
+                break
+        if late:
+            with self._lock:
+                self.timed_out += 1
+        return Extraction(join_capped(texts, self.max_chars), len(texts), truncated)
+
+    def _timed_out(self):
+        with self._lock:
+            self.timed_out += 1
+        raise HTTPException(status_code=400, detail=f"Resume took longer than {self.timeout:.0f}s to read")
+
+    async def _docx(self, path: str) -> Extraction:
+        try:
+            texts, truncated = await asyncio.wait_for(self._submit(_docx_paragraphs, path, self.max_chars), self.timeout)
+        except asyncio.TimeoutError:
+            self._timed_out()
+        # Word documents carry no page breaks to count
+        return Extraction(join_capped(texts, self.max_chars), 0, truncated)
+
+resume_extractor = ResumeExtractor()
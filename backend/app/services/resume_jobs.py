@@ -0,0 +1,191 @@
+"""Resume analysis as background jobs.
+
+Submitting stores a queued job row and returns its id straight away; a fixed
+pool of worker tasks extracts the text from the spooled upload (on the
+ResumeExtractor pool) and runs the analysis (the LLM call runs in a thread),
+recording the outcome on the row and deleting the spool file. The
+row is the source of truth, so a poll answered by any worker process sees
+the result, and the student is also pushed a "notification" event over the
+WebSocket when the job finishes.
+
+The queue is bounded: when RESUME_JOB_QUEUE_SIZE uploads are already waiting,
+submit raises ResumeQueueFull instead of accepting work it cannot start soon.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+import asyncio
+import logging
+import os
+import time
+
+from fastapi import HTTPException
+
+from app.database import AsyncSessionLocal
+from app.models.resume import ResumeAnalysisJob
+from app.repository.resume_job_repository import ResumeJobRepository
+from app.services.resume_analyzer import analyze_resume_with_gemini
+from app.services.resume_extraction import discard_spool, resume_extractor
+from app.websocket.channel_websocket import notify_user
+
+logger = logging.getLogger(__name__)
+
+RESUME_JOB_WORKERS = int(os.getenv("RESUME_JOB_WORKERS", "2"))
+RESUME_JOB_QUEUE_SIZE = int(os.getenv("RESUME_JOB_QUEUE_SIZE", "50"))
+RESUME_JOB_TIMEOUT_SECONDS = float(os.getenv("RESUME_JOB_TIMEOUT_SECONDS", "120"))
+RESUME_MAX_UPLOAD_BYTES = int(os.getenv("RESUME_MAX_UPLOAD_BYTES", str(10 * 1024 * 1024)))
+
+class ResumeQueueFull(Exception):
+    """Too many resume analyses are already waiting"""
+
+@dataclass
+class PendingAnalysis:
+    job_id: UUID
+    student_id: UUID
+    content_type: str
+    # Spooled upload, deleted once the job is done with it
+    path: str
+
+class ResumeJobQueue:
+    """Bounded queue of resume analyses drained by a fixed pool of worker tasks"""
+
+    def __init__(
+        self,
+        session_factory=AsyncSessionLocal,
+        workers: int = RESUME_JOB_WORKERS,
+        max_queue: int = RESUME_JOB_QUEUE_SIZE,
+        timeout: float = RESUME_JOB_TIMEOUT_SECONDS,
+        notify=notify_user,
+        extractor=resume_extractor
+    ):
+        self.session_factory = session_factory
+        self.workers = max(workers, 1)
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.notify = notify
+        self.extractor = extractor
+        self.queue: Optional[asyncio.Queue] = None
+        self.tasks: List[asyncio.Task] = []
+        self.running = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.run_seconds = 0.0
+
+    def start(self):
+        if not self.tasks:
+            self.queue = asyncio.Queue(maxsize=self.max_queue)
+            self.tasks = [asyncio.ensure_future(self._run()) for _ in range(self.workers)]
+
+    async def stop(self):
+        """Cancel the workers; unfinished jobs stay queued/running on their rows"""
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        while self.queue is not None and not self.queue.empty():
+            discard_spool(self.queue.get_nowait().path)
+        self.tasks = []
+        self.queue = None
+
+    async def submit(self, student_id: UUID, filename: Optional[str], content_type: str, path: str) -> ResumeAnalysisJob:
+        """Record a job for the upload spooled at path and queue it
+
+        Raises ResumeQueueFull when the backlog is at capacity. The queue owns
+        path from here on: it is deleted when the job finishes or is rejected.
+        """
+        self.start()
+        if self.queue.full():
+            self.rejected += 1
+            discard_spool(path)
+            raise ResumeQueueFull("Resume analysis queue is full")
+
+        try:
+            job = await self._with_repository(lambda repo: repo.create_job(student_id, filename))
+        except BaseException:
+            discard_spool(path)
+            raise
+        try:
+            self.queue.put_nowait(PendingAnalysis(job.id, student_id, content_type, path))
+        except asyncio.QueueFull:
+            # Filled up while the row was being written
+            self.rejected += 1
+            discard_spool(path)
+            await self._with_repository(lambda repo: repo.mark_failed(job.id, "Resume analysis queue is full"))
+            raise ResumeQueueFull("Resume analysis queue is full")
+
+        self.submitted += 1
+        return job
+
+    async def get(self, job_id: UUID, student_id: UUID) -> Optional[ResumeAnalysisJob]:
+        return await self._with_repository(lambda repo: repo.get_job(job_id, student_id))
+
+    def stats(self) -> Dict[str, Any]:
+        finished = self.completed + self.failed
+        return {
+            "workers": self.workers,
+            "queued": self.queue.qsize() if self.queue else 0,
+            "max_queue": self.max_queue,
+            "running": self.running,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "avg_run_ms": round(self.run_seconds / finished * 1000, 3) if finished else 0.0
+        }
+
+    async def _with_repository(self, operation):
+        async with self.session_factory() as db:
+            return await db.run_sync(lambda session: operation(ResumeJobRepository(session)))
+
+    async def _run(self):
+        while True:
+            pending = await self.queue.get()
+            self.running += 1
+            try:
+                await self._process(pending)
+            finally:
+                discard_spool(pending.path)
+                self.running -= 1
+                self.queue.task_done()
+
+    async def _process(self, pending: PendingAnalysis):
+        start = time.perf_counter()
+        result: Optional[dict] = None
+        error: Optional[str] = None
+        try:
+            await self._with_repository(lambda repo: repo.mark_running(pending.job_id))
+            resume_text = await self.extractor.extract(pending.path, pending.content_type)
+            result = await asyncio.wait_for(analyze_resume_with_gemini(resume_text), self.timeout)
+        except HTTPException as e:
+            error = e.detail
+        except asyncio.TimeoutError:
+            error = f"Resume analysis took longer than {self.timeout:.0f}s"
+        except Exception as e:
+            logger.error(f"Error analyzing resume for job {pending.job_id}: {e}")
+            error = "Unexpected error while analyzing the resume."
+
+        try:
+            if error is None:
+                await self._with_repository(lambda repo: repo.mark_completed(pending.job_id, result))
+                self.completed += 1
+            else:
+                await self._with_repository(lambda repo: repo.mark_failed(pending.job_id, error))
+                self.failed += 1
+        except Exception as e:
+            logger.error(f"Error recording resume analysis job {pending.job_id}: {e}")
+            return
+        finally:
+            self.run_seconds += time.perf_counter() - start
+
+        try:
+            await self.notify(pending.student_id, {
+                "type": "resume_analysis",
+                "job_id": str(pending.job_id),
+                "status": "completed" if error is None else "failed"
+            })
+        except Exception as e:
+            logger.warning(f"Could not notify student about resume analysis job {pending.job_id}: {e}")
+
+resume_jobs = ResumeJobQueue()
@@ -1,5 +1,7 @@
 from .auth import verify_password, hash_password, create_token, get_current_user
 from .rate_limiter import limiter, rate_limit_exceeded_handler
+from .pagination import encode_cursor, decode_cursor
+from .responses import FastJSONResponse, etag_response
 
 
 __all__ = [
@@ -8,5 +10,9 @@ __all__ = [
   "create_token",
   "get_current_user",
   "limiter",
-  "rate_limit_exceeded_handler"
+  "rate_limit_exceeded_handler",
+  "encode_cursor",
+  "decode_cursor",
+  "FastJSONResponse",
+  "etag_response"
 ]
\ No newline at end of file
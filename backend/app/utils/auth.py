@@ -2,18 +2,112 @@ from passlib.context import CryptContext
 from jose import jwt, JWTError
 from datetime import timedelta, datetime, UTC
 from typing import Optional
+from dataclasses import dataclass
+from uuid import UUID
 import os
 from fastapi import Depends, HTTPException, status, Request
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from app.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_db, get_async_db
 from app.models import Students, Professors
-
-pwd_context = CryptContext(schemes=['bcrypt'], deprecated="auto")
+from app.utils.cache import cache_from_env
+
+# New hashes use PASSWORD_SCHEME (bcrypt or argon2, which is argon2id). Hashes
+# in the other scheme or below the configured cost still verify and report
+# needs_update, so they are upgraded on the user's next login.
+PASSWORD_SCHEME = os.getenv("PASSWORD_SCHEME", "bcrypt").lower()
+# bcrypt cost factor; each +1 doubles the time per hash and verify
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+# argon2id memory in KiB, passes over it, and lanes
+ARGON2_MEMORY_COST = int(os.getenv("ARGON2_MEMORY_COST", "65536"))
+ARGON2_TIME_COST = int(os.getenv("ARGON2_TIME_COST", "3"))
+ARGON2_PARALLELISM = int(os.getenv("ARGON2_PARALLELISM", "1"))
+
+def make_password_context(
+  scheme: str = PASSWORD_SCHEME,
+  bcrypt_rounds: int = BCRYPT_ROUNDS,
+  argon2_memory_cost: int = ARGON2_MEMORY_COST,
+  argon2_time_cost: int = ARGON2_TIME_COST,
+  argon2_parallelism: int = ARGON2_PARALLELISM
+) -> CryptContext:
+  """Hash new passwords with scheme; verify both schemes and flag weaker hashes for upgrade"""
+  if scheme not in ("bcrypt", "argon2"):
+    raise ValueError(f"Unsupported password scheme: {scheme}")
+
+  return CryptContext(
+    schemes=[scheme] + [other for other in ("argon2", "bcrypt") if other != scheme],
+    default=scheme,
+    deprecated="auto",
+    bcrypt__rounds=bcrypt_rounds,
+    bcrypt__min_rounds=bcrypt_rounds,
+    argon2__type="ID",
+    argon2__memory_cost=argon2_memory_cost,
+    argon2__rounds=argon2_time_cost,
+    argon2__min_rounds=argon2_time_cost,
+    argon2__parallelism=argon2_parallelism
+  )
+
+pwd_context = make_password_context()
 
 SECRET_KEY = os.getenv("SECRET_KEY", "fallback-secret-key")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "200"))
 
+# Authenticated principals by (role, token subject), set PRINCIPAL_CACHE_ENABLED=false to disable.
+# Invalidations are repeated on the other workers over the WebSocket backplane,
+# and PRINCIPAL_CACHE_TTL_SECONDS bounds staleness if one goes missing.
+principal_cache = cache_from_env("principal", "PRINCIPAL", default_size=5000, default_ttl=60)
+
+@dataclass(frozen=True)
+class Principal:
+  """Identity of an authenticated user, detached from any database session"""
+  id: UUID
+  name: str
+  email: Optional[str] = None
+  usn: Optional[str] = None
+
+def invalidate_principal(role: str, subject: str):
+  """Forget a cached principal after the user's profile or password changes"""
+  principal_cache.invalidate((role, subject))
+
+def _to_principal(user, role: str, email_or_usn: str) -> Principal:
+  """Build a principal from a loaded user row and cache it"""
+  if user is None:
+    raise HTTPException(status_code=403, detail="User not found")
+
+  principal = Principal(
+    id=user.id,
+    name=user.name,
+    email=user.email,
+    usn=getattr(user, "usn", None)
+  )
+  principal_cache.set((role, email_or_usn), principal)
+  return principal
+
+def _principal_query(email_or_usn: str, role: str):
+  if role == "student":
+    return select(Students).where(Students.usn == email_or_usn)
+  return select(Professors).where(Professors.email == email_or_usn)
+
+def _load_principal(email_or_usn: str, role: str, db: Session) -> Principal:
+  """Resolve a token subject to a principal, hitting the database only on a cache miss"""
+  principal = principal_cache.get((role, email_or_usn))
+  if principal is not None:
+    return principal
+
+  user = db.execute(_principal_query(email_or_usn, role)).scalars().first()
+  return _to_principal(user, role, email_or_usn)
+
+async def _load_principal_async(email_or_usn: str, role: str, db: AsyncSession) -> Principal:
+  """Same as _load_principal, on an async session"""
+  principal = principal_cache.get((role, email_or_usn))
+  if principal is not None:
+    return principal
+
+  user = (await db.execute(_principal_query(email_or_usn, role))).scalars().first()
+  return _to_principal(user, role, email_or_usn)
+
 def hash_password(password: str):
   return pwd_context.hash(password)
 
@@ -36,10 +130,7 @@ def create_token(data: dict, expires_delta: Optional[timedelta] = None) -> str :
   
   return encoded_jwt
 
-def get_current_user(
-    request: Request,
-    db: Session = Depends(get_db)
-):
+def _token_from_request(request: Request) -> str:
     token = request.cookies.get("access_token")
 
     if not token:
@@ -51,46 +142,42 @@ def get_current_user(
     if token.startswith("Bearer "):
         token = token.split(" ")[1]
 
+    return token
+
+def _decode_token(token: str):
+    """Return the (subject, role) pair of a valid token"""
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=ALGORITHM)
-        email_or_usn = payload.get("sub")
-        role = payload.get("role")
+    except JWTError:
+        raise HTTPException(status_code=403, detail="Token is invalid or expired")
 
-        if email_or_usn is None or role is None:
-            raise HTTPException(status_code=403, detail="Invalid credentials")
+    email_or_usn = payload.get("sub")
+    role = payload.get("role")
 
-        if role == "student":
-            user = db.query(Students).filter(Students.usn == email_or_usn).first()
-        else:
-            user = db.query(Professors).filter(Professors.email == email_or_usn).first()
+    if email_or_usn is None or role is None:
+        raise HTTPException(status_code=403, detail="Invalid credentials")
 
-        if user is None:
-            raise HTTPException(status_code=403, detail="User not found")
+    return email_or_usn, role
 
-        return {"user": user, "role": role}
+def get_current_user(
+    request: Request,
+    db: Session = Depends(get_db)
+):
+    return get_current_user_from_token(_token_from_request(request), db)
 
-    except JWTError:
-        raise HTTPException(status_code=403, detail="Token is invalid or expired")
+async def get_current_user_async(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """get_current_user for routes on the async session, so they don't also check out a sync one"""
+    email_or_usn, role = _decode_token(_token_from_request(request))
+    user = await _load_principal_async(email_or_usn, role, db)
+
+    return {"user": user, "role": role}
 
 def get_current_user_from_token(token: str, db: Session):
     """Get current user from token string"""
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=ALGORITHM)
-        email_or_usn = payload.get("sub")
-        role = payload.get("role")
-
-        if email_or_usn is None or role is None:
-            raise HTTPException(status_code=403, detail="Invalid credentials")
-
-        if role == "student":
-            user = db.query(Students).filter(Students.usn == email_or_usn).first()
-        else:
-            user = db.query(Professors).filter(Professors.email == email_or_usn).first()
+    email_or_usn, role = _decode_token(token)
+    user = _load_principal(email_or_usn, role, db)
 
-        if user is None:
-            raise HTTPException(status_code=403, detail="User not found")
-
-        return {"user": user, "role": role}
-
-    except JWTError:
-        raise HTTPException(status_code=403, detail="Token is invalid or expired")
\ No newline at end of file
+    return {"user": user, "role": role}
\ No newline at end of file
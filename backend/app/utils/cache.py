@@ -0,0 +1,137 @@
+"""In-process TTL/LRU caches with hit and miss counters."""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+# Every cache created in the process, for the metrics endpoint
+_registry: List["TTLCache"] = []
+
+# Called with (cache name, key) after a key is invalidated here, so the other
+# worker processes can drop their copy too; the WebSocket backplane listens
+invalidation_listeners: List[Callable[[str, Hashable], None]] = []
+
+class TTLCache:
+  """Size-bounded LRU cache whose entries expire a fixed time after being set."""
+
+  def __init__(self, name: str, maxsize: int, ttl: float, enabled: bool = True):
+    self.name = name
+    self.maxsize = maxsize
+    self.ttl = ttl
+    self.enabled = enabled and maxsize > 0 and ttl > 0
+    self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+    self._lock = threading.Lock()
+    self.hits = 0
+    self.misses = 0
+    self.evictions = 0
+    _registry.append(self)
+
+  def get(self, key: Hashable, default: Any = None) -> Any:
+    """Return the cached value for key, or default if it is missing or expired."""
+    if not self.enabled:
+      return default
+
+    with self._lock:
+      entry = self._entries.get(key, _MISSING)
+      if entry is _MISSING:
+        self.misses += 1
+        return default
+
+      expires_at, value = entry
+      if expires_at <= time.monotonic():
+        del self._entries[key]
+        self.misses += 1
+        return default
+
+      self._entries.move_to_end(key)
+      self.hits += 1
+      return value
+
+  def get_many(self, keys: Iterable[Hashable]) -> Dict[Hashable, Any]:
+    """Return the cached values for the keys that are present."""
+    found = {}
+    for key in keys:
+      value = self.get(key, _MISSING)
+      if value is not _MISSING:
+        found[key] = value
+    return found
+
+  def set(self, key: Hashable, value: Any) -> None:
+    """Cache value under key, evicting the least recently used entry when full."""
+    if not self.enabled:
+      return
+
+    with self._lock:
+      self._entries[key] = (time.monotonic() + self.ttl, value)
+      self._entries.move_to_end(key)
+      while len(self._entries) > self.maxsize:
+        self._entries.popitem(last=False)
+        self.evictions += 1
+
+  def invalidate(self, key: Hashable, notify: bool = True) -> None:
+    """Drop a single entry, here and (if notify) in the other workers."""
+    with self._lock:
+      self._entries.pop(key, None)
+    if notify:
+      for listener in invalidation_listeners:
+        try:
+          listener(self.name, key)
+        except Exception as e:
+          logger.error(f"Error in cache invalidation listener: {e}")
+
+  def clear(self) -> None:
+    """Drop every entry."""
+    with self._lock:
+      self._entries.clear()
+
+  def stats(self) -> Dict[str, Any]:
+    """Snapshot of size and hit/miss counters."""
+    with self._lock:
+      lookups = self.hits + self.misses
+      return {
+        "name": self.name,
+        "enabled": self.enabled,
+        "size": len(self._entries),
+        "maxsize": self.maxsize,
+        "ttl_seconds": self.ttl,
+        "hits": self.hits,
+        "misses": self.misses,
+        "evictions": self.evictions,
+        "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0
+      }
+
+def cache_from_env(name: str, prefix: str, default_size: int, default_ttl: float) -> TTLCache:
+  """Build a cache sized by <PREFIX>_CACHE_SIZE / <PREFIX>_CACHE_TTL_SECONDS / <PREFIX>_CACHE_ENABLED."""
+  return TTLCache(
+    name=name,
+    maxsize=int(os.getenv(f"{prefix}_CACHE_SIZE", str(default_size))),
+    ttl=float(os.getenv(f"{prefix}_CACHE_TTL_SECONDS", str(default_ttl))),
+    enabled=os.getenv(f"{prefix}_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+  )
+
+def get_cache(name: str) -> Optional[TTLCache]:
+  """The cache registered under name in this process, if any."""
+  for cache in _registry:
+    if cache.name == name:
+      return cache
+  return None
+
+def encode_key(key: tuple) -> list:
+  """JSON-safe form of a tuple key of strings and UUIDs."""
+  return [{"uuid": str(part)} if isinstance(part, UUID) else part for part in key]
+
+def decode_key(parts: list) -> tuple:
+  """Inverse of encode_key."""
+  return tuple(UUID(part["uuid"]) if isinstance(part, dict) else part for part in parts)
+
+def all_cache_stats() -> List[Dict[str, Any]]:
+  """Stats for every cache in the process."""
+  return [cache.stats() for cache in _registry]
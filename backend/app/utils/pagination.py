@@ -0,0 +1,25 @@
+"""Opaque cursor helpers for keyset pagination."""
+
+import base64
+import binascii
+import json
+from typing import List
+
+def encode_cursor(*values) -> str:
+  """Encode the sort key of the last returned row into an opaque cursor."""
+  payload = json.dumps([str(value) for value in values], separators=(",", ":"))
+  return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str, size: int) -> List[str]:
+  """Decode a cursor produced by encode_cursor, raising ValueError if it is malformed."""
+  try:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+  except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+    raise ValueError("Invalid cursor") from e
+
+  # encode_cursor only writes strings; anything else is a hand-made cursor
+  if not isinstance(values, list) or len(values) != size or not all(isinstance(value, str) for value in values):
+    raise ValueError("Invalid cursor")
+
+  return values
@@ -0,0 +1,57 @@
+"""Fast JSON response class, the application default.
+
+Validated Pydantic models (or lists of them) returned inside the response are
+serialized straight to bytes by pydantic-core, without building the
+intermediate dict that FastAPI's response_model path produces. Anything else
+(the dicts FastAPI hands over for endpoints that return models normally)
+goes through orjson, which handles UUID and datetime natively. Without orjson
+installed it falls back to the standard library encoder.
+"""
+
+import hashlib
+from typing import Any
+
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+try:
+  import orjson
+except ImportError:  # pragma: no cover - optional speedup
+  orjson = None
+
+# "Z" for UTC like Pydantic, keys that are UUIDs/ints like jsonable_encoder
+_ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS if orjson else 0
+
+def _is_model_content(content: Any) -> bool:
+  if isinstance(content, BaseModel):
+    return True
+  return isinstance(content, list) and bool(content) and all(isinstance(item, BaseModel) for item in content)
+
+class FastJSONResponse(JSONResponse):
+  """JSONResponse that serializes models with pydantic-core and everything else with orjson."""
+
+  def render(self, content: Any) -> bytes:
+    if _is_model_content(content):
+      return to_json(content)
+    if orjson is not None:
+      return orjson.dumps(content, default=jsonable_encoder, option=_ORJSON_OPTIONS)
+    return super().render(jsonable_encoder(content))
+
+def etag_response(request: Request, content: Any) -> Response:
+  """FastJSONResponse carrying an ETag of its body, or 304 when the client's If-None-Match matches."""
+  response = FastJSONResponse(content)
+  etag = '"' + hashlib.blake2b(response.body, digest_size=16).hexdigest() + '"'
+  headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+  if_none_match = request.headers.get("if-none-match")
+  if if_none_match:
+    # Weak comparison, as RFC 9110 requires for If-None-Match
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if etag in candidates or "*" in candidates:
+      return Response(status_code=304, headers=headers)
+
+  response.headers.update(headers)
+  return response
@@ -0,0 +1,90 @@
+"""Cached directory of user display data shared by the channel, feed and profile code."""
+
+from sqlalchemy.orm import Session
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Tuple
+from uuid import UUID
+from app.models import Students, Professors
+from app.utils.cache import cache_from_env
+
+UserKey = Tuple[str, UUID]
+
+@dataclass(frozen=True)
+class UserEntry:
+    """Display data for a student or professor"""
+    id: UUID
+    role: str  # "student" or "professor"
+    name: str
+    email: Optional[str] = None
+    usn: Optional[str] = None
+    department: Optional[str] = None
+    # Users have no avatar column yet, so this stays None on every path
+    avatar_url: Optional[str] = None
+
+# Shared by every UserDirectory in the process. invalidate_user reaches the
+# other workers over the WebSocket backplane; if a notice is lost, the entry
+# is stale for at most USER_DIRECTORY_CACHE_TTL_SECONDS
+user_directory_cache = cache_from_env("user_directory", "USER_DIRECTORY", default_size=10000, default_ttl=300)
+
+def user_key(user_role: Any, user_id: UUID) -> UserKey:
+    """Normalize a (role, id) pair, anything other than a student is a professor"""
+    return ("student" if user_role == "student" else "professor", user_id)
+
+def entry_from_user(user, role: str) -> UserEntry:
+    """Build a directory entry from a Students or Professors row or projection"""
+    return UserEntry(
+        id=user.id,
+        role=role,
+        name=user.name,
+        email=user.email,
+        usn=getattr(user, "usn", None),
+        department=getattr(user, "department", None),
+        avatar_url=getattr(user, "avatar_url", None)
+    )
+
+def invalidate_user(user_role: Any, user_id: UUID) -> None:
+    """Drop a user's cached display data after it changes"""
+    user_directory_cache.invalidate(user_key(user_role, user_id))
+
+class UserDirectory:
+    """Cached lookup of user display data keyed by (role, id)"""
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.cache = user_directory_cache
+
+    def get_user(self, user_role: Any, user_id: UUID) -> Optional[UserEntry]:
+        """Get display data for a single user"""
+        key = user_key(user_role, user_id)
+        return self.get_users([key]).get(key)
+
+    def get_users(self, users: Iterable[Tuple[Any, UUID]]) -> Dict[UserKey, UserEntry]:
+        """Get display data for many users, with at most one query per role for cache misses"""
+        keys = {user_key(user_role, user_id) for user_role, user_id in users}
+        entries = self.cache.get_many(keys)
+
+        missing = keys - entries.keys()
+        student_ids = [user_id for role, user_id in missing if role == "student"]
+        professor_ids = [user_id for role, user_id in missing if role == "professor"]
+
+        if student_ids:
+            rows = self.db.query(Students.id, Students.name, Students.email, Students.usn, Students.department)\
+                .filter(Students.id.in_(student_ids))
+            for row in rows:
+                entries[("student", row.id)] = self.prime(entry_from_user(row, "student"))
+        if professor_ids:
+            rows = self.db.query(Professors.id, Professors.name, Professors.email, Professors.department)\
+                .filter(Professors.id.in_(professor_ids))
+            for row in rows:
+                entries[("professor", row.id)] = self.prime(entry_from_user(row, "professor"))
+
+        return entries
+
+    def get_names(self, users: Iterable[Tuple[Any, UUID]]) -> Dict[UserKey, str]:
+        """Get display names for many users"""
+        return {key: entry.name for key, entry in self.get_users(users).items()}
+
+    def prime(self, entry: UserEntry) -> UserEntry:
+        """Store an entry loaded elsewhere so later lookups hit the cache"""
+        self.cache.set((entry.role, entry.id), entry)
+        return entry
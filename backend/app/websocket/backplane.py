@@ -0,0 +1,251 @@
+"""Pub/sub backplane fanning WebSocket events out across worker processes.
+
+Every ConnectionManager delivers an event to its own sockets and publishes it
+on the backplane; the other managers subscribed to the same backplane deliver
+it to theirs. Envelopes carry the publishing node id so a node never delivers
+its own event twice.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import asyncio
+import json
+import logging
+import os
+import uuid
+
+from app.database import DATABASE_URL
+
+logger = logging.getLogger(__name__)
+
+EnvelopeHandler = Callable[[dict], Awaitable[None]]
+
+class Backplane:
+    """Interface for broadcast backends shared by all WebSocket nodes"""
+
+    async def start(self, handler: EnvelopeHandler):
+        """Begin delivering envelopes published by other nodes to handler"""
+        raise NotImplementedError
+
+    async def stop(self):
+        """Stop listening and release resources"""
+        raise NotImplementedError
+
+    async def publish(self, envelope: dict):
+        """Publish an envelope to every subscribed node"""
+        raise NotImplementedError
+
+    def stats(self) -> Dict[str, Any]:
+        return {"kind": type(self).__name__}
+
+class InMemoryHub:
+    """Process-local message bus shared by InMemoryBackplane instances"""
+
+    def __init__(self):
+        self.handlers: List[EnvelopeHandler] = []
+
+    async def publish(self, envelope: dict):
+        for handler in list(self.handlers):
+            try:
+                await handler(envelope)
+            except Exception as e:
+                logger.error(f"Error delivering backplane envelope: {e}")
+
+_default_hub = InMemoryHub()
+
+class InMemoryBackplane(Backplane):
+    """Backplane for a single process; several instances on one hub simulate several nodes"""
+
+    def __init__(self, hub: Optional[InMemoryHub] = None):
+        self.hub = hub or _default_hub
+        self.handler: Optional[EnvelopeHandler] = None
+
+    async def start(self, handler: EnvelopeHandler):
+        self.handler = handler
+        self.hub.handlers.append(handler)
+
+    async def stop(self):
+        if self.handler in self.hub.handlers:
+            self.hub.handlers.remove(self.handler)
+        self.handler = None
+
+    async def publish(self, envelope: dict):
+        await self.hub.publish(envelope)
+
+class PostgresBackplane(Backplane):
+    """Backplane over Postgres LISTEN/NOTIFY
+
+    NOTIFY payloads are limited to 8000 bytes, so larger envelopes are split
+    into chunks that the receiving nodes reassemble.
+
+    LISTEN lives on one dedicated connection. A supervisor task replaces it
+    when asyncpg reports it terminated, or when a health check query on it
+    fails (a failover can drop the socket without closing it), retrying with
+    exponential backoff. Notifications sent while it is down are lost; local
+    delivery is unaffected.
+    """
+
+    # Leaves headroom below the 8000 byte limit for the chunk header
+    max_chunk_size = 7000
+
+    def __init__(
+        self,
+        dsn: str,
+        channel: str = "campus_connect_ws",
+        health_check_interval: float = 30.0,
+        reconnect_min_delay: float = 0.5,
+        reconnect_max_delay: float = 30.0
+    ):
+        self.dsn = dsn
+        self.channel = channel
+        self.health_check_interval = health_check_interval
+        self.reconnect_min_delay = reconnect_min_delay
+        self.reconnect_max_delay = reconnect_max_delay
+        self.handler: Optional[EnvelopeHandler] = None
+        self.listen_conn = None
+        self.publish_pool = None
+        self.partial: Dict[str, List[Optional[str]]] = {}
+        self.supervisor: Optional[asyncio.Task] = None
+        self.lost = asyncio.Event()
+        self.disconnects = 0
+        self.reconnects = 0
+        self.reconnect_failures = 0
+
+    async def start(self, handler: EnvelopeHandler):
+        import asyncpg
+
+        self.handler = handler
+        self.publish_pool = await asyncpg.create_pool(self.dsn, min_size=1, max_size=4)
+        await self._listen()
+        self.supervisor = asyncio.ensure_future(self._supervise())
+
+    async def stop(self):
+        if self.supervisor is not None:
+            self.supervisor.cancel()
+            await asyncio.gather(self.supervisor, return_exceptions=True)
+            self.supervisor = None
+        if self.listen_conn is not None:
+            conn, self.listen_conn = self.listen_conn, None
+            try:
+                await conn.remove_listener(self.channel, self._on_notify)
+                await conn.close()
+            except Exception:
+                conn.terminate()
+        if self.publish_pool is not None:
+            await self.publish_pool.close()
+            self.publish_pool = None
+        self.partial.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "kind": type(self).__name__,
+            "listening": self.listen_conn is not None and not self.listen_conn.is_closed(),
+            "disconnects": self.disconnects,
+            "reconnects": self.reconnects,
+            "reconnect_failures": self.reconnect_failures
+        }
+
+    async def _listen(self):
+        import asyncpg
+
+        conn = await asyncpg.connect(self.dsn)
+        try:
+            await conn.add_listener(self.channel, self._on_notify)
+        except BaseException:
+            conn.terminate()
+            raise
+        conn.add_termination_listener(self._on_terminated)
+        self.lost.clear()
+        self.listen_conn = conn
+
+    def _on_terminated(self, connection):
+        if connection is self.listen_conn:
+            self.lost.set()
+
+    async def _supervise(self):
+        while True:
+            try:
+                await asyncio.wait_for(self.lost.wait(), timeout=self.health_check_interval)
+                logger.warning(f"Backplane LISTEN connection on {self.channel} was closed, reconnecting")
+            except asyncio.TimeoutError:
+                try:
+                    await asyncio.wait_for(self.listen_conn.fetchval("SELECT 1"), timeout=self.health_check_interval)
+                    continue
+                except Exception as e:
+                    logger.warning(f"Backplane LISTEN connection on {self.channel} failed its health check, reconnecting: {e}")
+            await self._reconnect()
+
+    async def _reconnect(self):
+        self.disconnects += 1
+        conn, self.listen_conn = self.listen_conn, None
+        if conn is not None:
+            conn.terminate()
+        # Chunks of envelopes cut off by the outage can never complete
+        self.partial.clear()
+
+        delay = self.reconnect_min_delay
+        while True:
+            try:
+                await self._listen()
+                break
+            except Exception as e:
+                self.reconnect_failures += 1
+                logger.warning(f"Backplane reconnect failed, retrying in {delay:.1f}s: {e}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.reconnect_max_delay)
+
+        self.reconnects += 1
+        logger.info(f"Backplane LISTEN on {self.channel} restored after {self.disconnects} disconnect(s)")
+
+    async def publish(self, envelope: dict):
+        if self.publish_pool is None:
+            raise RuntimeError("Backplane is not started")
+
+        data = json.dumps(envelope)
+        if len(data.encode()) <= self.max_chunk_size:
+            payloads = [data]
+        else:
+            message_id = uuid.uuid4().hex
+            chunk_chars = self.max_chunk_size // 4  # worst case UTF-8 width
+            parts = [data[i:i + chunk_chars] for i in range(0, len(data), chunk_chars)]
+            payloads = [
+                json.dumps({"chunk": message_id, "index": index, "count": len(parts), "data": part})
+                for index, part in enumerate(parts)
+            ]
+
+        async with self.publish_pool.acquire() as conn:
+            for payload in payloads:
+                await conn.execute("SELECT pg_notify($1, $2)", self.channel, payload)
+
+    def _on_notify(self, connection, pid, channel, payload):
+        message = json.loads(payload)
+        if "chunk" in message:
+            if message["chunk"] not in self.partial and len(self.partial) >= 256:
+                # Drop the oldest incomplete envelope rather than growing without bound
+                self.partial.pop(next(iter(self.partial)))
+            parts = self.partial.setdefault(message["chunk"], [None] * message["count"])
+            parts[message["index"]] = message["data"]
+            if any(part is None for part in parts):
+                return
+            del self.partial[message["chunk"]]
+            message = json.loads("".join(parts))
+
+        if self.handler is not None:
+            asyncio.ensure_future(self.handler(message))
+
+def to_asyncpg_dsn(url: str) -> str:
+    """Strip the SQLAlchemy driver suffix so asyncpg accepts the URL"""
+    scheme, sep, rest = url.partition("://")
+    return f"{scheme.split('+')[0]}{sep}{rest}"
+
+def backplane_from_env() -> Backplane:
+    """Backplane selected by WS_BACKPLANE (memory or postgres)"""
+    kind = os.getenv("WS_BACKPLANE", "memory").lower()
+    if kind == "postgres":
+        return PostgresBackplane(
+            to_asyncpg_dsn(os.getenv("WS_BACKPLANE_URL", DATABASE_URL)),
+            channel=os.getenv("WS_BACKPLANE_CHANNEL", "campus_connect_ws"),
+            health_check_interval=float(os.getenv("WS_BACKPLANE_HEALTH_CHECK_SECONDS", "30"))
+        )
+    if kind != "memory":
+        raise ValueError(f"Unknown WS_BACKPLANE: {kind}")
+    return InMemoryBackplane()
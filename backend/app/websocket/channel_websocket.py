@@ -1,41 +1,74 @@
 from fastapi import WebSocket, WebSocketDisconnect, Depends, HTTPException, status
-from sqlalchemy.orm import Session
 from typing import Dict, List, Set, Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 from datetime import datetime
-import json
 import asyncio
 import logging
+import time
 
-from app.database import get_db
-from app.services.channel_service import ChannelService
-from app.schemas import MessageEvent, TypingEvent, UserPresenceEvent, WebSocketEvent
+from app.database import AsyncSessionLocal
+from app.repository.async_repository import AsyncChannelRepository
+from app.repository.channel_repository import membership_listeners
+from app.services.async_services import AsyncChannelService
+from app.utils.cache import invalidation_listeners, get_cache, encode_key, decode_key
+from app.schemas import (
+    MessageEvent, TypingUsersEvent, TypingUser, UserPresenceEvent, WebSocketEvent,
+    MessageCreate, MessageReactionCreate, CreatorRoleEnum
+)
 from app.utils.auth import get_current_user_from_token
+from .backplane import Backplane, backplane_from_env
+from .outbound import ClientConnection, fanout_stats, SLOW_CONSUMER_CLOSE_CODE
+from .typing_tracker import TypingTracker, TYPING_FLUSH_INTERVAL_SECONDS
+from .message_writer import message_writer
+from .protocol import Frame, negotiate
 
 logger = logging.getLogger(__name__)
 
+def encode_event(event_type: str, data) -> Frame:
+    """Build an event once; every recipient and the backplane share the same frame"""
+    return Frame.build(event_type, data)
+
 class ConnectionManager:
-    def __init__(self):
+    def __init__(self, backplane: Optional[Backplane] = None):
+        # Shared bus reaching the managers in other worker processes
+        self.backplane = backplane or backplane_from_env()
+        self.node_id = uuid4().hex
+        self.started = False
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
         # Store active connections by user_id
-        self.active_connections: Dict[UUID, WebSocket] = {}
+        self.active_connections: Dict[UUID, ClientConnection] = {}
         # Store user presence by channel
         self.channel_presence: Dict[UUID, Set[UUID]] = {}
-        # Store typing indicators by channel
-        self.typing_users: Dict[UUID, Dict[UUID, datetime]] = {}
+        # Typing indicators, flushed as one event per channel per interval
+        self.typing = TypingTracker()
+        self.typing_task: Optional[asyncio.Task] = None
         # Store user info for connections
         self.user_info: Dict[UUID, Dict] = {}
 
-    async def connect(self, websocket: WebSocket, user_id: UUID, user_info: Dict):
-        """Accept WebSocket connection and store user info"""
-        await websocket.accept()
-        self.active_connections[user_id] = websocket
+    async def connect(self, websocket: WebSocket, user_id: UUID, user_info: Dict, channels: Set[UUID]) -> ClientConnection:
+        """Accept WebSocket connection on the negotiated protocol and store user info and channel memberships"""
+        protocol, subprotocol = negotiate(websocket)
+        await websocket.accept(subprotocol=subprotocol)
+        previous = self.active_connections.get(user_id)
+        if previous is not None:
+            previous.close()
+
+        connection = ClientConnection(
+            websocket,
+            on_error=lambda conn: self.drop_connection(user_id, conn),
+            protocol=protocol
+        )
+        connection.channels = set(channels)
+        connection.start()
+        self.active_connections[user_id] = connection
         self.user_info[user_id] = user_info
         logger.info(f"User {user_id} connected to WebSocket")
+        return connection
 
     def disconnect(self, user_id: UUID):
         """Remove user connection and clean up presence"""
         if user_id in self.active_connections:
-            del self.active_connections[user_id]
+            self.active_connections.pop(user_id).close()
         
         if user_id in self.user_info:
             del self.user_info[user_id]
@@ -47,43 +80,203 @@ class ConnectionManager:
                 del self.channel_presence[channel_id]
         
         # Remove from typing indicators
-        for channel_id in list(self.typing_users.keys()):
-            if user_id in self.typing_users[channel_id]:
-                del self.typing_users[channel_id][user_id]
-            if not self.typing_users[channel_id]:
-                del self.typing_users[channel_id]
+        self.typing.remove_user(user_id)
         
         logger.info(f"User {user_id} disconnected from WebSocket")
 
-    async def send_personal_message(self, message: str, user_id: UUID):
-        """Send message to specific user"""
-        if user_id in self.active_connections:
-            try:
-                await self.active_connections[user_id].send_text(message)
-            except Exception as e:
-                logger.error(f"Error sending personal message to {user_id}: {e}")
-                self.disconnect(user_id)
+    async def start(self):
+        """Subscribe to the backplane"""
+        if not self.started:
+            self.started = True
+            self.loop = asyncio.get_running_loop()
+            self.typing_task = asyncio.ensure_future(self.flush_typing())
+            await self.backplane.start(self.handle_envelope)
+
+    async def stop(self):
+        """Unsubscribe from the backplane"""
+        if self.started:
+            self.started = False
+            if self.typing_task is not None:
+                self.typing_task.cancel()
+                self.typing_task = None
+            await self.backplane.stop()
 
-    async def send_to_channel(self, message: str, channel_id: UUID, exclude_user: Optional[UUID] = None):
-        """Send message to all users in a channel"""
+    async def publish(self, envelope: dict):
+        """Publish an event for the other nodes; local sockets are served by the caller"""
+        await self.start()
+        envelope["origin"] = self.node_id
+        try:
+            await self.backplane.publish(envelope)
+        except Exception as e:
+            logger.error(f"Error publishing to backplane: {e}")
+
+    async def handle_envelope(self, envelope: dict):
+        """Deliver an event published by another node to local sockets"""
+        if envelope.get("origin") == self.node_id:
+            return
+
+        if envelope["kind"] == "channel":
+            exclude_user = envelope.get("exclude_user")
+            self.deliver_to_channel(
+                Frame(envelope["message"]),
+                UUID(envelope["target"]),
+                UUID(exclude_user) if exclude_user else None,
+                envelope.get("coalesce_key")
+            )
+        elif envelope["kind"] == "user":
+            self.deliver_to_user(Frame(envelope["message"]), UUID(envelope["target"]))
+        elif envelope["kind"] == "typing":
+            self.set_typing(
+                UUID(envelope["user_id"]),
+                envelope["user_name"],
+                UUID(envelope["target"]),
+                envelope["is_typing"]
+            )
+        elif envelope["kind"] == "membership":
+            member_id = envelope.get("member_id")
+            self.apply_membership(
+                UUID(envelope["target"]),
+                UUID(member_id) if member_id else None,
+                envelope["is_member"]
+            )
+        elif envelope["kind"] == "invalidate":
+            cache = get_cache(envelope["target"])
+            if cache is not None:
+                cache.invalidate(decode_key(envelope["key"]), notify=False)
+
+    def is_member(self, user_id: UUID, channel_id: UUID) -> bool:
+        """Check membership from the user's connection, without a query"""
+        connection = self.active_connections.get(user_id)
+        return connection is not None and channel_id in connection.channels
+
+    def apply_membership(self, channel_id: UUID, member_id: Optional[UUID], is_member: bool):
+        """Update local connections for a membership change; member_id None means everyone"""
+        if member_id is None:
+            affected = list(self.active_connections.items())
+        elif member_id in self.active_connections:
+            affected = [(member_id, self.active_connections[member_id])]
+        else:
+            affected = []
+
+        for user_id, connection in affected:
+            if is_member:
+                connection.channels.add(channel_id)
+            else:
+                connection.channels.discard(channel_id)
+                self.leave_channel(user_id, channel_id)
+                self.typing.stop(channel_id, user_id)
+
+    def _on_serving_loop(self, callback, *args) -> bool:
+        """True if called on the serving loop; otherwise hand callback(*args) to it"""
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is None or running_loop is not self.loop:
+            # Committed outside the serving loop (worker thread or CLI job)
+            if self.loop is not None and self.loop.is_running():
+                self.loop.call_soon_threadsafe(callback, *args)
+            return False
+        return True
+
+    def on_membership_change(self, channel_id: UUID, member_id: Optional[UUID], is_member: bool):
+        """ChannelRepository listener: apply the change here and on the other nodes"""
+        if not self._on_serving_loop(self.on_membership_change, channel_id, member_id, is_member):
+            return
+
+        self.apply_membership(channel_id, member_id, is_member)
+        self.loop.create_task(self.publish({
+            "kind": "membership",
+            "target": str(channel_id),
+            "member_id": str(member_id) if member_id else None,
+            "is_member": is_member
+        }))
+
+    def on_cache_invalidated(self, cache_name: str, key):
+        """Cache listener: drop the same key from the other nodes' caches"""
+        if not self._on_serving_loop(self.on_cache_invalidated, cache_name, key):
+            return
+
+        self.loop.create_task(self.publish({
+            "kind": "invalidate",
+            "target": cache_name,
+            "key": encode_key(key)
+        }))
+
+    async def send_personal_message(self, message: Frame, user_id: UUID):
+        """Send message to specific user on any node"""
+        self.deliver_to_user(message, user_id)
+        await self.publish({
+            "kind": "user",
+            "target": str(user_id),
+            "message": message.event
+        })
+
+    async def send_to_channel(
+        self,
+        message: Frame,
+        channel_id: UUID,
+        exclude_user: Optional[UUID] = None,
+        coalesce_key: Optional[str] = None
+    ):
+        """Send message to all users in a channel on any node
+
+        Events sharing a coalesce_key supersede each other: a recipient that
+        has not yet been sent the previous one only receives the newest.
+        """
+        self.deliver_to_channel(message, channel_id, exclude_user, coalesce_key)
+        await self.publish({
+            "kind": "channel",
+            "target": str(channel_id),
+            "message": message.event,
+            "exclude_user": str(exclude_user) if exclude_user else None,
+            "coalesce_key": coalesce_key
+        })
+
+    def deliver_to_user(self, message: Frame, user_id: UUID):
+        """Queue message for a specific user connected to this node"""
+        connection = self.active_connections.get(user_id)
+        if connection is not None and not connection.enqueue(message):
+            self.drop_slow_consumer(user_id, connection)
+
+    def deliver_to_channel(
+        self,
+        message: Frame,
+        channel_id: UUID,
+        exclude_user: Optional[UUID] = None,
+        coalesce_key: Optional[str] = None
+    ):
+        """Queue message for all users in a channel connected to this node"""
         if channel_id not in self.channel_presence:
             return
         
-        disconnected_users = []
+        fanout_stats.record_broadcast()
+        slow_consumers = []
         for user_id in self.channel_presence[channel_id]:
             if exclude_user and user_id == exclude_user:
                 continue
             
-            if user_id in self.active_connections:
-                try:
-                    await self.active_connections[user_id].send_text(message)
-                except Exception as e:
-                    logger.error(f"Error sending to user {user_id} in channel {channel_id}: {e}")
-                    disconnected_users.append(user_id)
+            connection = self.active_connections.get(user_id)
+            if connection is not None and not connection.enqueue(message, coalesce_key):
+                slow_consumers.append((user_id, connection))
         
-        # Clean up disconnected users
-        for user_id in disconnected_users:
+        for user_id, connection in slow_consumers:
+            self.drop_slow_consumer(user_id, connection)
+
+    def drop_slow_consumer(self, user_id: UUID, connection: ClientConnection):
+        """Disconnect a client whose outbound queue is full"""
+        logger.warning(f"Dropping slow WebSocket consumer {user_id}")
+        fanout_stats.record_dropped()
+        connection.close(code=SLOW_CONSUMER_CLOSE_CODE)
+        self.drop_connection(user_id, connection)
+
+    def drop_connection(self, user_id: UUID, connection: ClientConnection):
+        """Disconnect user if connection is still their current one"""
+        if self.active_connections.get(user_id) is connection:
             self.disconnect(user_id)
+        else:
+            connection.close()
 
     def join_channel(self, user_id: UUID, channel_id: UUID):
         """Add user to channel presence"""
@@ -98,34 +291,40 @@ class ConnectionManager:
             if not self.channel_presence[channel_id]:
                 del self.channel_presence[channel_id]
 
-    def set_typing(self, user_id: UUID, channel_id: UUID, is_typing: bool):
-        """Set user typing status"""
-        if channel_id not in self.typing_users:
-            self.typing_users[channel_id] = {}
-        
+    def set_typing(self, user_id: UUID, user_name: str, channel_id: UUID, is_typing: bool) -> bool:
+        """Set user typing status; True when the change should be announced to other nodes"""
         if is_typing:
-            self.typing_users[channel_id][user_id] = datetime.now()
-        else:
-            self.typing_users[channel_id].pop(user_id, None)
+            return self.typing.touch(channel_id, user_id, user_name, time.monotonic())
+        return self.typing.stop(channel_id, user_id)
 
     def get_typing_users(self, channel_id: UUID) -> List[UUID]:
         """Get users currently typing in channel"""
-        if channel_id not in self.typing_users:
-            return []
-        
-        # Remove users who stopped typing more than 5 seconds ago
-        now = datetime.now()
-        active_typers = []
-        for user_id, typing_time in list(self.typing_users[channel_id].items()):
-            if (now - typing_time).seconds < 5:
-                active_typers.append(user_id)
-            else:
-                del self.typing_users[channel_id][user_id]
-        
-        return active_typers
+        return [user_id for user_id, _ in self.typing.users(channel_id)]
+
+    async def flush_typing(self):
+        """Expire typists and send one aggregated typing event per changed channel"""
+        while True:
+            try:
+                await asyncio.sleep(TYPING_FLUSH_INTERVAL_SECONDS)
+                self.typing.expire(time.monotonic())
+                for channel_id, users in self.typing.take_changes().items():
+                    event = TypingUsersEvent(
+                        channel_id=channel_id,
+                        users=[TypingUser(user_id=user_id, user_name=name) for user_id, name in users]
+                    )
+                    # Typists on every node are tracked here, so only local sockets are sent to
+                    self.deliver_to_channel(
+                        encode_event("typing_users", event),
+                        channel_id,
+                        coalesce_key=f"typing:{channel_id}"
+                    )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error flushing typing indicators: {e}")
 
     def get_channel_users(self, channel_id: UUID) -> List[Dict]:
-        """Get online users in channel"""
+        """Get online users in channel connected to this node"""
         if channel_id not in self.channel_presence:
             return []
         
@@ -142,47 +341,58 @@ class ConnectionManager:
 
 # Global connection manager
 manager = ConnectionManager()
+membership_listeners.append(manager.on_membership_change)
+invalidation_listeners.append(manager.on_cache_invalidated)
+
+async def websocket_endpoint(websocket: WebSocket, token: str):
+    """WebSocket endpoint for real-time messaging
 
-async def websocket_endpoint(websocket: WebSocket, token: str, db: Session = Depends(get_db)):
-    """WebSocket endpoint for real-time messaging"""
+    A socket lives for hours, so it holds no database session: the principal
+    and membership set are loaded up front and each frame that touches the
+    database opens its own short session.
+    """
     try:
-        # Authenticate user
-        current_user = get_current_user_from_token(token)
-        user_id = current_user["user"].id
-        user_info = {
-            "name": current_user["user"].name,
-            "role": current_user["role"]
-        }
-        
-        # Connect user
-        await manager.connect(websocket, user_id, user_info)
+        async with AsyncSessionLocal() as db:
+            # Authenticate user
+            current_user = await db.run_sync(lambda session: get_current_user_from_token(token, session))
+            user_id = current_user["user"].id
+            user_info = {
+                "name": current_user["user"].name,
+                "role": current_user["role"]
+            }
+            
+            # Connect user with the channels they may act in
+            channels = await AsyncChannelRepository(db).get_member_channel_ids(user_id)
+        connection = await manager.connect(websocket, user_id, user_info, channels)
         
         # Send initial presence update
-        await websocket.send_text(json.dumps({
-            "type": "connected",
-            "data": {
-                "user_id": str(user_id),
-                "message": "Connected to real-time messaging"
-            }
-        }))
+        manager.deliver_to_user(encode_event("connected", {
+            "user_id": str(user_id),
+            "protocol": connection.protocol.name,
+            "message": "Connected to real-time messaging"
+        }), user_id)
         
         try:
             while True:
                 # Receive message from client
-                data = await websocket.receive_text()
-                message_data = json.loads(data)
+                frame = await websocket.receive()
+                if frame["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(frame.get("code", 1000))
+                message_data = connection.protocol.decode(frame)
                 
-                await handle_websocket_message(message_data, user_id, user_info, db)
+                await handle_websocket_message(message_data, user_id, user_info)
                 
         except WebSocketDisconnect:
-            manager.disconnect(user_id)
             logger.info(f"User {user_id} disconnected")
+        finally:
+            # Any exit, not just a clean disconnect, must release the writer and memberships
+            manager.drop_connection(user_id, connection)
             
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
         await websocket.close()
 
-async def handle_websocket_message(message_data: dict, user_id: UUID, user_info: dict, db: Session):
+async def handle_websocket_message(message_data: dict, user_id: UUID, user_info: dict):
     """Handle incoming WebSocket messages"""
     message_type = message_data.get("type")
     channel_id = message_data.get("channel_id")
@@ -195,11 +405,13 @@ async def handle_websocket_message(message_data: dict, user_id: UUID, user_info:
     except ValueError:
         return
     
-    channel_service = ChannelService(db)
-    
-    # Check if user is member of channel
-    if not channel_service.channel_repo.is_member(channel_id, user_id):
-        return
+    # Authorize from the connection's membership set, kept current by
+    # ChannelRepository membership events rather than a query per frame
+    if not manager.is_member(user_id, channel_id):
+        # Joins are rare, so a miss is re-checked in case an update was lost
+        if message_type != "join_channel" or not await is_channel_member(channel_id, user_id):
+            return
+        manager.apply_membership(channel_id, user_id, True)
     
     if message_type == "join_channel":
         await handle_join_channel(channel_id, user_id, user_info)
@@ -214,10 +426,14 @@ async def handle_websocket_message(message_data: dict, user_id: UUID, user_info:
         await handle_typing(channel_id, user_id, user_info, False)
     
     elif message_type == "message":
-        await handle_new_message(message_data, user_id, user_info, channel_service)
+        await handle_new_message(message_data, user_id, user_info)
     
     elif message_type == "reaction":
-        await handle_reaction(message_data, user_id, user_info, channel_service)
+        await handle_reaction(message_data, user_id, user_info)
+
+async def is_channel_member(channel_id: UUID, user_id: UUID) -> bool:
+    async with AsyncSessionLocal() as db:
+        return await AsyncChannelRepository(db).is_member(channel_id, user_id)
 
 async def handle_join_channel(channel_id: UUID, user_id: UUID, user_info: dict):
     """Handle user joining a channel"""
@@ -233,12 +449,10 @@ async def handle_join_channel(channel_id: UUID, user_id: UUID, user_info: dict):
     )
     
     await manager.send_to_channel(
-        json.dumps({
-            "type": "user_joined",
-            "data": presence_event.dict()
-        }),
+        encode_event("user_joined", presence_event),
         channel_id,
-        exclude_user=user_id
+        exclude_user=user_id,
+        coalesce_key=f"presence:{channel_id}:{user_id}"
     )
 
 async def handle_leave_channel(channel_id: UUID, user_id: UUID, user_info: dict):
@@ -255,70 +469,90 @@ async def handle_leave_channel(channel_id: UUID, user_id: UUID, user_info: dict)
     )
     
     await manager.send_to_channel(
-        json.dumps({
-            "type": "user_left",
-            "data": presence_event.dict()
-        }),
+        encode_event("user_left", presence_event),
         channel_id,
-        exclude_user=user_id
+        exclude_user=user_id,
+        coalesce_key=f"presence:{channel_id}:{user_id}"
     )
 
 async def handle_typing(channel_id: UUID, user_id: UUID, user_info: dict, is_typing: bool):
-    """Handle typing indicators"""
-    manager.set_typing(user_id, channel_id, is_typing)
-    
-    typing_event = TypingEvent(
-        user_id=user_id,
-        user_name=user_info["name"],
-        channel_id=channel_id,
-        is_typing=is_typing
-    )
-    
-    await manager.send_to_channel(
-        json.dumps({
-            "type": "typing",
-            "data": typing_event.dict()
-        }),
-        channel_id,
-        exclude_user=user_id
-    )
+    """Handle typing indicators
 
-async def handle_new_message(message_data: dict, user_id: UUID, user_info: dict, channel_service: ChannelService):
-    """Handle new message creation"""
+    Frames only update typing state; flush_typing sends the aggregated event.
+    Other nodes hear about new typists, stops and occasional keep-alives.
+    """
+    if manager.set_typing(user_id, user_info["name"], channel_id, is_typing):
+        await manager.publish({
+            "kind": "typing",
+            "target": str(channel_id),
+            "user_id": str(user_id),
+            "user_name": user_info["name"],
+            "is_typing": is_typing
+        })
+
+async def handle_new_message(message_data: dict, user_id: UUID, user_info: dict):
+    """Handle new message creation
+
+    The message is queued for group commit and the receive loop moves on.
+    Once stored, the sender gets a message_ack carrying the server id (and
+    their client_id, if sent) and the channel gets the new_message event.
+    """
+    client_id = message_data.get("client_id")
     try:
-        # Create message using service
-        message_create = {
-            "content": message_data.get("content"),
-            "message_type": message_data.get("message_type", "text"),
-            "reply_to_id": message_data.get("reply_to_id")
-        }
+        message_create = MessageCreate(
+            content=message_data.get("content"),
+            message_type=message_data.get("message_type", "text"),
+            reply_to_id=message_data.get("reply_to_id")
+        )
         
         channel_id = UUID(message_data["channel_id"])
         user_role = CreatorRoleEnum(user_info["role"])
         
-        message = channel_service.create_message(
-            message_create, channel_id, user_id, user_role
-        )
-        
-        if message:
-            # Broadcast message to all channel members
-            message_event = MessageEvent(
-                message=message,
-                channel_id=channel_id
-            )
-            
-            await manager.send_to_channel(
-                json.dumps({
-                    "type": "new_message",
-                    "data": message_event.dict()
-                }),
-                channel_id
-            )
-            
+        pending = await message_writer.submit(message_create, channel_id, user_id, user_role)
+    except Exception as e:
+        logger.error(f"Error handling new message: {e}")
+        manager.deliver_to_user(encode_event("message_error", {
+            "client_id": client_id,
+            "detail": "Invalid message"
+        }), user_id)
+        return
+    
+    asyncio.ensure_future(complete_new_message(pending, channel_id, user_id, client_id))
+
+async def complete_new_message(pending: asyncio.Future, channel_id: UUID, user_id: UUID, client_id: Optional[str]):
+    """Ack the sender and broadcast the message once it is committed"""
+    try:
+        message = await pending
+    except PermissionError as e:
+        detail = str(e)
     except Exception as e:
         logger.error(f"Error handling new message: {e}")
+        detail = "Message could not be saved"
+    else:
+        manager.deliver_to_user(encode_event("message_ack", {
+            "client_id": client_id,
+            "message_id": message.id,
+            "created_at": message.created_at
+        }), user_id)
+        
+        # Broadcast message to all channel members
+        message_event = MessageEvent(
+            message=message,
+            channel_id=channel_id
+        )
+        
+        await manager.send_to_channel(
+            encode_event("new_message", message_event),
+            channel_id
+        )
+        return
+    
+    manager.deliver_to_user(encode_event("message_error", {
+        "client_id": client_id,
+        "detail": detail
+    }), user_id)
 
-async def handle_reaction(message_data: dict, user_id: UUID, user_info: dict, channel_service: ChannelService):
+async def handle_reaction(message_data: dict, user_id: UUID, user_info: dict):
     """Handle message reaction"""
     try:
         message_id = UUID(message_data.get("message_id"))
@@ -327,27 +561,29 @@ async def handle_reaction(message_data: dict, user_id: UUID, user_info: dict, ch
         
         user_role = CreatorRoleEnum(user_info["role"])
         
-        if action == "add":
-            reaction = channel_service.add_reaction(message_id, user_id, user_role, {"emoji": emoji})
-        else:
-            success = channel_service.remove_reaction(message_id, user_id, emoji)
-            reaction = {"emoji": emoji, "action": "removed"} if success else None
+        # The session is released before the broadcast
+        async with AsyncSessionLocal() as db:
+            channel_service = AsyncChannelService(db)
+            if action == "add":
+                reaction = await channel_service.add_reaction(
+                    message_id, user_id, user_role, MessageReactionCreate(emoji=emoji)
+                )
+            else:
+                success = await channel_service.remove_reaction(message_id, user_id, emoji)
+                reaction = {"emoji": emoji, "action": "removed"} if success else None
         
         if reaction:
             # Broadcast reaction to channel
             channel_id = message_data.get("channel_id")
             if channel_id:
                 await manager.send_to_channel(
-                    json.dumps({
-                        "type": "reaction",
-                        "data": {
-                            "message_id": str(message_id),
-                            "user_id": str(user_id),
-                            "user_name": user_info["name"],
-                            "emoji": emoji,
-                            "action": action,
-                            "reaction": reaction
-                        }
+                    encode_event("reaction", {
+                        "message_id": str(message_id),
+                        "user_id": str(user_id),
+                        "user_name": user_info["name"],
+                        "emoji": emoji,
+                        "action": action,
+                        "reaction": reaction
                     }),
                     UUID(channel_id)
                 )
@@ -355,45 +591,18 @@ async def handle_reaction(message_data: dict, user_id: UUID, user_info: dict, ch
     except Exception as e:
         logger.error(f"Error handling reaction: {e}")
 
-# Background task to clean up inactive typing indicators
-async def cleanup_typing_indicators():
-    """Clean up old typing indicators"""
-    while True:
-        try:
-            now = datetime.now()
-            for channel_id in list(manager.typing_users.keys()):
-                for user_id in list(manager.typing_users[channel_id].keys()):
-                    typing_time = manager.typing_users[channel_id][user_id]
-                    if (now - typing_time).seconds > 10:  # 10 seconds timeout
-                        del manager.typing_users[channel_id][user_id]
-                
-                if not manager.typing_users[channel_id]:
-                    del manager.typing_users[channel_id]
-            
-            await asyncio.sleep(5)  # Run every 5 seconds
-            
-        except Exception as e:
-            logger.error(f"Error in typing cleanup: {e}")
-            await asyncio.sleep(5)
-
 # Utility functions for external use
 async def broadcast_message_to_channel(channel_id: UUID, message_data: dict):
     """Broadcast message to all users in a channel (for use by other services)"""
     await manager.send_to_channel(
-        json.dumps({
-            "type": "system_message",
-            "data": message_data
-        }),
+        encode_event("system_message", message_data),
         channel_id
     )
 
 async def notify_user(user_id: UUID, notification_data: dict):
     """Send notification to specific user"""
     await manager.send_personal_message(
-        json.dumps({
-            "type": "notification",
-            "data": notification_data
-        }),
+        encode_event("notification", notification_data),
         user_id
     )
 
@@ -0,0 +1,189 @@
+"""Group-commit pipeline persisting WebSocket chat messages off the receive path.
+
+Messages are queued in arrival order and a writer task commits everything
+that arrives within a short window as one transaction. Senders are sharded
+over the writers by id, so each sender's messages stay in order; created_at
+is assigned at submit time and kept strictly increasing so history ordering
+matches arrival order even within a batch.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Any, Dict, List
+from uuid import UUID
+import asyncio
+import logging
+import os
+import time
+
+from app.database import AsyncSessionLocal, utc_now
+from app.schemas import MessageCreate, CreatorRoleEnum
+from app.services.channel_service import ChannelService
+
+logger = logging.getLogger(__name__)
+
+MESSAGE_BATCH_WINDOW_SECONDS = float(os.getenv("MESSAGE_BATCH_WINDOW_MS", "5")) / 1000
+MESSAGE_BATCH_SIZE = int(os.getenv("MESSAGE_BATCH_SIZE", "100"))
+MESSAGE_WRITERS = int(os.getenv("MESSAGE_WRITERS", "2"))
+MESSAGE_QUEUE_SIZE = int(os.getenv("MESSAGE_QUEUE_SIZE", "1000"))
+
+@dataclass
+class PendingMessage:
+    message: MessageCreate
+    channel_id: UUID
+    sender_id: UUID
+    sender_role: CreatorRoleEnum
+    created_at: datetime
+    result: asyncio.Future
+
+class MessageWriter:
+    """Batches message inserts into group commits, one writer task per shard"""
+
+    def __init__(
+        self,
+        session_factory=AsyncSessionLocal,
+        shards: int = MESSAGE_WRITERS,
+        window: float = MESSAGE_BATCH_WINDOW_SECONDS,
+        max_batch: int = MESSAGE_BATCH_SIZE,
+        max_queue: int = MESSAGE_QUEUE_SIZE
+    ):
+        self.session_factory = session_factory
+        self.shards = max(shards, 1)
+        self.window = window
+        self.max_batch = max_batch
+        self.max_queue = max_queue
+        self.queues: List[asyncio.Queue] = []
+        self.tasks: List[asyncio.Task] = []
+        # Batch each shard's writer is committing right now
+        self.in_flight: List[List[PendingMessage]] = []
+        self.last_created_at = datetime.min
+        self.batches = 0
+        self.messages = 0
+        self.commit_seconds = 0.0
+        self._lock = Lock()
+
+    def start(self):
+        if not self.tasks:
+            self.queues = [asyncio.Queue(maxsize=self.max_queue) for _ in range(self.shards)]
+            self.in_flight = [[] for _ in range(self.shards)]
+            self.tasks = [asyncio.ensure_future(self._run(shard)) for shard in range(self.shards)]
+
+    async def stop(self, timeout: float = 5.0):
+        """Flush queued messages (up to timeout) and stop the writers
+
+        Whatever is left is failed rather than dropped, so every sender still
+        gets a message_error instead of waiting forever for an ack.
+        """
+        try:
+            await asyncio.wait_for(asyncio.gather(*(queue.join() for queue in self.queues)), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Stopping message writers with messages still queued")
+
+        # No await until the writers are cancelled, so none can take another batch
+        leftover = [pending for batch in self.in_flight for pending in batch]
+        for queue in self.queues:
+            while not queue.empty():
+                leftover.append(queue.get_nowait())
+        for pending in leftover:
+            if not pending.result.done():
+                pending.result.set_exception(RuntimeError("Server shut down before the message was saved"))
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+        self.queues = []
+        self.in_flight = []
+
+    async def submit(
+        self,
+        message: MessageCreate,
+        channel_id: UUID,
+        sender_id: UUID,
+        sender_role: CreatorRoleEnum
+    ) -> asyncio.Future:
+        """Queue a message for persistence
+
+        Returns once the message holds its place in line (waiting only if the
+        queue is full); the future resolves to the MessageResponse, or raises
+        why the message was rejected.
+        """
+        self.start()
+        pending = PendingMessage(
+            message=message,
+            channel_id=channel_id,
+            sender_id=sender_id,
+            sender_role=sender_role,
+            created_at=self._next_created_at(),
+            result=asyncio.get_running_loop().create_future()
+        )
+        await self.queues[hash(sender_id) % self.shards].put(pending)
+        return pending.result
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "messages": self.messages,
+            "avg_batch_size": round(self.messages / self.batches, 2) if self.batches else 0.0,
+            "avg_commit_ms": round(self.commit_seconds / self.batches * 1000, 3) if self.batches else 0.0,
+            "queued": sum(queue.qsize() for queue in self.queues)
+        }
+
+    def _next_created_at(self) -> datetime:
+        with self._lock:
+            now = utc_now()
+            if now <= self.last_created_at:
+                now = self.last_created_at + timedelta(microseconds=1)
+            self.last_created_at = now
+            return now
+
+    async def _run(self, shard: int):
+        queue = self.queues[shard]
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            self.in_flight[shard] = batch
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                if queue.empty():
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    batch.append(queue.get_nowait())
+
+            await self._write(batch)
+            self.in_flight[shard] = []
+            for _ in batch:
+                queue.task_done()
+
+    async def _write(self, batch: List[PendingMessage]):
+        submissions = [
+            (pending.message, pending.channel_id, pending.sender_id, pending.sender_role, pending.created_at)
+            for pending in batch
+        ]
+        start = time.perf_counter()
+        try:
+            async with self.session_factory() as db:
+                results = await db.run_sync(lambda session: ChannelService(session).create_messages(submissions))
+        except Exception as e:
+            logger.error(f"Error persisting message batch: {e}")
+            results = [e] * len(batch)
+
+        self.batches += 1
+        self.messages += len(batch)
+        self.commit_seconds += time.perf_counter() - start
+
+        for pending, result in zip(batch, results):
+            if pending.result.done():
+                continue
+            if isinstance(result, Exception):
+                pending.result.set_exception(result)
+            else:
+                pending.result.set_result(result)
+
+message_writer = MessageWriter()
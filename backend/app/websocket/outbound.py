@@ -0,0 +1,171 @@
+"""Per-connection outbound queues so one slow socket never stalls a broadcast.
+
+Broadcasting only appends the frame to each recipient's bounded queue; a
+writer task per connection drains it, encoding with the connection's protocol. Events with a coalesce
+key (typing, presence) replace a still-queued event with the same key instead
+of queueing behind it. A connection whose queue fills up is dropped.
+"""
+
+from collections import deque
+from threading import Lock
+from typing import Any, Callable, Deque, Dict, Hashable, Optional, Set
+from uuid import UUID
+import asyncio
+import logging
+import os
+import time
+
+from fastapi import WebSocket
+
+from .protocol import Frame, JsonProtocol
+
+logger = logging.getLogger(__name__)
+
+WS_OUTBOUND_QUEUE_SIZE = int(os.getenv("WS_OUTBOUND_QUEUE_SIZE", "256"))
+
+# "Try Again Later": the client fell too far behind and should reconnect
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+class FanoutStats:
+    """Delivery latency (queued to written) and drop/coalesce counters"""
+
+    def __init__(self, samples: int = 4096):
+        self.broadcasts = 0
+        self.deliveries = 0
+        self.coalesced = 0
+        self.dropped_consumers = 0
+        self.send_errors = 0
+        self._latencies: Deque[float] = deque(maxlen=samples)
+        self._lock = Lock()
+
+    def record_broadcast(self) -> None:
+        with self._lock:
+            self.broadcasts += 1
+
+    def record_delivery(self, latency: float) -> None:
+        with self._lock:
+            self.deliveries += 1
+            self._latencies.append(latency)
+
+    def record_coalesced(self) -> None:
+        with self._lock:
+            self.coalesced += 1
+
+    def record_dropped(self) -> None:
+        with self._lock:
+            self.dropped_consumers += 1
+
+    def record_send_error(self) -> None:
+        with self._lock:
+            self.send_errors += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            latencies = sorted(self._latencies)
+
+        def percentile(p: float) -> float:
+            if not latencies:
+                return 0.0
+            return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000, 3)
+
+        return {
+            "broadcasts": self.broadcasts,
+            "deliveries": self.deliveries,
+            "coalesced": self.coalesced,
+            "dropped_consumers": self.dropped_consumers,
+            "send_errors": self.send_errors,
+            "latency_ms": {
+                "p50": percentile(0.50),
+                "p90": percentile(0.90),
+                "p99": percentile(0.99),
+                "max": percentile(1.0)
+            }
+        }
+
+fanout_stats = FanoutStats()
+
+class ClientConnection:
+    """A WebSocket with a bounded outbound queue drained by its own writer task"""
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        on_error: Callable[["ClientConnection"], None],
+        max_queue: int = WS_OUTBOUND_QUEUE_SIZE,
+        protocol=None
+    ):
+        self.websocket = websocket
+        self.protocol = protocol or JsonProtocol()
+        self.on_error = on_error
+        self.max_queue = max_queue
+        # Entries are [coalesce_key, frame, queued_at] so coalescing can update in place
+        self.pending: Deque[list] = deque()
+        self.queued_by_key: Dict[Hashable, list] = {}
+        self.wakeup = asyncio.Event()
+        self.closed = False
+        self.writer: Optional[asyncio.Task] = None
+        # Channels the user may act in, kept current by membership events
+        self.channels: Set[UUID] = set()
+
+    def start(self) -> None:
+        self.writer = asyncio.ensure_future(self._write_loop())
+
+    def enqueue(self, frame: Frame, coalesce_key: Optional[Hashable] = None) -> bool:
+        """Queue a frame; False means the connection cannot keep up"""
+        if self.closed:
+            return True
+
+        if coalesce_key is not None and coalesce_key in self.queued_by_key:
+            entry = self.queued_by_key[coalesce_key]
+            entry[1] = frame
+            fanout_stats.record_coalesced()
+            return True
+
+        if len(self.pending) >= self.max_queue:
+            return False
+
+        entry = [coalesce_key, frame, time.perf_counter()]
+        self.pending.append(entry)
+        if coalesce_key is not None:
+            self.queued_by_key[coalesce_key] = entry
+        self.wakeup.set()
+        return True
+
+    def close(self, code: Optional[int] = None) -> None:
+        """Stop the writer and drop queued messages"""
+        if self.closed:
+            return
+        self.closed = True
+        self.pending.clear()
+        self.queued_by_key.clear()
+        if self.writer is not None and self.writer is not asyncio.current_task():
+            self.writer.cancel()
+        if code is not None:
+            asyncio.ensure_future(self._close_socket(code))
+
+    async def _close_socket(self, code: int) -> None:
+        try:
+            await self.websocket.close(code=code)
+        except Exception:
+            pass
+
+    async def _write_loop(self) -> None:
+        while not self.closed:
+            if not self.pending:
+                self.wakeup.clear()
+                await self.wakeup.wait()
+                continue
+
+            coalesce_key, frame, queued_at = self.pending.popleft()
+            if coalesce_key is not None:
+                self.queued_by_key.pop(coalesce_key, None)
+
+            try:
+                await self.protocol.send(self.websocket, frame)
+            except Exception as e:
+                logger.error(f"Error writing to WebSocket: {e}")
+                fanout_stats.record_send_error()
+                self.on_error(self)
+                return
+
+            fanout_stats.record_delivery(time.perf_counter() - queued_at)
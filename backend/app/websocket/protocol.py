@@ -0,0 +1,182 @@
+"""Wire protocols for /channels/ws: JSON text and compact MessagePack frames.
+
+Clients pick one with the Sec-WebSocket-Protocol header (or a ?protocol=
+query parameter for clients that cannot set it). The compact protocol is
+MessagePack binary frames with short keys, UUIDs as 16 raw bytes and
+timestamps as the MessagePack timestamp extension. Both are derived from the
+same JSON-compatible event, built once per broadcast, and each encoding is
+computed at most once per frame however many sockets receive it.
+
+permessage-deflate is negotiated by the ASGI server (uvicorn enables it by
+default for the websockets implementation) and works with either protocol.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+from uuid import UUID
+import json
+
+import msgpack
+from fastapi import WebSocket
+from fastapi.encoders import jsonable_encoder
+
+JSON_SUBPROTOCOL = "campus-connect.json"
+COMPACT_SUBPROTOCOL = "campus-connect.msgpack"
+
+# Long field name -> short key on the compact protocol
+SHORT_KEYS: Dict[str, str] = {
+    "type": "t",
+    "data": "d",
+    "message": "m",
+    "message_id": "mi",
+    "channel_id": "c",
+    "user_id": "u",
+    "user_name": "un",
+    "users": "us",
+    "id": "i",
+    "content": "b",
+    "message_type": "mt",
+    "file_url": "fu",
+    "file_name": "fn",
+    "file_size": "fs",
+    "reply_to_id": "r",
+    "reply_to": "rt",
+    "sender_id": "s",
+    "sender_name": "sn",
+    "sender_role": "sr",
+    "is_edited": "ie",
+    "edited_at": "ea",
+    "created_at": "ca",
+    "updated_at": "ua",
+    "reactions": "rx",
+    "reaction": "re",
+    "user_role": "ur",
+    "emoji": "e",
+    "action": "a",
+    "is_typing": "ty",
+    "is_online": "o",
+    "last_seen": "ls",
+    "client_id": "ci",
+    "detail": "dt",
+    "is_pinned": "ip",
+}
+LONG_KEYS: Dict[str, str] = {short: long for long, short in SHORT_KEYS.items()}
+
+# Ids the server assigns; a client's own client_id is echoed back untouched
+UUID_FIELDS = frozenset({
+    "id", "message_id", "channel_id", "user_id", "reply_to_id", "sender_id", "member_id",
+    "created_by_id", "pinned_by_id", "invite_id", "invited_by_id", "invited_user_id", "job_id",
+})
+
+def _is_uuid_field(key: str) -> bool:
+    return key in UUID_FIELDS
+
+def _is_time_field(key: str) -> bool:
+    return key.endswith("_at") or key == "last_seen"
+
+def _compact(value: Any, key: Optional[str] = None) -> Any:
+    """Shorten keys and pack UUID / timestamp strings of a JSON-compatible value"""
+    if isinstance(value, dict):
+        return {SHORT_KEYS.get(k, k): _compact(v, k) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_compact(item, key) for item in value]
+    if isinstance(value, str) and key is not None:
+        try:
+            if _is_uuid_field(key):
+                return UUID(value).bytes
+            if _is_time_field(key):
+                moment = datetime.fromisoformat(value)
+                if moment.tzinfo is None:
+                    # Stored timestamps are naive UTC
+                    moment = moment.replace(tzinfo=timezone.utc)
+                return msgpack.Timestamp.from_datetime(moment)
+        except ValueError:
+            pass
+    return value
+
+def _expand(value: Any, key: Optional[str] = None) -> Any:
+    """Inverse of _compact for frames sent by compact clients"""
+    if isinstance(value, dict):
+        expanded = {}
+        for k, v in value.items():
+            long_key = LONG_KEYS.get(k, k)
+            expanded[long_key] = _expand(v, long_key)
+        return expanded
+    if isinstance(value, list):
+        return [_expand(item, key) for item in value]
+    if isinstance(value, bytes) and key is not None and _is_uuid_field(key) and len(value) == 16:
+        return str(UUID(bytes=value))
+    if isinstance(value, msgpack.Timestamp):
+        return value.to_datetime().isoformat()
+    return value
+
+class Frame:
+    """An outbound event, encoded lazily and at most once per protocol"""
+
+    __slots__ = ("event", "_json", "_compact")
+
+    def __init__(self, event: Dict[str, Any]):
+        self.event = event
+        self._json: Optional[str] = None
+        self._compact: Optional[bytes] = None
+
+    @classmethod
+    def build(cls, event_type: str, data: Any) -> "Frame":
+        return cls({"type": event_type, "data": jsonable_encoder(data)})
+
+    @property
+    def json(self) -> str:
+        if self._json is None:
+            self._json = json.dumps(self.event, separators=(",", ":"))
+        return self._json
+
+    @property
+    def compact(self) -> bytes:
+        if self._compact is None:
+            self._compact = msgpack.packb(_compact(self.event), datetime=False)
+        return self._compact
+
+class JsonProtocol:
+    name = "json"
+    subprotocol = JSON_SUBPROTOCOL
+
+    async def send(self, websocket: WebSocket, frame: Frame) -> None:
+        await websocket.send_text(frame.json)
+
+    def decode(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        text = message.get("text")
+        if text is None:
+            text = message["bytes"].decode()
+        return json.loads(text)
+
+class CompactProtocol:
+    name = "msgpack"
+    subprotocol = COMPACT_SUBPROTOCOL
+
+    async def send(self, websocket: WebSocket, frame: Frame) -> None:
+        await websocket.send_bytes(frame.compact)
+
+    def decode(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        data = message.get("bytes")
+        if data is None:
+            # Text frames are plain JSON even on the compact protocol
+            return json.loads(message["text"])
+        return _expand(msgpack.unpackb(data, timestamp=0))
+
+PROTOCOLS = {
+    JsonProtocol.name: JsonProtocol(),
+    CompactProtocol.name: CompactProtocol(),
+}
+
+def negotiate(websocket: WebSocket):
+    """Pick the protocol from the offered subprotocols or ?protocol=, defaulting to JSON
+
+    Returns (protocol, subprotocol to echo in the handshake or None).
+    """
+    offered = websocket.scope.get("subprotocols") or []
+    for protocol in PROTOCOLS.values():
+        if protocol.subprotocol in offered:
+            return protocol, protocol.subprotocol
+
+    requested = websocket.query_params.get("protocol", JsonProtocol.name)
+    return PROTOCOLS.get(requested, PROTOCOLS[JsonProtocol.name]), None
@@ -0,0 +1,95 @@
+"""Typing indicator state with heap-based expiry and per-channel aggregation.
+
+Typing frames only update state here. A flush loop emits one "typing_users"
+event per changed channel per interval listing everyone currently typing, so
+keystroke-rate frames from many users collapse into a few events.
+"""
+
+from typing import Dict, List, Set, Tuple
+from uuid import UUID
+import heapq
+import os
+
+TYPING_TTL_SECONDS = float(os.getenv("TYPING_TTL_SECONDS", "5"))
+TYPING_FLUSH_INTERVAL_SECONDS = float(os.getenv("TYPING_FLUSH_INTERVAL_SECONDS", "0.5"))
+
+class TypingTracker:
+    """Who is typing where, expiring entries through a min-heap of deadlines"""
+
+    def __init__(self, ttl: float = TYPING_TTL_SECONDS):
+        self.ttl = ttl
+        # channel_id -> user_id -> (expires_at, user_name)
+        self.typists: Dict[UUID, Dict[UUID, Tuple[float, str]]] = {}
+        # (expires_at, channel_id, user_id); entries superseded by a later touch are skipped
+        self.deadlines: List[Tuple[float, UUID, UUID]] = []
+        # When each typist was last announced to the other nodes
+        self.announced: Dict[Tuple[UUID, UUID], float] = {}
+        self.dirty: Set[UUID] = set()
+        self.frames = 0
+        self.events = 0
+
+    def touch(self, channel_id: UUID, user_id: UUID, user_name: str, now: float) -> bool:
+        """Record that user is typing; True when other nodes should hear about it"""
+        self.frames += 1
+        channel = self.typists.setdefault(channel_id, {})
+        if user_id not in channel:
+            self.dirty.add(channel_id)
+
+        expires_at = now + self.ttl
+        channel[user_id] = (expires_at, user_name)
+        heapq.heappush(self.deadlines, (expires_at, channel_id, user_id))
+
+        # Refresh remote nodes well before their copy of the entry expires
+        key = (channel_id, user_id)
+        if now - self.announced.get(key, float("-inf")) >= self.ttl / 2:
+            self.announced[key] = now
+            return True
+        return False
+
+    def stop(self, channel_id: UUID, user_id: UUID) -> bool:
+        """Record that user stopped typing; True if they were typing"""
+        self.frames += 1
+        return self._remove(channel_id, user_id)
+
+    def remove_user(self, user_id: UUID) -> None:
+        """Forget a user in every channel (disconnect)"""
+        for channel_id in [channel_id for channel_id, users in self.typists.items() if user_id in users]:
+            self._remove(channel_id, user_id)
+
+    def expire(self, now: float) -> None:
+        """Drop typists whose deadline has passed, touching only expired heap entries"""
+        while self.deadlines and self.deadlines[0][0] <= now:
+            expires_at, channel_id, user_id = heapq.heappop(self.deadlines)
+            entry = self.typists.get(channel_id, {}).get(user_id)
+            if entry is not None and entry[0] == expires_at:
+                self._remove(channel_id, user_id)
+
+    def users(self, channel_id: UUID) -> List[Tuple[UUID, str]]:
+        """(user_id, user_name) of everyone typing in channel"""
+        return [(user_id, name) for user_id, (_, name) in self.typists.get(channel_id, {}).items()]
+
+    def take_changes(self) -> Dict[UUID, List[Tuple[UUID, str]]]:
+        """Current typists of every channel that changed since the last call"""
+        changes = {channel_id: self.users(channel_id) for channel_id in self.dirty}
+        self.dirty.clear()
+        self.events += len(changes)
+        return changes
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "frames": self.frames,
+            "events": self.events,
+            "typing_users": sum(len(users) for users in self.typists.values()),
+            "pending_deadlines": len(self.deadlines)
+        }
+
+    def _remove(self, channel_id: UUID, user_id: UUID) -> bool:
+        self.announced.pop((channel_id, user_id), None)
+        channel = self.typists.get(channel_id)
+        if not channel or user_id not in channel:
+            return False
+        del channel[user_id]
+        if not channel:
+            del self.typists[channel_id]
+        self.dirty.add(channel_id)
+        return True
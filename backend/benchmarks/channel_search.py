@@ -0,0 +1,168 @@
+"""Channel discovery search over a synthetic dataset, old query vs indexed search.
+
+Builds the channel tables in a scratch schema inside one transaction, seeds
+N channels (default 50k) with realistic names, descriptions and tags, runs
+each scenario with the previous ilike/array_to_string + count + OFFSET query
+("legacy") and with ChannelRepository.search_channels ("indexed"), then rolls
+everything back. Needs PostgreSQL.
+
+Usage:
+  python -m benchmarks.channel_search [--database-url URL] [--channels N] [--iterations N]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, desc, func, or_, text
+from sqlalchemy.orm import Session
+
+from app.database import Base
+from app.models.channel import Channel, ChannelMember, ChannelTypeEnum, ChannelRoleEnum, CreatorRoleEnum
+from app.repository.channel_repository import ChannelRepository
+from app.schemas import ChannelSearchParams
+
+TOPICS = [
+  "robotics", "machine learning", "data structures", "operating systems", "compilers", "web development",
+  "cloud computing", "cyber security", "embedded systems", "signal processing", "thermodynamics",
+  "fluid mechanics", "structural analysis", "circuit design", "quantum computing", "blockchain",
+  "photography", "music", "debate", "drama", "football", "cricket", "chess", "startup", "placements",
+  "gate preparation", "competitive programming", "open source", "game development", "linear algebra"
+]
+KINDS = ["club", "study group", "project", "lab", "society", "circle", "team", "forum"]
+TAGS = [f"tag{i}" for i in range(200)] + ["ai", "ml", "cse", "ece", "mech", "civil", "sports", "arts", "hackathon"]
+
+def seed(db: Session, channels: int, user_id: uuid.UUID) -> None:
+  rng = random.Random(42)
+  now = datetime.utcnow()
+  rows = []
+  for i in range(channels):
+    topic = rng.choice(TOPICS)
+    rows.append({
+      "id": uuid.uuid4(),
+      "name": f"{topic.title()} {rng.choice(KINDS).title()} {i}",
+      "description": f"A {rng.choice(KINDS)} for students interested in {topic} and {rng.choice(TOPICS)}. "
+                     f"Weekly sessions, {rng.choice(TOPICS)} resources and peer reviews.",
+      "channel_type": rng.choice(list(ChannelTypeEnum)),
+      "is_private": rng.random() < 0.1,
+      "is_archived": False,
+      "tags": rng.sample(TAGS, rng.randint(1, 4)),
+      "created_by_id": uuid.uuid4(),
+      "created_by_role": CreatorRoleEnum.STUDENT,
+      "created_at": now - timedelta(minutes=i),
+      "updated_at": now - timedelta(minutes=i)
+    })
+  db.execute(Channel.__table__.insert(), rows)
+
+  members = [
+    {
+      "id": uuid.uuid4(),
+      "channel_id": row["id"],
+      "member_id": user_id,
+      "member_role": CreatorRoleEnum.STUDENT,
+      "channel_role": ChannelRoleEnum.MEMBER,
+      "is_muted": False,
+      "is_banned": False
+    }
+    for row in rng.sample(rows, min(200, len(rows)))
+  ]
+  db.execute(ChannelMember.__table__.insert(), members)
+  db.execute(text("ANALYZE channels"))
+  db.execute(text("ANALYZE channel_members"))
+
+def legacy_search(db: Session, params: ChannelSearchParams, user_id: uuid.UUID):
+  """The query search_channels ran before the search indexes"""
+  query = db.query(Channel)
+  if params.query:
+    query = query.filter(or_(
+      Channel.name.ilike(f"%{params.query}%"),
+      Channel.description.ilike(f"%{params.query}%"),
+      func.array_to_string(Channel.tags, ",").ilike(f"%{params.query}%")
+    ))
+  for tag in params.tags or []:
+    query = query.filter(func.array_to_string(Channel.tags, ",").ilike(f"%{tag}%"))
+  query = query.filter(or_(
+    Channel.is_private == False,
+    Channel.id.in_(db.query(ChannelMember.channel_id).filter(ChannelMember.member_id == user_id))
+  )).order_by(desc(Channel.created_at))
+  total = query.count()
+  return query.offset((params.page - 1) * params.per_page).limit(params.per_page).all(), total
+
+def indexed_search(db: Session, params: ChannelSearchParams, user_id: uuid.UUID, cursor=None):
+  repository = ChannelRepository(db)
+  if cursor is not None:
+    return repository.search_channels(params, user_id, cursor=cursor, include_total=False)
+  return repository.search_channels(params, user_id, offset=(params.page - 1) * params.per_page)
+
+def timed(func, iterations: int) -> dict:
+  samples = []
+  for _ in range(iterations):
+    start = time.perf_counter()
+    func()
+    samples.append((time.perf_counter() - start) * 1000)
+  samples.sort()
+  return {"p50": statistics.median(samples), "p95": samples[min(len(samples) - 1, int(len(samples) * 0.95))]}
+
+def scenarios(db: Session, user_id: uuid.UUID) -> list:
+  deep = ChannelSearchParams(page=250, per_page=20)
+  # The keyset equivalent of page 250: seek from the last row of page 249
+  previous, _, _ = indexed_search(db, ChannelSearchParams(page=249, per_page=20), user_id)
+  deep_cursor = (previous[-1][1], previous[-1][0].id)
+
+  return [
+    ("common word", ChannelSearchParams(query="robotics"), None),
+    ("two-word prefix", ChannelSearchParams(query="machine learn"), None),
+    ("rare word", ChannelSearchParams(query="quantum compilers"), None),
+    ("tag filter", ChannelSearchParams(tags=["ai", "hackathon"]), None),
+    ("query + tag", ChannelSearchParams(query="club", tags=["cse"]), None),
+    ("browse page 1", ChannelSearchParams(), None),
+    ("browse page 250", deep, deep_cursor),
+  ]
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+  parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"))
+  parser.add_argument("--channels", type=int, default=50000)
+  parser.add_argument("--iterations", type=int, default=20)
+  args = parser.parse_args()
+  if not args.database_url or not args.database_url.startswith("postgresql"):
+    parser.error("a PostgreSQL --database-url (or DATABASE_URL) is required")
+
+  engine = create_engine(args.database_url)
+  user_id = uuid.uuid4()
+  schema = f"bench_{uuid.uuid4().hex[:8]}"
+
+  with engine.connect() as connection:
+    transaction = connection.begin()
+    try:
+      connection.execute(text(f"CREATE SCHEMA {schema}"))
+      connection.execute(text(f"SET LOCAL search_path TO {schema}, public"))
+      Base.metadata.create_all(connection, tables=[Channel.__table__, ChannelMember.__table__])
+      db = Session(bind=connection)
+
+      start = time.perf_counter()
+      seed(db, args.channels, user_id)
+      print(f"seeded {args.channels} channels in {time.perf_counter() - start:.1f}s")
+      print()
+      print(f"{'scenario':<18}{'legacy p50':>12}{'p95':>9}{'indexed p50':>13}{'p95':>9}{'rows':>6}")
+
+      for name, params, cursor in scenarios(db, user_id):
+        legacy = timed(lambda: legacy_search(db, params, user_id), args.iterations)
+        indexed = timed(lambda: indexed_search(db, params, user_id, cursor), args.iterations)
+        rows, _, _ = indexed_search(db, params, user_id, cursor)
+        print(
+          f"{name:<18}{legacy['p50']:>10.2f}ms{legacy['p95']:>7.2f}ms"
+          f"{indexed['p50']:>11.2f}ms{indexed['p95']:>7.2f}ms{len(rows):>6}"
+        )
+      print()
+      print("legacy: ilike + array_to_string filters, count() and OFFSET")
+      print("indexed: GIN full-text / tag containment, keyset cursor for the deep page, no count in cursor mode")
+    finally:
+      transaction.rollback()
+
+if __name__ == "__main__":
+  main()
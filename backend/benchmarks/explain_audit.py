@@ -0,0 +1,274 @@
+"""EXPLAIN every hot repository query shape and flag sequential scans.
+
+Builds the full schema in a scratch schema inside one transaction, seeds the
+membership, message, invite, feed engagement and rating tables, then calls
+the repository methods behind the hot endpoints. Every SELECT they issue is
+captured with its parameters and re-run as EXPLAIN (FORMAT JSON); a plan
+that sequentially scans a seeded table larger than --min-rows is flagged.
+Everything is rolled back at the end. Needs PostgreSQL.
+
+Exits non-zero when any shape is flagged, so it can guard index regressions
+in CI.
+
+Usage:
+  python -m benchmarks.explain_audit [--database-url URL] [--scale N] [--min-rows N] [--verbose]
+"""
+
+import argparse
+import os
+import random
+import sys
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session
+
+from app.database import Base
+from app.models.channel import (
+  Channel, ChannelInvite, ChannelMember, ChannelRoleEnum, ChannelTypeEnum, CreatorRoleEnum,
+  Message, MessageReaction, MessageTypeEnum, PinnedMessage
+)
+from app.models.feed import CampusFeed, FeedComment, FeedLike, FeedShare
+from app.models.user import Professors, ProfessorRatings, Students
+from app.repository.channel_repository import ChannelRepository
+from app.repository.feed_repository import FeedRepository
+from app.repository.feedback_repository import Feedback
+from app.schemas import ChannelSearchParams, MessageQueryParams
+
+def insert(db: Session, model, rows: list) -> list:
+  for start in range(0, len(rows), 5000):
+    db.execute(model.__table__.insert(), rows[start:start + 5000])
+  return rows
+
+def seed(db: Session, scale: int) -> dict:
+  """Seed scale x (1k students, 10k channels, 50k messages, 5k feeds) and their edges"""
+  rng = random.Random(7)
+  now = datetime.utcnow()
+
+  students = insert(db, Students, [
+    {"id": uuid.uuid4(), "usn": f"1XX{i:07d}", "email": f"student{i}@campus.edu", "password": "x", "name": f"Student {i}"}
+    for i in range(1000 * scale)
+  ])
+  professors = insert(db, Professors, [
+    {"id": uuid.uuid4(), "email": f"professor{i}@campus.edu", "password": "x", "name": f"Professor {i}"}
+    for i in range(100 * scale)
+  ])
+
+  channels = insert(db, Channel, [
+    {
+      "id": uuid.uuid4(), "name": f"Channel {i}", "description": "Seeded channel", "tags": ["seed"],
+      "channel_type": rng.choice(list(ChannelTypeEnum)),
+      "is_private": i % 10 == 0, "is_archived": False,
+      "created_by_id": rng.choice(students)["id"], "created_by_role": CreatorRoleEnum.STUDENT,
+      "created_at": now - timedelta(minutes=i), "updated_at": now - timedelta(minutes=i)
+    }
+    for i in range(10000 * scale)
+  ])
+
+  members, pairs = [], set()
+  for student in students:
+    for channel in rng.sample(channels, 20):
+      pairs.add((channel["id"], student["id"]))
+      members.append({
+        "id": uuid.uuid4(), "channel_id": channel["id"], "member_id": student["id"],
+        "member_role": CreatorRoleEnum.STUDENT, "channel_role": ChannelRoleEnum.MEMBER,
+        "is_muted": False, "is_banned": False, "joined_at": now
+      })
+  insert(db, ChannelMember, members)
+
+  messages = insert(db, Message, [
+    {
+      "id": uuid.uuid4(), "content": f"message {i}", "message_type": MessageTypeEnum.TEXT, "is_edited": False,
+      "channel_id": rng.choice(channels)["id"], "sender_id": rng.choice(students)["id"],
+      "sender_role": CreatorRoleEnum.STUDENT, "created_at": now - timedelta(seconds=i), "updated_at": now
+    }
+    for i in range(50000 * scale)
+  ])
+  insert(db, MessageReaction, [
+    {
+      "id": uuid.uuid4(), "message_id": message["id"], "user_id": rng.choice(students)["id"],
+      "user_role": CreatorRoleEnum.STUDENT, "emoji": "+1", "created_at": now
+    }
+    for message in rng.sample(messages, len(messages) // 2)
+  ])
+  insert(db, PinnedMessage, [
+    {
+      "id": uuid.uuid4(), "channel_id": message["channel_id"], "message_id": message["id"],
+      "pinned_by_id": message["sender_id"], "pinned_by_role": CreatorRoleEnum.STUDENT, "pinned_at": now
+    }
+    for message in rng.sample(messages, len(messages) // 20)
+  ])
+  insert(db, ChannelInvite, [
+    {
+      "id": uuid.uuid4(), "channel_id": rng.choice(channels)["id"], "invited_by_id": rng.choice(students)["id"],
+      "invited_user_id": rng.choice(students)["id"], "status": rng.choice(["pending", "accepted", "declined"]),
+      "invite_type": "invitation", "created_at": now, "updated_at": now
+    }
+    for _ in range(10000 * scale)
+  ])
+
+  feeds = insert(db, CampusFeed, [
+    {
+      "id": uuid.uuid4(), "title": f"Post {i}", "content": "Seeded post", "feed_type": "general",
+      "priority": "normal", "is_pinned": False, "is_public": True, "tags": [], "attachments": [],
+      "likes_count": 0, "comments_count": 0, "shares_count": 0,
+      "author_id": rng.choice(students)["id"], "created_at": now - timedelta(minutes=i), "updated_at": now
+    }
+    for i in range(5000 * scale)
+  ])
+  likes = {(rng.choice(feeds)["id"], rng.choice(students)["id"]) for _ in range(50000 * scale)}
+  insert(db, FeedLike, [
+    {"id": uuid.uuid4(), "feed_id": feed_id, "student_id": student_id, "created_at": now}
+    for feed_id, student_id in likes
+  ])
+  insert(db, FeedComment, [
+    {
+      "id": uuid.uuid4(), "content": "Seeded comment", "feed_id": rng.choice(feeds)["id"],
+      "student_id": rng.choice(students)["id"], "created_at": now - timedelta(seconds=i), "updated_at": now
+    }
+    for i in range(20000 * scale)
+  ])
+  insert(db, FeedShare, [
+    {"id": uuid.uuid4(), "feed_id": rng.choice(feeds)["id"], "professor_id": rng.choice(professors)["id"], "created_at": now}
+    for _ in range(10000 * scale)
+  ])
+  insert(db, ProfessorRatings, [
+    {
+      "id": uuid.uuid4(), "rating": rng.randint(1, 5), "created_at": now,
+      "professor_id": rng.choice(professors)["id"], "student_id": rng.choice(students)["id"]
+    }
+    for _ in range(10000 * scale)
+  ])
+
+  for table in Base.metadata.sorted_tables:
+    db.execute(text(f"ANALYZE {table.name}"))
+
+  member_channel, member_id = next(iter(pairs))
+  return {
+    "student": member_id,
+    "professor": professors[0]["id"],
+    "channel": member_channel,
+    "channels": [channel["id"] for channel in channels[:20]],
+    "messages": [message["id"] for message in messages[:50]],
+    "feed": feeds[0]["id"],
+    "feeds": [feed["id"] for feed in feeds[:20]],
+  }
+
+def query_shapes(db: Session, ids: dict) -> list:
+  """(name, call) for the repository reads behind the hot endpoints"""
+  channels = ChannelRepository(db)
+  feeds = FeedRepository(db)
+  history = MessageQueryParams(per_page=50)
+
+  return [
+    ("channel is_member", lambda: channels.is_member(ids["channel"], ids["student"])),
+    ("channel get_member_role", lambda: channels.get_member_role(ids["channel"], ids["student"])),
+    ("channel get_user_memberships", lambda: channels.get_user_memberships(ids["channels"], ids["student"])),
+    ("channel get_member_counts", lambda: channels.get_member_counts(ids["channels"])),
+    ("channel get_user_channels", lambda: channels.get_user_channels(ids["student"])),
+    ("channel search_channels browse", lambda: channels.search_channels(ChannelSearchParams(), ids["student"], include_total=False)),
+    ("message history page", lambda: channels.get_messages(ids["channel"], history)),
+    ("message history cursor", lambda: channels.get_messages_before_cursor(ids["channel"], history, (datetime.utcnow(), uuid.uuid4()))),
+    ("message reactions bulk", lambda: channels.get_reactions_for_messages(ids["messages"])),
+    ("message reactions single", lambda: channels.get_message_reactions(ids["messages"][0])),
+    ("channel pinned messages", lambda: channels.get_pinned_messages(ids["channel"])),
+    ("invites for user", lambda: channels.get_user_invites(ids["student"], "pending")),
+    ("invites for channel", lambda: channels.get_channel_invites(ids["channel"], "pending")),
+    ("invite pending check", lambda: channels.check_existing_invite(ids["channel"], ids["student"])),
+    ("feed interactions", lambda: feeds.get_user_feed_interactions(ids["feed"], ids["student"], "student")),
+    ("feed interactions bulk", lambda: feeds.get_user_feed_interactions_bulk(ids["feeds"], ids["student"], "student")),
+    # FeedService.get_feed_comments
+    ("feed comments", lambda: db.query(FeedComment).filter(FeedComment.feed_id == ids["feed"])
+      .order_by(FeedComment.created_at.desc()).all()),
+    ("professor ratings", lambda: Feedback(db).getFeedback(ids["professor"])),
+  ]
+
+def capture(connection, call) -> list:
+  """Run call and return the (statement, parameters) of every SELECT it issued"""
+  statements = []
+
+  def record(conn, cursor, statement, parameters, context, executemany):
+    if statement.lstrip().upper().startswith("SELECT"):
+      statements.append((statement, parameters))
+
+  event.listen(connection, "before_cursor_execute", record)
+  try:
+    call()
+  finally:
+    event.remove(connection, "before_cursor_execute", record)
+  return statements
+
+def seq_scans(plan: dict) -> list:
+  """Relations read by a Seq Scan anywhere in the plan tree"""
+  found = [plan["Relation Name"]] if plan.get("Node Type") == "Seq Scan" else []
+  for child in plan.get("Plans", []):
+    found.extend(seq_scans(child))
+  return found
+
+def explain(connection, statement: str, parameters) -> dict:
+  cursor = connection.connection.cursor()
+  try:
+    cursor.execute(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+    return cursor.fetchone()[0][0]["Plan"]
+  finally:
+    cursor.close()
+
+def table_sizes(connection) -> dict:
+  rows = connection.execute(text(
+    "SELECT relname, reltuples FROM pg_class WHERE relkind = 'r' AND relnamespace = current_schema()::regnamespace"
+  ))
+  return {name: int(tuples) for name, tuples in rows}
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+  parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"))
+  parser.add_argument("--scale", type=int, default=1)
+  parser.add_argument("--min-rows", type=int, default=1000, help="ignore seq scans of tables smaller than this")
+  parser.add_argument("--verbose", action="store_true", help="print every captured statement and its plan")
+  args = parser.parse_args()
+  if not args.database_url or not args.database_url.startswith("postgresql"):
+    parser.error("a PostgreSQL --database-url (or DATABASE_URL) is required")
+
+  engine = create_engine(args.database_url)
+  schema = f"audit_{uuid.uuid4().hex[:8]}"
+  flagged = []
+
+  with engine.connect() as connection:
+    transaction = connection.begin()
+    try:
+      connection.execute(text(f"CREATE SCHEMA {schema}"))
+      connection.execute(text(f"SET LOCAL search_path TO {schema}, public"))
+      Base.metadata.create_all(connection)
+      db = Session(bind=connection)
+
+      ids = seed(db, args.scale)
+      db.flush()
+      sizes = table_sizes(connection)
+
+      for name, call in query_shapes(db, ids):
+        statements = capture(connection, call)
+        shape_flags = []
+        for statement, parameters in statements:
+          plan = explain(connection, statement, parameters)
+          scans = [relation for relation in seq_scans(plan) if sizes.get(relation, 0) >= args.min_rows]
+          shape_flags.extend(scans)
+          if args.verbose:
+            print(f"-- {name}\n{statement}\n{plan}\n")
+        db.expunge_all()
+
+        status = "SEQ SCAN " + ", ".join(sorted(set(shape_flags))) if shape_flags else "ok"
+        print(f"{name:<34}{len(statements):>3} queries  {status}")
+        if shape_flags:
+          flagged.append(name)
+    finally:
+      transaction.rollback()
+
+  print()
+  if flagged:
+    print(f"{len(flagged)} query shapes fall back to sequential scans: {', '.join(flagged)}")
+    sys.exit(1)
+  print("no sequential scans on seeded tables")
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,131 @@
+"""Login cost per password hashing scheme and parameter set.
+
+For each configuration, hashes a password once, then runs --logins verifies
+from --concurrency simulated clients through a PasswordHasher pool sized like
+production, and reports the single-hash cost, end-to-end login latency
+(queueing included) at p50/p99, sustained logins per second, and the worst
+event loop stall seen meanwhile. Use it to pick BCRYPT_ROUNDS / ARGON2_* for
+the cores a worker actually has.
+
+Configurations are SCHEME:key=value,... e.g.
+  bcrypt:rounds=12
+  argon2:memory=65536,time=3,parallelism=1   (memory in KiB)
+
+Usage:
+  python -m benchmarks.password_hashing [--config CONFIG ...] [--logins N] [--concurrency N]
+                                        [--workers N] [--executor thread|process]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+from app.services.password_hasher import PasswordHasher
+from app.utils.auth import make_password_context
+
+DEFAULT_CONFIGS = [
+  "bcrypt:rounds=10",
+  "bcrypt:rounds=12",
+  "argon2:memory=19456,time=2,parallelism=1",
+  "argon2:memory=65536,time=3,parallelism=1",
+  "argon2:memory=65536,time=2,parallelism=2",
+]
+
+def parse_config(config: str) -> dict:
+  scheme, _, params = config.partition(":")
+  names = {
+    "rounds": "bcrypt_rounds",
+    "memory": "argon2_memory_cost",
+    "time": "argon2_time_cost",
+    "parallelism": "argon2_parallelism"
+  }
+  options = {"scheme": scheme}
+  for pair in filter(None, params.split(",")):
+    key, _, value = pair.partition("=")
+    if key not in names:
+      raise ValueError(f"unknown parameter {key!r} in {config!r}")
+    options[names[key]] = int(value)
+  return options
+
+def percentile(samples: list, p: float) -> float:
+  return samples[min(len(samples) - 1, int(len(samples) * p))]
+
+async def run(config: str, args) -> dict:
+  hasher = PasswordHasher(
+    context=make_password_context(**parse_config(config)),
+    kind=args.executor,
+    workers=args.workers,
+    # Measure queueing, not shedding
+    max_pending=args.concurrency + args.workers,
+    queue_timeout=3600
+  )
+  try:
+    hashed = await hasher.hash("correct horse battery staple")
+    await hasher.verify("correct horse battery staple", hashed)
+
+    latencies = []
+    remaining = args.logins
+    max_lag = 0.0
+    running = True
+
+    async def watch_loop():
+      # How late a 10ms sleep wakes up is how long the loop was blocked
+      nonlocal max_lag
+      while running:
+        start = time.perf_counter()
+        await asyncio.sleep(0.01)
+        max_lag = max(max_lag, time.perf_counter() - start - 0.01)
+
+    async def client():
+      nonlocal remaining
+      while remaining > 0:
+        remaining -= 1
+        start = time.perf_counter()
+        if not await hasher.verify("correct horse battery staple", hashed):
+          raise RuntimeError("verify failed")
+        latencies.append(time.perf_counter() - start)
+
+    watcher = asyncio.ensure_future(watch_loop())
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - start
+    running = False
+    await watcher
+
+    latencies.sort()
+    return {
+      "config": config,
+      "hash_ms": hasher.stats()["avg_hash_ms"],
+      "p50": statistics.median(latencies) * 1000,
+      "p99": percentile(latencies, 0.99) * 1000,
+      "throughput": len(latencies) / elapsed,
+      "max_lag": max_lag * 1000
+    }
+  finally:
+    hasher.shutdown()
+
+async def main_async(args):
+  print(f"{args.workers} {args.executor} workers, {args.concurrency} concurrent clients, {args.logins} logins per config")
+  print()
+  print(f"{'config':<44}{'hash':>9}{'p50':>10}{'p99':>10}{'logins/s':>10}{'loop lag':>10}")
+  for config in args.config or DEFAULT_CONFIGS:
+    result = await run(config, args)
+    print(
+      f"{result['config']:<44}{result['hash_ms']:>7.1f}ms{result['p50']:>8.1f}ms{result['p99']:>8.1f}ms"
+      f"{result['throughput']:>10.1f}{result['max_lag']:>8.1f}ms"
+    )
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+  parser.add_argument("--config", action="append", help="SCHEME:key=value,... (repeatable)")
+  parser.add_argument("--logins", type=int, default=100)
+  parser.add_argument("--concurrency", type=int, default=16)
+  parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+  parser.add_argument("--executor", choices=["thread", "process"], default="thread")
+  args = parser.parse_args()
+  asyncio.run(main_async(args))
+
+if __name__ == "__main__":
+  main()
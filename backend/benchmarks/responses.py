@@ -0,0 +1,134 @@
+"""Serialization time of large REST responses under each response path.
+
+Compares, for a 50-item feed page and a 100-message history page:
+  default  FastAPI's response_model path (validate, dump to dicts) + JSONResponse
+  dicts    the same response_model path rendered by FastJSONResponse (orjson)
+  direct   the validated model returned in a FastJSONResponse (pydantic-core to bytes)
+
+Usage:
+  python -m benchmarks.responses [--iterations N]
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.schemas import FeedListResponse, FeedResponse, MessageListResponse, MessageResponse
+from app.utils.responses import FastJSONResponse
+
+def feed_page(size: int = 50) -> FeedListResponse:
+  now = datetime.utcnow()
+  feeds = [
+    FeedResponse(
+      id=uuid.uuid4(),
+      title=f"Placement drive update #{i}",
+      content="Registrations for the on-campus drive close on Friday. " * 6,
+      feed_type="announcement",
+      priority="high" if i % 5 == 0 else "normal",
+      is_pinned=i == 0,
+      is_public=True,
+      tags=["placements", "cse", "2026"],
+      attachments=[f"/uploads/feeds/{uuid.uuid4()}.pdf"],
+      created_at=now - timedelta(minutes=i),
+      updated_at=now - timedelta(minutes=i),
+      author={"id": uuid.uuid4(), "name": "Dr. Kavya Rao", "email": "kavya.rao@college.edu", "user_type": "professor"},
+      likes_count=120 + i,
+      comments_count=14,
+      shares_count=3,
+      is_liked=i % 2 == 0
+    )
+    for i in range(size)
+  ]
+  return FeedListResponse(feeds=feeds, total=1200, page=1, per_page=size, has_next=True, has_prev=False)
+
+def message_page(size: int = 100) -> MessageListResponse:
+  channel_id = uuid.uuid4()
+  now = datetime.utcnow()
+
+  def message(i: int, reply_to=None) -> MessageResponse:
+    created_at = now - timedelta(seconds=30 * i)
+    return MessageResponse(
+      id=uuid.uuid4(),
+      content=f"Message {i}: are the lab records due before the internals?",
+      message_type="text",
+      reply_to_id=reply_to.id if reply_to else None,
+      file_url=None,
+      file_name=None,
+      file_size=None,
+      is_edited=False,
+      edited_at=None,
+      channel_id=channel_id,
+      sender_id=uuid.uuid4(),
+      sender_name="Aditi Sharma",
+      sender_role="student",
+      created_at=created_at,
+      updated_at=created_at,
+      reactions=[
+        {"id": uuid.uuid4(), "emoji": "👍", "user_id": uuid.uuid4(), "user_role": "student", "created_at": created_at}
+        for _ in range(i % 3)
+      ],
+      reply_to=reply_to
+    )
+
+  messages = []
+  for i in range(size):
+    messages.append(message(i, reply_to=messages[-1] if i % 4 == 3 else None))
+  return MessageListResponse(
+    messages=messages, total=None, page=1, per_page=size, has_next=True, has_prev=False, next_cursor="eyJhIjoiYiJ9"
+  )
+
+async def time_per_call(func, iterations: int) -> float:
+  """Microseconds per call; func may be a coroutine function."""
+  start = time.perf_counter()
+  for _ in range(iterations):
+    result = func()
+    if asyncio.iscoroutine(result):
+      await result
+  return (time.perf_counter() - start) / iterations * 1e6
+
+async def run(iterations: int) -> list:
+  rows = []
+  for name, page in (("feeds_50", feed_page()), ("messages_100", message_page())):
+    field = create_model_field(name=f"Response_{name}", type_=type(page), mode="serialization")
+
+    async def default():
+      return JSONResponse(await serialize_response(field=field, response_content=page)).body
+
+    async def dicts():
+      return FastJSONResponse(await serialize_response(field=field, response_content=page)).body
+
+    def direct():
+      return FastJSONResponse(page).body
+
+    for path, func in (("default", default), ("dicts", dicts), ("direct", direct)):
+      body = func()
+      if asyncio.iscoroutine(body):
+        body = await body
+      rows.append({
+        "page": name,
+        "path": path,
+        "bytes": len(body),
+        "us": round(await time_per_call(func, iterations), 1)
+      })
+  return rows
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+  parser.add_argument("--iterations", type=int, default=500)
+  args = parser.parse_args()
+
+  rows = asyncio.run(run(args.iterations))
+  baseline = {row["page"]: row["us"] for row in rows if row["path"] == "default"}
+  print(f"{'page':<14}{'path':<10}{'bytes':>8}{'us':>10}{'speedup':>9}")
+  for row in rows:
+    speedup = baseline[row["page"]] / row["us"] if row["us"] else 0.0
+    print(f"{row['page']:<14}{row['path']:<10}{row['bytes']:>8}{row['us']:>10}{speedup:>8.1f}x")
+
+if __name__ == "__main__":
+  main()
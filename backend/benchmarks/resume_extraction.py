@@ -0,0 +1,159 @@
+"""Resume text extraction time on synthetic multi-page documents.
+
+Builds a PDF of --pages pages (--lines lines of text each) and a Word document
+with the same text, then extracts each one --repeat times in three ways:
+
+  inline   the old path: one PdfReader over the whole upload in memory,
+           text built up with +=
+  thread   ResumeExtractor on a thread pool
+  process  ResumeExtractor on a process pool (the default in production)
+
+and reports the median time per document and pages per second. Page caps are
+lifted so every variant reads the whole document; use --max-pages to see the
+effect of the production cap instead.
+
+Usage:
+  python -m benchmarks.resume_extraction [--pages N ...] [--lines N] [--repeat N]
+                                         [--workers N] [--pages-per-task N] [--max-pages N]
+"""
+
+import argparse
+import asyncio
+import io
+import os
+import statistics
+import tempfile
+import time
+
+from docx import Document
+import PyPDF2
+
+from app.services.resume_extraction import ResumeExtractor
+
+WORDS = (
+  "led designed built shipped migrated reduced latency improved throughput python fastapi postgres "
+  "kubernetes team of five customers revenue analytics pipeline students campus research published"
+).split()
+
+def line_text(page: int, line: int) -> str:
+  return " ".join(WORDS[(page * 7 + line * 3 + i) % len(WORDS)] for i in range(12))
+
+def make_pdf(pages: int, lines: int) -> bytes:
+  """A plain PDF with one Helvetica text block per page"""
+  objects = [
+    b"<< /Type /Catalog /Pages 2 0 R >>",
+    None,  # page tree, once the page object numbers are known
+    b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+  ]
+  kids = []
+  for page in range(pages):
+    body = "BT /F1 10 Tf 12 TL 50 760 Td " + " ".join(f"({line_text(page, line)}) Tj T*" for line in range(lines)) + " ET"
+    content = body.encode("latin-1")
+    objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content))
+    objects.append(
+      b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+      b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects)
+    )
+    kids.append(b"%d 0 R" % len(objects))
+  objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), pages)
+
+  out = io.BytesIO()
+  out.write(b"%PDF-1.4\n")
+  offsets = []
+  for number, body in enumerate(objects, start=1):
+    offsets.append(out.tell())
+    out.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+  xref = out.tell()
+  out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+  for offset in offsets:
+    out.write(b"%010d 00000 n \n" % offset)
+  out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+  return out.getvalue()
+
+def make_docx(pages: int, lines: int) -> bytes:
+  document = Document()
+  for page in range(pages):
+    for line in range(lines):
+      document.add_paragraph(line_text(page, line))
+  out = io.BytesIO()
+  document.save(out)
+  return out.getvalue()
+
+def inline_pdf(data: bytes) -> str:
+  text = ""
+  for page in PyPDF2.PdfReader(io.BytesIO(data)).pages:
+    text += page.extract_text() + "\n"
+  return text
+
+def inline_docx(data: bytes) -> str:
+  text = ""
+  for para in Document(io.BytesIO(data)).paragraphs:
+    text += para.text + "\n"
+  return text
+
+async def time_runs(repeat: int, extract) -> tuple:
+  samples = []
+  text = ""
+  for _ in range(repeat):
+    start = time.perf_counter()
+    text = await extract()
+    samples.append(time.perf_counter() - start)
+  return statistics.median(samples) * 1000, len(text)
+
+async def run(pages: int, args) -> list:
+  pdf = make_pdf(pages, args.lines)
+  docx = make_docx(pages, args.lines)
+  rows = []
+  with tempfile.TemporaryDirectory() as spool:
+    paths = {}
+    for name, data in (("pdf", pdf), ("docx", docx)):
+      paths[name] = os.path.join(spool, f"resume.{name}")
+      with open(paths[name], "wb") as f:
+        f.write(data)
+
+    content_types = {"pdf": "application/pdf", "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document"}
+    for name, data, inline in (("pdf", pdf, inline_pdf), ("docx", docx, inline_docx)):
+      ms, chars = await time_runs(args.repeat, lambda: asyncio.to_thread(inline, data))
+      rows.append((name, pages, len(data), "inline", ms, chars))
+
+    for kind in ("thread", "process"):
+      extractor = ResumeExtractor(
+        kind=kind,
+        workers=args.workers,
+        pages_per_task=args.pages_per_task,
+        max_pages=args.max_pages or pages,
+        max_chars=1 << 40,
+        timeout=3600
+      )
+      try:
+        # Start the pool outside the timings
+        await extractor.extract(paths["docx"], content_types["docx"])
+        for name in ("pdf", "docx"):
+          ms, chars = await time_runs(args.repeat, lambda: extractor.extract(paths[name], content_types[name]))
+          rows.append((name, pages, os.path.getsize(paths[name]), kind, ms, chars))
+      finally:
+        extractor.shutdown()
+  return rows
+
+async def main_async(args):
+  print(f"{args.workers} workers, {args.pages_per_task} pages per task, {args.lines} lines per page, median of {args.repeat}")
+  print()
+  print(f"{'doc':<6}{'pages':>6}{'size':>10}{'variant':>9}{'time':>11}{'pages/s':>10}{'chars':>10}")
+  for pages in args.pages:
+    for name, count, size, variant, ms, chars in await run(pages, args):
+      print(f"{name:<6}{count:>6}{size / 1024:>8.0f}KB{variant:>9}{ms:>9.1f}ms{count / ms * 1000:>10.0f}{chars:>10}")
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+  parser.add_argument("--pages", type=int, action="append", help="pages per document (repeatable, default 5 40 200)")
+  parser.add_argument("--lines", type=int, default=50)
+  parser.add_argument("--repeat", type=int, default=5)
+  parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+  parser.add_argument("--pages-per-task", type=int, default=8)
+  parser.add_argument("--max-pages", type=int, default=0, help="page cap, 0 for none")
+  args = parser.parse_args()
+  args.pages = args.pages or [5, 40, 200]
+  asyncio.run(main_async(args))
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,134 @@
+"""Compare the JSON and compact MessagePack WebSocket protocols.
+
+Reports bytes on the wire (raw and with permessage-deflate, with and without
+context takeover) and encode CPU time for new_message, typing_users and
+reaction events.
+
+Usage:
+  python -m benchmarks.ws_protocol [--iterations N]
+"""
+
+import argparse
+import time
+import uuid
+import zlib
+from datetime import datetime, timedelta
+
+from app.schemas import MessageEvent, MessageResponse, TypingUser, TypingUsersEvent
+from app.websocket.protocol import Frame
+
+def sample_events() -> dict:
+  """Representative payloads for the three hottest event types."""
+  channel_id = uuid.uuid4()
+  now = datetime.utcnow()
+
+  def message(content: str, reply_to=None) -> MessageResponse:
+    return MessageResponse(
+      id=uuid.uuid4(),
+      content=content,
+      message_type="text",
+      reply_to_id=reply_to.id if reply_to else None,
+      file_url=None,
+      file_name=None,
+      file_size=None,
+      is_edited=False,
+      edited_at=None,
+      channel_id=channel_id,
+      sender_id=uuid.uuid4(),
+      sender_name="Aditi Sharma",
+      sender_role="student",
+      created_at=now,
+      updated_at=now,
+      reactions=[
+        {"id": str(uuid.uuid4()), "emoji": "👍", "user_id": str(uuid.uuid4()), "user_role": "student", "created_at": now.isoformat()}
+        for _ in range(2)
+      ],
+      reply_to=reply_to
+    )
+
+  original = message("Is the DBMS lab moved to Friday?")
+  return {
+    "new_message": MessageEvent(
+      message=message("Yes, 2pm in lab 3. Bring your ER diagrams.", reply_to=original),
+      channel_id=channel_id
+    ),
+    "typing_users": TypingUsersEvent(
+      channel_id=channel_id,
+      users=[TypingUser(user_id=uuid.uuid4(), user_name=name) for name in ("Aditi Sharma", "Rahul K", "Meera N")]
+    ),
+    "reaction": {
+      "message_id": str(uuid.uuid4()),
+      "user_id": str(uuid.uuid4()),
+      "user_name": "Rahul K",
+      "emoji": "🎉",
+      "action": "add",
+      "reaction": {
+        "id": uuid.uuid4(),
+        "message_id": uuid.uuid4(),
+        "user_id": uuid.uuid4(),
+        "user_role": "student",
+        "emoji": "🎉",
+        "created_at": now - timedelta(seconds=3)
+      }
+    }
+  }
+
+def deflate_size(payload: bytes) -> int:
+  """Size of one message under permessage-deflate without context takeover."""
+  compressor = zlib.compressobj(wbits=-15)
+  return len(compressor.compress(payload) + compressor.flush(zlib.Z_SYNC_FLUSH)) - 4
+
+def deflate_stream_size(payloads: list) -> float:
+  """Average message size under permessage-deflate with context takeover."""
+  compressor = zlib.compressobj(wbits=-15)
+  total = sum(len(compressor.compress(payload) + compressor.flush(zlib.Z_SYNC_FLUSH)) - 4 for payload in payloads)
+  return total / len(payloads)
+
+def time_per_call(func, iterations: int) -> float:
+  """Microseconds per call."""
+  start = time.perf_counter()
+  for _ in range(iterations):
+    func()
+  return (time.perf_counter() - start) / iterations * 1e6
+
+def encode(frame: Frame, protocol: str) -> bytes:
+  return frame.json.encode() if protocol == "json" else frame.compact
+
+def run(iterations: int, stream_length: int = 50) -> list:
+  rows = []
+  # A stream of distinct events (fresh ids each time) for the context takeover column
+  streams = [sample_events() for _ in range(stream_length)]
+  for event_type, data in sample_events().items():
+    frame = Frame.build(event_type, data)
+    stream = [Frame.build(event_type, events[event_type]) for events in streams]
+    for name in ("json", "msgpack"):
+      payload = encode(frame, name)
+      rows.append({
+        "event": event_type,
+        "protocol": name,
+        "bytes": len(payload),
+        "deflate": deflate_size(payload),
+        "deflate_ctx": round(deflate_stream_size([encode(item, name) for item in stream]), 1),
+        "encode_us": round(time_per_call(lambda: encode(Frame(frame.event), name), iterations), 2),
+        "build_us": round(time_per_call(lambda: Frame.build(event_type, data), iterations // 4 or 1), 2)
+      })
+  return rows
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+  parser.add_argument("--iterations", type=int, default=20000)
+  args = parser.parse_args()
+
+  rows = run(args.iterations)
+  print(f"{'event':<14}{'protocol':<10}{'bytes':>7}{'deflate':>9}{'deflate_ctx':>13}{'encode_us':>11}{'build_us':>10}")
+  for row in rows:
+    print(
+      f"{row['event']:<14}{row['protocol']:<10}{row['bytes']:>7}{row['deflate']:>9}"
+      f"{row['deflate_ctx']:>13}{row['encode_us']:>11}{row['build_us']:>10}"
+    )
+  print()
+  print("build_us is the shared jsonable conversion done once per broadcast for both protocols;")
+  print("encode_us is the per-protocol serialization, also done once per broadcast.")
+
+if __name__ == "__main__":
+  main()
@@ -80,7 +80,7 @@ export default function ProfessorFeedPage() {
       const params: any = {
         page,
         per_page: 10,
-        sort_by: "created_at",
+        sort_by: searchTerm ? "relevance" : "created_at",
         sort_order: "desc"
       }
 
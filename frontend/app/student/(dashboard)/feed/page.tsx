@@ -81,7 +81,7 @@ export default function StudentFeedPage() {
       const params: any = {
         page,
         per_page: 10,
-        sort_by: "created_at",
+        sort_by: searchTerm ? "relevance" : "created_at",
         sort_order: "desc"
       }
 
@@ -16,6 +16,30 @@ interface Analysis {
   suggestions: string;
 }
 
+interface ResumeJob {
+  job_id: string;
+  status: "queued" | "running" | "completed" | "failed";
+  analysis: Analysis | null;
+  error: string | null;
+}
+
+const POLL_INTERVAL_MS = 2000
+const MAX_POLLS = 90
+
+// Analysis runs as a background job on the server; wait for it to finish
+const waitForResumeJob = async (jobId: string): Promise<ResumeJob> => {
+  for (let attempt = 0; attempt < MAX_POLLS; attempt++) {
+    await new Promise((resolve) => setTimeout(resolve, POLL_INTERVAL_MS))
+    const { data } = await axios.get<ResumeJob>(`http://localhost:8000/student/analyze-resume/${jobId}`, {
+      withCredentials: true,
+    })
+    if (data.status === "completed" || data.status === "failed") {
+      return data
+    }
+  }
+  throw new Error("Resume analysis is taking longer than expected. Please try again later.")
+}
+
 export default function ResumeAnalyzerPage() {
   const [selectedFile, setSelectedFile] = useState<File | null>(null)
   const [analysis, setAnalysis] = useState<Analysis | null>(null)
@@ -37,12 +61,18 @@ export default function ResumeAnalyzerPage() {
     formData.append("file", selectedFile)
 
     try {
-      const response = await axios.post("http://localhost:8000/student/analyze-resume", formData, {
+      const response = await axios.post<ResumeJob>("http://localhost:8000/student/analyze-resume", formData, {
         headers: {
           "Content-Type": "multipart/form-data",
         },
+        withCredentials: true,
       })
-      setAnalysis(response.data.analysis)
+      const job = await waitForResumeJob(response.data.job_id)
+      if (job.status === "completed" && job.analysis) {
+        setAnalysis(job.analysis)
+      } else {
+        showSuccessToast(job.error || "Something went wrong. Please try again.")
+      }
     } catch (error: any) {
         const defaultMessage = "Something went wrong. Please try again.";
 
@@ -56,7 +86,7 @@ export default function ResumeAnalyzerPage() {
             showSuccessToast(message || defaultMessage);
           }
         } else {
-          showSuccessToast(defaultMessage);
+          showSuccessToast(error?.message || defaultMessage);
         }
       }
     finally {
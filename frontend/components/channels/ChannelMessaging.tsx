@@ -247,15 +247,14 @@ export default function ChannelMessaging({ channel, onClose }: ChannelMessagingP
           case "new_message":
             setMessages(prev => [...prev, data.data.message]);
             break;
-          case "typing":
-            if (data.data.user_id !== user?.id) {
-              setTypingUsers(prev => {
-                if (data.data.is_typing) {
-                  return [...prev.filter(id => id !== data.data.user_id), data.data.user_id];
-                } else {
-                  return prev.filter(id => id !== data.data.user_id);
-                }
-              });
+          case "typing_users":
+            // Everyone currently typing in the channel, sent whenever the set changes
+            if (data.data.channel_id === channel.id) {
+              setTypingUsers(
+                data.data.users
+                  .map((typist: { user_id: string }) => typist.user_id)
+                  .filter((id: string) => id !== user?.id)
+              );
             }
             break;
           case "user_joined":
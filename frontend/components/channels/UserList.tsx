@@ -32,60 +32,61 @@ interface UserListProps {
   currentUserRole: "MEMBER" | "MODERATOR" | "ADMIN" | "OWNER";
 }
 
+interface UserPage {
+  users: User[];
+  next_cursor: string | null;
+  has_next: boolean;
+}
+
+const PAGE_SIZE = 30;
+
 export default function UserList({ onInviteUser, channelId, currentUserRole }: UserListProps) {
   const [users, setUsers] = useState<User[]>([]);
-  const [filteredUsers, setFilteredUsers] = useState<User[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [searchQuery, setSearchQuery] = useState("");
   const [roleFilter, setRoleFilter] = useState("all");
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
 
+  // Search runs on the server; wait for typing to pause before querying
   useEffect(() => {
-    fetchUsers();
-  }, []);
+    const timer = setTimeout(() => {
+      fetchUsers(null);
+    }, 250);
+    return () => clearTimeout(timer);
+  }, [searchQuery, roleFilter]);
 
-  useEffect(() => {
-    filterUsers();
-  }, [users, searchQuery, roleFilter]);
-
-  const fetchUsers = async () => {
+  const fetchUsers = async (cursor: string | null) => {
     try {
       const token = localStorage.getItem("token");
-      const response = await fetch("http://localhost:8000/users/all", {
+      const params = new URLSearchParams({ per_page: String(PAGE_SIZE) });
+      if (searchQuery.trim()) params.set("q", searchQuery.trim());
+      if (roleFilter !== "all") params.set("role", roleFilter);
+      if (cursor) params.set("cursor", cursor);
+
+      const response = await fetch(`http://localhost:8000/users/all?${params}`, {
         headers: {
           Authorization: `Bearer ${token}`,
         },
       });
 
       if (response.ok) {
-        const data = await response.json();
-        setUsers(data);
+        const data: UserPage = await response.json();
+        setUsers((previous) => (cursor ? [...previous, ...data.users] : data.users));
+        setNextCursor(data.has_next ? data.next_cursor : null);
       }
     } catch (error) {
       console.error("Error fetching users:", error);
     } finally {
       setLoading(false);
+      setLoadingMore(false);
     }
   };
 
-  const filterUsers = () => {
-    let filtered = users;
-
-    // Filter by search query
-    if (searchQuery) {
-      filtered = filtered.filter(
-        (user) =>
-          user.name.toLowerCase().includes(searchQuery.toLowerCase()) ||
-          user.email?.toLowerCase().includes(searchQuery.toLowerCase()) ||
-          user.usn?.toLowerCase().includes(searchQuery.toLowerCase())
-      );
-    }
-
-    // Filter by role
-    if (roleFilter !== "all") {
-      filtered = filtered.filter((user) => user.role === roleFilter);
-    }
-
-    setFilteredUsers(filtered);
+  const loadMore = () => {
+    if (!nextCursor || loadingMore) return;
+    setLoadingMore(true);
+    fetchUsers(nextCursor);
   };
 
   const handleInviteUser = (user: User) => {
@@ -129,7 +130,7 @@ export default function UserList({ onInviteUser, channelId, currentUserRole }: U
           <div className="relative">
             <Search className="absolute left-3 top-1/2 transform -translate-y-1/2 text-gray-400 h-4 w-4" />
             <Input
-              placeholder="Search users by name, email, or USN..."
+              placeholder="Search users by name, email, or USN prefix..."
               value={searchQuery}
               onChange={(e) => setSearchQuery(e.target.value)}
               className="pl-10"
@@ -152,12 +153,12 @@ export default function UserList({ onInviteUser, channelId, currentUserRole }: U
 
         {/* Users List */}
         <div className="space-y-2 max-h-96 overflow-y-auto">
-          {filteredUsers.length === 0 ? (
+          {users.length === 0 ? (
             <div className="text-center py-8 text-gray-500">
               No users found matching your criteria
             </div>
           ) : (
-            filteredUsers.map((user) => (
+            users.map((user) => (
               <div
                 key={user.id}
                 className="flex items-center justify-between p-3 border rounded-lg hover:bg-gray-50"
@@ -204,13 +205,17 @@ export default function UserList({ onInviteUser, channelId, currentUserRole }: U
               </div>
             ))
           )}
+          {nextCursor && (
+            <Button variant="ghost" className="w-full" onClick={loadMore} disabled={loadingMore}>
+              {loadingMore ? "Loading..." : "Load more"}
+            </Button>
+          )}
         </div>
 
         {/* Stats */}
         <div className="pt-3 border-t">
           <div className="flex justify-between text-sm text-gray-600">
-            <span>Total Users: {users.length}</span>
-            <span>Showing: {filteredUsers.length}</span>
+            <span>Showing: {users.length}{nextCursor ? "+" : ""}</span>
           </div>
         </div>
       </CardContent>
@@ -27,6 +27,7 @@ export function SignupForm({ className, userType, ...props }: SignupFormProps) {
   const [email, setEmail] = useState<string>("")
   const [password, setPassword] = useState<string>("")
   const [usn, setUsn] = useState<string>("")
+  const [department, setDepartment] = useState<string>("")
   const [loading, setLoading] = useState<boolean>(false)
 
   const handleSignup = async (e: React.FormEvent) =>{
@@ -37,7 +38,8 @@ export function SignupForm({ className, userType, ...props }: SignupFormProps) {
 
       const endpoint = userType == "student" ? `${process.env.NEXT_PUBLIC_BACKEND_URL}/student/signup` : `${process.env.NEXT_PUBLIC_BACKEND_URL}/professor/signup`
 
-      const payload = userType == "student" ? {name, email, usn, password} : {name, email, password}
+      // Students' department comes from the branch code in their USN
+      const payload = userType == "student" ? {name, email, usn, password} : {name, email, password, department: department || null}
 
       const response = await axios.post(endpoint, payload)
 
@@ -110,6 +112,21 @@ export function SignupForm({ className, userType, ...props }: SignupFormProps) {
                 </div>
               )}
 
+              {/* Department - only for professors */}
+              {userType === "professor" && (
+                <div className="grid gap-3">
+                  <Label htmlFor="department" className="text-sm font-medium text-foreground">Department code</Label>
+                  <Input
+                    id="department"
+                    type="text"
+                    placeholder="IS"
+                    maxLength={100}
+                    className="border-input"
+                    onChange={(e) => setDepartment(e.target.value)}
+                  />
+                </div>
+              )}
+
               {/* Password - common */}
               <div className="grid gap-3">
                 <Label htmlFor="password" className="text-sm font-medium text-foreground">Password</Label>